@@ -18,12 +18,20 @@ __version__ = "1.0.0"
 
 # __all__
 
+from .autocomplete import *
+from .catalog import *
 from .client import *
+from .crawler import *
 from .error import *
+from .frames import *
+from .pagination import *
+from .stats import *
 from .models.anime import *
 from .models.character import *
 from .models.core import *
 from .models.enums import *
 from .models.images import *
 from .models.manga import *
+from .models.numbered import *
+from .models.serializable import *
 from .models.users import *
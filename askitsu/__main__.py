@@ -0,0 +1,127 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present ShomyKohai
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import List, Optional
+
+from .client import Client
+from .crawler import Crawler, JSONLinesSink, Sink, SQLiteSink, parse_since
+from .error import InvalidArgument
+from .models.enums import Entries
+
+
+def _sink(path: str) -> Sink:
+    if os.path.splitext(path)[1] in (".db", ".sqlite", ".sqlite3"):
+        return SQLiteSink(path)
+    return JSONLinesSink(path)
+
+
+async def crawl(args: argparse.Namespace) -> None:
+    start_id, end_id = 1, None
+    if args.ids:
+        first, _, last = args.ids.partition(":")
+        start_id = int(first or 1)
+        end_id = int(last) if last else None
+    mode = "ids" if args.ids else "cursor"
+    if args.command == "sync":
+        mode = "sync"
+    client = Client(args.token, rate_limit=args.rate)
+    try:
+        with _sink(args.output) as sink:
+            crawler = Crawler(
+                client,
+                Entries(args.type),
+                sink,
+                checkpoint=args.checkpoint or f"{args.output}.checkpoint",
+                mode=mode,
+                per_page=args.per_page,
+                concurrency=args.concurrency,
+                start_id=start_id,
+                end_id=end_id,
+                since=args.since,
+            )
+            progress = await crawler.run()
+        logging.getLogger("askitsu.crawler").info(f"Done, {progress}")
+    finally:
+        await client.close()
+
+
+def _since(value: str) -> datetime:
+    try:
+        return parse_since(value)
+    except InvalidArgument as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m askitsu")
+    commands = parser.add_subparsers(dest="command", required=True)
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("type", choices=("anime", "manga"))
+    common.add_argument(
+        "output", help="JSON lines file, or SQLite database (.db, .sqlite)"
+    )
+    common.add_argument(
+        "--checkpoint", help="Checkpoint file. Defaults to OUTPUT.checkpoint"
+    )
+    common.add_argument("--per-page", type=int, default=100)
+    common.add_argument("--rate", type=float, help="Maximum requests per second")
+    common.add_argument("--token", default=os.environ.get("KITSU_TOKEN"))
+    crawler = commands.add_parser(
+        "crawl", parents=[common], help="Mirror the anime or manga catalog to a file"
+    )
+    crawler.add_argument(
+        "--ids",
+        metavar="START:END",
+        help="Fetch an id range instead of walking the catalog, END is optional",
+    )
+    crawler.add_argument("--concurrency", type=int, default=4)
+    sync = commands.add_parser(
+        "sync", parents=[common], help="Fetch the entries updated since the last run"
+    )
+    sync.add_argument(
+        "--since",
+        metavar="DATE",
+        type=_since,
+        help="ISO 8601 calendar date, optionally with a time, fraction and offset "
+        "(UTC unless it has one), e.g. 2024-01-01 or 20240101T12:00:00.5+0200. "
+        "Defaults to the latest updatedAt already in OUTPUT",
+    )
+    sync.set_defaults(ids=None, concurrency=4)
+    crawler.set_defaults(since=None)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    logging.getLogger("askitsu.crawler").setLevel(logging.INFO)
+    try:
+        asyncio.run(crawl(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present ShomyKohai
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+from bisect import bisect_left, bisect_right
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+    Union,
+)
+
+from .models.core import Entry
+from .utils import normalize
+
+if TYPE_CHECKING:
+    from .catalog import Catalog
+    from .client import Client
+    from .models.anime import Anime
+    from .models.manga import Manga
+
+__all__ = ("Suggestion", "TitleIndex")
+
+Key = Tuple[str, int]
+_SHIFT = 24
+_HANDLE = (1 << _SHIFT) - 1
+_UNRANKED = (1 << 31) - 1
+# Prefixes up to this long match too many keys to scan, their results are kept
+_SHORT = 3
+
+
+def _node_titles(node: dict) -> Tuple[Optional[str], ...]:
+    titles = node.get("titles") or {}
+    localized = titles.get("localized") or {}
+    return (
+        titles.get("canonical"),
+        localized.get("en_us"),
+        localized.get("en_jp"),
+        localized.get("ja_jp"),
+    )
+
+
+class Suggestion(NamedTuple):
+    """
+    A completion returned by :meth:`TitleIndex.complete`
+
+    .. versionadded:: 1.1.0
+    """
+
+    title: str
+    id: int
+    entry_type: str
+    popularity_rank: Optional[int]
+
+
+class TitleIndex:
+    """
+    In-memory autocomplete over the titles of anime and manga,
+    most popular entries first.
+
+    Titles are normalised with :func:`askitsu.utils.normalize`, and every
+    word of a title can start a match, so ``"shipp"`` finds
+    *Naruto Shippuden*. Completions for up to three characters are
+    precomputed, and recomputed on first use after an update.
+
+    .. versionadded:: 1.1.0
+
+    Example
+    ---------
+    .. code-block:: python3
+
+        index = askitsu.TitleIndex.from_catalog(catalog)
+        index.attach(client)  # Index every entry the client caches
+
+        @anime.autocomplete("query")
+        async def complete(interaction, current: str):
+            return [
+                app_commands.Choice(name=item.title, value=str(item.id))
+                for item in index.complete(current, type="anime")
+            ]
+
+    Parameters
+    -----------
+    top: :class:`int`
+        How many completions are precomputed for short prefixes.
+        Defaults to 25, the most Discord shows.
+    """
+
+    def __init__(self, top: int = 25) -> None:
+        self.top = top
+        # Sorted search keys, and the code of the entry each one belongs to.
+        # A code packs the popularity rank over the entry handle, so the
+        # most popular entries are simply the smallest codes.
+        self._keys: List[str] = []
+        self._codes: List[int] = []
+        self._handles: Dict[Key, int] = {}
+        self._owners: List[Key] = []
+        self._entries: Dict[Key, Tuple[List[str], int, str]] = {}
+        self._short: Dict[Tuple[Optional[str], str], List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _search_keys(titles: Iterable[Optional[str]]) -> List[str]:
+        keys = set()
+        for title in titles:
+            if not title:
+                continue
+            words = normalize(title).split(" ")
+            keys.update(" ".join(words[n:]) for n in range(len(words)))
+        keys.discard("")
+        return sorted(keys)
+
+    def _code(self, owner: Key, rank: Optional[int]) -> int:
+        handle = self._handles.get(owner)
+        if handle is None:
+            handle = self._handles[owner] = len(self._owners)
+            self._owners.append(owner)
+        rank = _UNRANKED if rank is None else min(rank, _UNRANKED)
+        return rank << _SHIFT | handle
+
+    def _remove(self, owner: Key) -> None:
+        keys, code, _ = self._entries.pop(owner)
+        for key in keys:
+            start = bisect_left(self._keys, key)
+            end = bisect_right(self._keys, key, start)
+            position = self._codes.index(code, start, end)
+            del self._keys[position], self._codes[position]
+        self._forget_short(keys)
+
+    def _forget_short(self, keys: List[str]) -> None:
+        for key in keys:
+            for length in range(1, _SHORT + 1):
+                for type in (None, "anime", "manga"):
+                    self._short.pop((type, key[:length]), None)
+
+    def _insert(
+        self,
+        entry_type: str,
+        id: int,
+        titles: Iterable[Optional[str]],
+        title: Optional[str],
+        rank: Optional[int],
+    ) -> None:
+        owner = (entry_type, int(id))
+        keys = self._search_keys(titles)
+        if owner in self._entries:
+            self._remove(owner)
+        if not keys:
+            return
+        code = self._code(owner, rank)
+        self._entries[owner] = (keys, code, title or keys[0])
+        for key in keys:
+            position = bisect_right(self._keys, key)
+            self._keys.insert(position, key)
+            self._codes.insert(position, code)
+        self._forget_short(keys)
+
+    def add(self, entry: Union[Anime, Manga]) -> None:
+        """Index an entry, or update it if it's already there"""
+        title = getattr(entry, "_titles", None) or {}
+        canonical = getattr(entry, "canonical_title", None)
+        self._insert(
+            entry.entry_type,
+            entry.id,
+            (canonical, title.get("en_us"), title.get("en_jp"), title.get("ja_jp")),
+            canonical,
+            getattr(entry, "popularity_rank", None),
+        )
+
+    def add_node(self, entry_type: str, node: dict) -> None:
+        """Index a raw node, as returned by the API"""
+        titles = _node_titles(node)
+        self._insert(
+            entry_type, node["id"], titles, titles[0], node.get("userCountRank")
+        )
+
+    def update(self, entries: Iterable[Union[Anime, Manga]]) -> None:
+        """Index many entries at once"""
+        for entry in entries:
+            self.add(entry)
+
+    def discard(self, entry_type: str, id: int) -> None:
+        """Remove an entry from the index"""
+        owner = (entry_type, int(id))
+        if owner in self._entries:
+            self._remove(owner)
+
+    @classmethod
+    def from_catalog(cls, catalog: Catalog, top: int = 25) -> TitleIndex:
+        """Build an index of every entry stored in a :class:`Catalog`"""
+        index = cls(top)
+        rows: List[Tuple[str, int]] = []
+        for entry_type, data in catalog._db.execute(
+            f"SELECT type, data FROM {catalog.table}"
+        ):
+            node = json.loads(data)
+            titles = _node_titles(node)
+            keys = cls._search_keys(titles)
+            if not keys:
+                continue
+            owner = (entry_type, int(node["id"]))
+            code = index._code(owner, node.get("userCountRank"))
+            index._entries[owner] = (keys, code, titles[0] or keys[0])
+            rows.extend((key, code) for key in keys)
+        # Sorting once is much faster than inserting one key at a time
+        rows.sort()
+        index._keys = [key for key, _ in rows]
+        index._codes = [code for _, code in rows]
+        lengths = range(1, _SHORT + 1)
+        for prefix in {key[:length] for key in index._keys for length in lengths}:
+            index._short[(None, prefix)] = index._match(None, prefix, top)
+        return index
+
+    def attach(self, client: Client) -> None:
+        """Index every anime and manga the client caches from now on"""
+        client.http._cache.subscribe(self._on_cache)
+
+    def detach(self, client: Client) -> None:
+        client.http._cache.unsubscribe(self._on_cache)
+
+    def _on_cache(self, name: str, value: Any) -> None:
+        for entry in value if isinstance(value, list) else (value,):
+            if isinstance(entry, Entry) and getattr(entry, "_titles", None):
+                self.add(entry)  # type: ignore
+
+    def _match(self, type: Optional[str], prefix: str, limit: int) -> List[int]:
+        start = bisect_left(self._keys, prefix)
+        # Every key starting with the prefix sorts before prefix + U+10FFFF
+        end = bisect_left(self._keys, prefix + "\U0010ffff", start)
+        # The set drops entries matched by more than one of their titles
+        codes = set(self._codes[start:end])
+        if type is None:
+            return heapq.nsmallest(limit, codes)
+        owners = self._owners
+        return heapq.nsmallest(
+            limit, (code for code in codes if owners[code & _HANDLE][0] == type)
+        )
+
+    def complete(
+        self, prefix: str, limit: int = 25, *, type: Optional[str] = None
+    ) -> List[Suggestion]:
+        """
+        The most popular entries with a title, or a word of a title,
+        starting with `prefix`
+
+        Parameters
+        -----------
+        prefix: :class:`str`
+            What the user typed so far
+        limit: :class:`int`
+            Maximum number of suggestions
+        type: Optional[:class:`str`]
+            Only suggest ``anime`` or ``manga``
+        """
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        if len(prefix) <= _SHORT and limit <= self.top:
+            codes = self._short.get((type, prefix))
+            if codes is None:
+                codes = self._short[(type, prefix)] = self._match(
+                    type, prefix, self.top
+                )
+            codes = codes[:limit]
+        else:
+            codes = self._match(type, prefix, limit)
+        suggestions = []
+        for code in codes:
+            entry_type, id = owner = self._owners[code & _HANDLE]
+            rank = code >> _SHIFT
+            suggestions.append(
+                Suggestion(
+                    self._entries[owner][2],
+                    id,
+                    entry_type,
+                    None if rank == _UNRANKED else rank,
+                )
+            )
+        return suggestions
@@ -26,7 +26,7 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 
 class CacheResult:
@@ -47,6 +47,7 @@ class Cache:
     def __init__(self, expiration: Optional[int] = None) -> None:
         self.expiration = expiration or 0
         self.__cache: Dict[str, Any] = {}
+        self.__listeners: List[Callable[[str, Any], None]] = []
 
     async def __remove_after(self, name: str, seconds: int) -> None:
         await asyncio.sleep(seconds)
@@ -60,6 +61,16 @@ class Cache:
     def to_dict(self) -> Dict[str, Any]:
         return self.__cache
 
+    def subscribe(self, listener: Callable[[str, Any], None]) -> None:
+        """Call `listener` with the key and the value of everything added from now on"""
+        self.__listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[str, Any], None]) -> None:
+        try:
+            self.__listeners.remove(listener)
+        except ValueError:
+            pass
+
     async def get(self, name: str) -> Optional[CacheResult]:
         try:
             value = self.__cache[str(name)]
@@ -73,6 +84,8 @@ class Cache:
         if name in self.__cache:
             return await self.get(name)  # type: ignore
         self.__cache[name] = value
+        for listener in self.__listeners:
+            listener(name, value)
         if remove_after and remove_after > 0:
             asyncio.create_task(self.__remove_after(name, remove_after))
         return CacheResult(name, value)
@@ -83,5 +96,12 @@ class Cache:
         except KeyError:
             pass
 
+    async def remove_prefix(self, prefix: str) -> int:
+        """Remove every key starting with `prefix`, returning how many were removed"""
+        keys = [name for name in self.__cache if name.startswith(prefix)]
+        for name in keys:
+            del self.__cache[name]
+        return len(keys)
+
     async def clear(self) -> None:
         self.__cache = {}
@@ -0,0 +1,228 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present ShomyKohai
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+from typing import Iterable, Iterator, List, Optional, Tuple, TYPE_CHECKING, Union
+
+from .crawler import SQLiteSink
+from .error import InvalidArgument
+from .frames import EntryFrame
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .models.anime import Anime
+    from .models.enums import Media
+    from .models.manga import Manga
+
+__all__ = ("Catalog",)
+
+_WORD = re.compile(r"\w+")
+
+
+def _has_fts5() -> bool:
+    try:
+        sqlite3.connect(":memory:").execute("CREATE VIRTUAL TABLE t USING fts5(x)")
+    except sqlite3.OperationalError:
+        return False
+    return True
+
+
+def _titles(node: dict) -> Tuple[Optional[str], ...]:
+    titles = node.get("titles") or {}
+    localized = titles.get("localized") or {}
+    return (
+        titles.get("canonical"),
+        localized.get("en_us") or localized.get("en"),
+        localized.get("en_jp"),
+        localized.get("ja_jp"),
+    )
+
+
+class Catalog(SQLiteSink):
+    """
+    Local mirror of anime and manga entries, with a full-text index
+    over every title (canonical, ``en``, ``en_jp`` and ``ja_jp``).
+
+    It's a :class:`Sink`, so a :class:`Crawler` can fill it, and it can
+    be passed to :class:`Client` to answer searches locally before
+    going to the API.
+    The index uses SQLite FTS5 when the interpreter's SQLite has it,
+    and a slower ``LIKE`` scan otherwise.
+
+    .. versionadded:: 1.1.0
+
+    Example
+    ---------
+    .. code-block:: python3
+
+        catalog = askitsu.Catalog("kitsu.db")
+        client = askitsu.Client(catalog=catalog)
+        anime = await client.search_anime("Naruto")  # No request sent
+
+    Parameters
+    -----------
+    path: :class:`str`
+        Path of the database. Defaults to an in-memory one.
+        A database written by :class:`SQLiteSink` gets indexed when opened.
+    table: :class:`str`
+        Name of the entries table. Defaults to ``entries``.
+
+    Attributes
+    -----------
+    fts: :class:`bool`
+        Whether the index is backed by FTS5
+    """
+
+    def __init__(self, path: str = ":memory:", table: str = "entries") -> None:
+        super().__init__(path, table)
+        self.fts = _has_fts5()
+        self._titles = f"{table}_titles"
+        exists = self._db.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = ?", (self._titles,)
+        ).fetchone()
+        if self.fts:
+            self._db.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self._titles} USING fts5("
+                "type UNINDEXED, id UNINDEXED, canonical, en, en_jp, ja_jp, "
+                "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+            )
+        else:
+            self._db.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._titles} ("
+                "type TEXT, id INTEGER, canonical TEXT, en TEXT, en_jp TEXT, "
+                "ja_jp TEXT)"
+            )
+        if not exists:
+            self.rebuild()
+        self._db.commit()
+
+    def write(self, entry_type: str, nodes: List[dict]) -> None:
+        # Title rows share the rowid of their entry, and REPLACE gives a stored
+        # entry a new one, so its old row goes first, found by rowid
+        keys = [(entry_type, int(node["id"])) for node in nodes]
+        self._db.executemany(
+            f"DELETE FROM {self._titles} WHERE rowid = "
+            f"(SELECT rowid FROM {self.table} WHERE type = ? AND id = ?)",
+            keys,
+        )
+        super().write(entry_type, nodes)
+        self._db.executemany(
+            f"INSERT INTO {self._titles} (rowid, type, id, canonical, en, en_jp, "
+            f"ja_jp) SELECT rowid, type, id, ?, ?, ?, ? FROM {self.table} "
+            "WHERE type = ? AND id = ?",
+            [(*_titles(node), *key) for node, key in zip(nodes, keys)],
+        )
+
+    def add(self, entries: Iterable[Union[Anime, Manga]]) -> None:
+        """
+        Store fetched entries and index their titles.
+        Entries built by a slim :class:`Client` can't be stored,
+        as they no longer hold the fetched data.
+        """
+        by_type: dict = {}
+        for entry in entries:
+            if entry._http.slim:
+                raise InvalidArgument("Slim entries can't be stored in a catalog")
+            by_type.setdefault(entry.entry_type, []).append(entry._attributes)
+        for entry_type, nodes in by_type.items():
+            self.write(entry_type, nodes)
+        self.flush()
+
+    def rebuild(self) -> None:
+        """
+        Index every stored entry again.
+        Needed after a ``VACUUM``, which can renumber the stored entries.
+        """
+        self._db.execute(f"DELETE FROM {self._titles}")
+        rows = self._db.execute(f"SELECT rowid, type, id, data FROM {self.table}")
+        self._db.executemany(
+            f"INSERT INTO {self._titles} (rowid, type, id, canonical, en, en_jp, "
+            "ja_jp) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (rowid, entry_type, id, *_titles(json.loads(data)))
+                for rowid, entry_type, id, data in rows
+            ],
+        )
+        self._db.commit()
+
+    def get(self, entry_type: str, id: int) -> Optional[dict]:
+        """The stored node of an entry, if any"""
+        row = self._db.execute(
+            f"SELECT data FROM {self.table} WHERE type = ? AND id = ?",
+            (entry_type, int(id)),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def nodes(self, entry_type: str) -> Iterator[dict]:
+        """Every stored node of a type, by id"""
+        rows = self._db.execute(
+            f"SELECT data FROM {self.table} WHERE type = ? ORDER BY id", (entry_type,)
+        )
+        for (data,) in rows:
+            yield json.loads(data)
+
+    def frame(self, type: Media, client: Client) -> EntryFrame:
+        """
+        Every stored entry of a type as an :class:`EntryFrame`.
+        Only its columns are held in memory, the rows are loaded from
+        the catalog when used and built with `client`.
+        """
+        return EntryFrame.from_catalog(self, type.value, client.http)
+
+    def search(self, entry_type: str, query: str, limit: int = 1) -> List[dict]:
+        """
+        The stored nodes whose titles best match `query`.
+        Every word has to match, the last one as a prefix.
+        """
+        words = _WORD.findall(query.lower())
+        if not words:
+            return []
+        if self.fts:
+            match = " ".join(f'"{word}"' for word in words) + "*"
+            # Rank first and join only the best rows, canonical title weighs the most
+            rows = self._db.execute(
+                f"SELECT e.data FROM (SELECT rowid, "
+                f"bm25({self._titles}, 0, 0, 4, 2, 2, 1) AS score "
+                f"FROM {self._titles} WHERE {self._titles} MATCH ? AND type = ? "
+                f"ORDER BY score LIMIT ?) t "
+                f"JOIN {self.table} e ON e.rowid = t.rowid "
+                "ORDER BY t.score",
+                (match, entry_type, limit),
+            )
+        else:
+            text = "(coalesce(canonical, '') || ' ' || coalesce(en, '') || ' ' || "
+            text += "coalesce(en_jp, '') || ' ' || coalesce(ja_jp, ''))"
+            rows = self._db.execute(
+                f"SELECT e.data FROM {self._titles} t "
+                f"JOIN {self.table} e ON e.rowid = t.rowid "
+                f"WHERE t.type = ? AND "
+                + " AND ".join(f"{text} LIKE ?" for _ in words)
+                + " LIMIT ?",
+                (entry_type, *(f"%{word}%" for word in words), limit),
+            )
+        return [json.loads(data) for (data,) in rows]
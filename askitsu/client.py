@@ -23,27 +23,74 @@ DEALINGS IN THE SOFTWARE.
 """
 
 import aiohttp
+import asyncio
 from colorama import Fore, Style  # type: ignore
-from typing import Dict, List, Literal, Optional, overload, Type, Union
+from concurrent.futures import Executor
+from typing import Dict, Iterable, List, Literal, Optional, overload, Type, Union
 
 
+from .catalog import Catalog
+from .pagination import Paginator
 from .queries import (
+    search_all,
+    ENTRY_FRAGMENTS,
+    ENTRY_TITLE,
     QUERY_METHODS,
     TRENDING_ENTRY,
+    USER_CHECK,
     USERS_BY_ID,
     USER_BY_USERNAME,
 )
 from .error import InvalidArgument
+from .frames import EntryFrame
 from .http import HTTPClient
+from .stats import StallStats
 from .models.anime import Anime
 from .models.character import Character
 from .models.core import Review
 from .models.enums import Entries, Media, Fetchable
 from .models.manga import Manga
-from .models.users import User
+from .models.serializable import Serializable
+from .models.users import LibraryEntry, User
 
 
-__all__ = ("Client",)
+__all__ = ("Client", "SearchResults")
+
+
+class SearchResults:
+    """
+    Results of :meth:`Client.search_all`, by type.
+    Types that were not searched are empty.
+
+    .. versionadded:: 1.1.0
+
+    Attributes
+    -----------
+    anime: List[:class:`Anime`]
+        The anime found
+    manga: List[:class:`Manga`]
+        The manga found
+    users: List[:class:`User`]
+        The users found
+    """
+
+    __slots__ = ("anime", "manga", "users")
+
+    def __init__(
+        self, anime: List[Anime], manga: List[Manga], users: List[User]
+    ) -> None:
+        self.anime = anime
+        self.manga = manga
+        self.users = users
+
+    def __repr__(self) -> str:
+        return (
+            f"<SearchResults anime={len(self.anime)} "
+            f"manga={len(self.manga)} users={len(self.users)}>"
+        )
+
+    def __bool__(self) -> bool:
+        return bool(self.anime or self.manga or self.users)
 
 
 class Client:
@@ -59,6 +106,58 @@ class Client:
 
     session: Optional[:class:`aiohttp.ClientSession`]
         An object that represents the effective connection
+    offload_threshold: :class:`int`
+        Size (in bytes) above which a response gets decoded in a worker
+        thread instead of the event loop.
+        Defaults to 256 KiB.
+
+        .. versionadded:: 1.1.0
+
+    offload_nodes: :class:`int`
+        Number of nodes from which a list of models gets built in a worker
+        thread instead of the event loop. Defaults to 256.
+
+        .. versionadded:: 1.1.0
+
+    executor: Optional[:class:`concurrent.futures.Executor`]
+        The thread pool used for offloaded work.
+        Defaults to the event loop's default executor.
+
+        .. versionadded:: 1.1.0
+
+    rate_limit: Optional[:class:`float`]
+        Maximum number of requests sent per second.
+        Defaults to no limit.
+
+        .. versionadded:: 1.1.0
+
+    catalog: Optional[:class:`Catalog`]
+        Local catalog that searches are answered from when it has a match,
+        before falling back to the API.
+
+        .. versionadded:: 1.1.0
+
+    offline: :class:`bool`
+        Never send searches to the API, only use `catalog`.
+        Defaults to ``False``.
+
+        .. versionadded:: 1.1.0
+
+    fuzzy: :class:`int`
+        Answer a search with the cached results of a query within this
+        edit distance (e.g. ``"naurto"`` with the results of ``"naruto"``).
+        Queries are allowed one edit every four characters at most.
+        Defaults to ``0``, which disables it.
+
+        .. versionadded:: 1.1.0
+
+    slim: :class:`bool`
+        Build models that compute what their properties read (dates,
+        images) up front, instead of keeping the whole fetched tree.
+        Saves memory when caching many entries, but slim entries can't be
+        stored in a :class:`Catalog`. Defaults to ``False``.
+
+        .. versionadded:: 1.1.0
 
     Attributes
     -----------
@@ -72,7 +171,17 @@ class Client:
         *,
         session: Optional[aiohttp.ClientSession] = None,
         cache_expiration: int = 300,
+        offload_threshold: int = 262144,
+        offload_nodes: int = 256,
+        executor: Optional[Executor] = None,
+        rate_limit: Optional[float] = None,
+        catalog: Optional[Catalog] = None,
+        offline: bool = False,
+        fuzzy: int = 0,
+        slim: bool = False,
     ) -> None:
+        if offline and catalog is None:
+            raise InvalidArgument("offline mode needs a catalog")
         self._entries: Dict[str, Union[Type[Anime], Type[Manga], Type[Character]]] = {
             "anime": Anime,
             "manga": Manga,
@@ -83,7 +192,17 @@ class Client:
             cache_expiration=cache_expiration,
             token=token,
             entries=self._entries,
+            offload_threshold=offload_threshold,
+            offload_nodes=offload_nodes,
+            executor=executor,
+            rate_limit=rate_limit,
+            catalog=catalog,
+            offline=offline,
+            fuzzy=fuzzy,
+            slim=slim,
         )
+        # Unpickled models get attached to the last client created
+        Serializable._make_default(self.http)
 
     @property
     def session(self) -> aiohttp.ClientSession:
@@ -93,23 +212,59 @@ class Client:
     def token(self) -> Optional[str]:
         return self.http.token
 
+    @property
+    def stall_stats(self) -> StallStats:
+        """
+        How long the event loop got blocked decoding responses and
+        building models inline
+
+        .. versionadded:: 1.1.0
+        """
+        return self.http.stall_stats
+
     @overload
-    async def search(self, type: Literal[Entries.ANIME], query: str) -> Optional[Anime]:
+    async def search(
+        self,
+        type: Literal[Entries.ANIME],
+        query: str,
+        *,
+        fields: Optional[Iterable[str]] = ...,
+        include: Optional[Iterable[str]] = ...,
+    ) -> Optional[Anime]:
         ...
 
     @overload
     async def search(
-        self, type: Literal[Entries.ANIME], query: str, limit: int
+        self,
+        type: Literal[Entries.ANIME],
+        query: str,
+        limit: int,
+        *,
+        fields: Optional[Iterable[str]] = ...,
+        include: Optional[Iterable[str]] = ...,
     ) -> Optional[List[Anime]]:
         ...
 
     @overload
-    async def search(self, type: Literal[Entries.MANGA], query: str) -> Optional[Manga]:
+    async def search(
+        self,
+        type: Literal[Entries.MANGA],
+        query: str,
+        *,
+        fields: Optional[Iterable[str]] = ...,
+        include: Optional[Iterable[str]] = ...,
+    ) -> Optional[Manga]:
         ...
 
     @overload
     async def search(
-        self, type: Literal[Entries.MANGA], query: str, limit: int
+        self,
+        type: Literal[Entries.MANGA],
+        query: str,
+        limit: int,
+        *,
+        fields: Optional[Iterable[str]] = ...,
+        include: Optional[Iterable[str]] = ...,
     ) -> Optional[List[Manga]]:
         ...
 
@@ -126,7 +281,13 @@ class Client:
         ...
 
     async def search(
-        self, type: Fetchable, query: str, limit: int = 1
+        self,
+        type: Fetchable,
+        query: str,
+        limit: int = 1,
+        *,
+        fields: Optional[Iterable[str]] = None,
+        include: Optional[Iterable[str]] = None,
     ) -> Optional[
         Union[Anime, List[Anime], Manga, List[Manga], Character, List[Character]]
     ]:
@@ -142,6 +303,20 @@ class Client:
             Represents the search query
         limit: :class:`int`
             Limit the search to a specific number of results
+        fields: Optional[Iterable[:class:`str`]]
+            Only fetch these fields (attribute or property names, e.g.
+            ``["title", "poster_image"]``) instead of the whole entry.
+            The results are partial: accessing a field that was not
+            fetched raises :class:`NotFetched`.
+
+            .. versionadded:: 1.1.0
+        include: Optional[Iterable[:class:`str`]]
+            Relations to fetch in the same request, so reading them later
+            doesn't send another one: ``categories``, ``characters``,
+            and ``stream_links``, ``episodes`` for anime or
+            ``chapters`` for manga.
+
+            .. versionadded:: 1.1.0
 
         """
         try:
@@ -150,19 +325,92 @@ class Client:
             raise InvalidArgument
         else:
             return await self.http._search_entry(
-                entry_type=type, query=query, limit=limit, method=method
+                entry_type=type,
+                query=query,
+                limit=limit,
+                method=method,
+                fields=fields,
+                include=include,
             )
 
+    def iter_search(
+        self,
+        type: Media,
+        query: str,
+        per_page: int = 20,
+        limit: Optional[int] = None,
+        *,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Paginator[Union[Anime, Manga]]:
+        """
+        Iterate over every result of a search, page by page
+
+        .. versionadded:: 1.1.0
+
+        Parameters
+        -----------
+        type: :class:`Entries`
+            The type of entry to search
+        query: :class:`str`
+            Represents the search query
+        per_page: :class:`int`
+            Number of results fetched per request
+        limit: Optional[:class:`int`]
+            Stop after this many results
+        fields: Optional[Iterable[:class:`str`]]
+            Only fetch these fields. See :meth:`search`
+        """
+        try:
+            method = QUERY_METHODS[f"{type.value}_search"]
+            entry = self._entries[type.value]
+        except (KeyError, TypeError):
+            raise InvalidArgument
+        return Paginator(
+            self.http,
+            self.http._project(
+                ENTRY_TITLE[method], ENTRY_FRAGMENTS[type.value], fields
+            ),
+            {"title": query},
+            (method,),
+            lambda attributes: entry(
+                attributes=attributes, http=self.http, cache=self.http._cache
+            ),
+            cache_key=(
+                f"{self.http._search_key(type.value, query)}"
+                f"{self.http._fields_key(fields)}"
+            ),
+            per_page=per_page,
+            limit=limit,
+        )
+
     @overload
-    async def search_anime(self, query: str) -> Optional[Anime]:
+    async def search_anime(
+        self,
+        query: str,
+        *,
+        fields: Optional[Iterable[str]] = ...,
+        include: Optional[Iterable[str]] = ...,
+    ) -> Optional[Anime]:
         ...
 
     @overload
-    async def search_anime(self, query: str, limit: int) -> Optional[List[Anime]]:
+    async def search_anime(
+        self,
+        query: str,
+        limit: int,
+        *,
+        fields: Optional[Iterable[str]] = ...,
+        include: Optional[Iterable[str]] = ...,
+    ) -> Optional[List[Anime]]:
         ...
 
     async def search_anime(
-        self, query: str, limit: int = 1
+        self,
+        query: str,
+        limit: int = 1,
+        *,
+        fields: Optional[Iterable[str]] = None,
+        include: Optional[Iterable[str]] = None,
     ) -> Optional[Union[Anime, List[Anime]]]:
         """|coro|
 
@@ -174,19 +422,51 @@ class Client:
             Represents the search query
         limit: :class:`int`
             Limit the search to a specific number of results
+        fields: Optional[Iterable[:class:`str`]]
+            Only fetch these fields. See :meth:`search`
+
+            .. versionadded:: 1.1.0
+        include: Optional[Iterable[:class:`str`]]
+            Relations to fetch in the same request. See :meth:`search`
+
+            .. versionadded:: 1.1.0
         """
-        return await self.search(Entries.ANIME, query=query, limit=limit)
+        return await self.search(
+            Entries.ANIME,
+            query=query,
+            limit=limit,
+            fields=fields,
+            include=include,
+        )
 
     @overload
-    async def search_manga(self, query: str) -> Optional[Manga]:
+    async def search_manga(
+        self,
+        query: str,
+        *,
+        fields: Optional[Iterable[str]] = ...,
+        include: Optional[Iterable[str]] = ...,
+    ) -> Optional[Manga]:
         ...
 
     @overload
-    async def search_manga(self, query: str, limit: int) -> Optional[List[Manga]]:
+    async def search_manga(
+        self,
+        query: str,
+        limit: int,
+        *,
+        fields: Optional[Iterable[str]] = ...,
+        include: Optional[Iterable[str]] = ...,
+    ) -> Optional[List[Manga]]:
         ...
 
     async def search_manga(
-        self, query: str, limit: int = 1
+        self,
+        query: str,
+        limit: int = 1,
+        *,
+        fields: Optional[Iterable[str]] = None,
+        include: Optional[Iterable[str]] = None,
     ) -> Optional[Union[Manga, List[Manga]]]:
         """|coro|
 
@@ -198,8 +478,22 @@ class Client:
             Represents the search query
         limit: :class:`int`
             Limit the search to a specific number of results
+        fields: Optional[Iterable[:class:`str`]]
+            Only fetch these fields. See :meth:`search`
+
+            .. versionadded:: 1.1.0
+        include: Optional[Iterable[:class:`str`]]
+            Relations to fetch in the same request. See :meth:`search`
+
+            .. versionadded:: 1.1.0
         """
-        return await self.search(Entries.MANGA, query=query, limit=limit)
+        return await self.search(
+            Entries.MANGA,
+            query=query,
+            limit=limit,
+            fields=fields,
+            include=include,
+        )
 
     async def search_user(self, name: str) -> Optional[User]:
         """
@@ -209,36 +503,144 @@ class Client:
             Nickname of the user to fetch
         """
         cache_res = await self.http._cache.get(f"user_{name}")
-        if cache_res:
+        # check_user stores None under the same key
+        if cache_res and cache_res.value is not None:
             return cache_res.value
         variables = {"name": name}
         data = await self.http.post_data(
             data={"query": USER_BY_USERNAME, "variables": variables}
         )
-        user = User(
-            data["data"]["searchProfileByUsername"]["nodes"][0],
-            http=self.http,
-            cache=self.http._cache,
-        )
+        nodes = data["data"]["searchProfileByUsername"]["nodes"]
+        if not nodes:
+            return None
+        user = User(nodes[0], http=self.http, cache=self.http._cache)
+        await self.http._cache.remove(f"user_{name}")
         await self.http._cache.add(
             f"user_{name}", user, remove_after=self.http._cache_expiration
         )
         return user
 
+    async def search_all(
+        self,
+        query: str,
+        types: Iterable[Entries] = (Entries.ANIME, Entries.MANGA, Entries.USER),
+        limit: int = 1,
+    ) -> SearchResults:
+        """|coro|
+
+        Search anime, manga and users in a single request.
+        Every type is cached on its own, so a later :meth:`search_anime`,
+        :meth:`search_manga` or :meth:`search_user` with the same query is
+        answered from the cache, and types already cached aren't requested.
+
+        .. versionadded:: 1.1.0
+
+        Parameters
+        -----------
+        query: :class:`str`
+            Title, or username, to search
+        types: Iterable[:class:`Entries`]
+            What to search among :class:`Entries.ANIME`,
+            :class:`Entries.MANGA` and :class:`Entries.USER`.
+            Defaults to all of them.
+        limit: :class:`int`
+            Maximum number of results of each type
+        """
+        try:
+            names = list(dict.fromkeys(type.value for type in types))
+        except AttributeError:
+            raise InvalidArgument from None
+        if not set(names) <= {"anime", "manga", "user"}:
+            raise InvalidArgument("Only anime, manga and users can be searched")
+        results: Dict[str, list] = {"anime": [], "manga": [], "user": []}
+        users_key = f"{self.http._search_key('user_search', query)}_{limit}"
+        missing = []
+        for name in names:
+            if name == "user":
+                cache_res = await self.http._cache.get(users_key)
+                found = cache_res.value if cache_res else None
+            else:
+                found = await self.http._search_local(name, query, limit)
+            if found is None:
+                missing.append(name)
+            else:
+                results[name] = found
+        if missing:
+            data = await self.http.post_data(
+                data={
+                    "query": search_all(tuple(missing)),
+                    "variables": {"query": query, "limit": limit},
+                }
+            )
+            for name in missing:
+                nodes = (data["data"].get(name) or {}).get("nodes") or []
+                if name == "user":
+                    users = [
+                        User(node, http=self.http, cache=self.http._cache)
+                        for node in nodes
+                    ]
+                    await self.http._cache.add(
+                        users_key, users, remove_after=self.http._cache_expiration
+                    )
+                    if users:
+                        await self.http._cache.remove(f"user_{query}")
+                        await self.http._cache.add(
+                            f"user_{query}",
+                            users[0],
+                            remove_after=self.http._cache_expiration,
+                        )
+                    results[name] = users
+                    continue
+                entry = self._entries[name]
+                fetched = await self.http._build(
+                    lambda attributes: entry(  # type: ignore
+                        attributes=attributes, http=self.http, cache=self.http._cache
+                    ),
+                    nodes,
+                )
+                await self.http._search_store(name, query, limit, None, fetched)
+                results[name] = fetched
+        return SearchResults(results["anime"], results["manga"], results["user"])
+
     @overload
-    async def get_entry(self, type: Literal[Entries.ANIME], id: int) -> Anime:
+    async def get_entry(
+        self,
+        type: Literal[Entries.ANIME],
+        id: int,
+        *,
+        fields: Optional[Iterable[str]] = ...,
+        include: Optional[Iterable[str]] = ...,
+    ) -> Anime:
         ...
 
     @overload
-    async def get_entry(self, type: Literal[Entries.MANGA], id: int) -> Manga:
+    async def get_entry(
+        self,
+        type: Literal[Entries.MANGA],
+        id: int,
+        *,
+        fields: Optional[Iterable[str]] = ...,
+        include: Optional[Iterable[str]] = ...,
+    ) -> Manga:
         ...
 
     @overload
-    async def get_entry(self, type: Literal[Entries.CHARACTER], id: int) -> Character:
+    async def get_entry(
+        self,
+        type: Literal[Entries.CHARACTER],
+        id: int,
+        *,
+        fields: Optional[Iterable[str]] = ...,
+    ) -> Character:
         ...
 
     async def get_entry(
-        self, type: Fetchable, id: int
+        self,
+        type: Fetchable,
+        id: int,
+        *,
+        fields: Optional[Iterable[str]] = None,
+        include: Optional[Iterable[str]] = None,
     ) -> Optional[Union[Anime, Manga, Character]]:
         """|coro|
 
@@ -250,6 +652,15 @@ class Client:
             The type of media to fetch
         id: :class:`int`
             ID of the media
+        fields: Optional[Iterable[:class:`str`]]
+            Only fetch these fields. See :meth:`search`
+
+            .. versionadded:: 1.1.0
+        include: Optional[Iterable[:class:`str`]]
+            Relations to fetch in the same request. See :meth:`search`.
+            If the entry is already cached only the missing relations are fetched.
+
+            .. versionadded:: 1.1.0
         """
         try:
             method = QUERY_METHODS[f"{type.value}_id"]
@@ -257,7 +668,7 @@ class Client:
             raise InvalidArgument
         else:
             return await self.http._get_entry_fetch(
-                entry_type=type, id=id, method=method
+                entry_type=type, id=id, method=method, fields=fields, include=include
             )
 
     async def get_anime_entry(self, id: int) -> Anime:
@@ -288,19 +699,45 @@ class Client:
 
     @overload
     async def get_trending_entry(
-        self, type: Literal[Entries.ANIME], limit: int = ...
+        self,
+        type: Literal[Entries.ANIME],
+        limit: int = ...,
+        *,
+        fields: Optional[Iterable[str]] = ...,
+        frame: Literal[False] = ...,
     ) -> List[Anime]:
         ...
 
     @overload
     async def get_trending_entry(
-        self, type: Literal[Entries.MANGA], limit: int = ...
+        self,
+        type: Literal[Entries.MANGA],
+        limit: int = ...,
+        *,
+        fields: Optional[Iterable[str]] = ...,
+        frame: Literal[False] = ...,
     ) -> List[Manga]:
         ...
 
+    @overload
+    async def get_trending_entry(
+        self,
+        type: Media,
+        limit: int = ...,
+        *,
+        fields: Optional[Iterable[str]] = ...,
+        frame: Literal[True],
+    ) -> Optional[EntryFrame]:
+        ...
+
     async def get_trending_entry(
-        self, type: Media, limit: int = 10
-    ) -> Optional[Union[List[Anime], List[Manga]]]:
+        self,
+        type: Media,
+        limit: int = 10,
+        *,
+        fields: Optional[Iterable[str]] = None,
+        frame: bool = False,
+    ) -> Optional[Union[List[Anime], List[Manga], EntryFrame]]:
         """|coro|
 
         Return a list of anime or manga (max of 10)
@@ -311,6 +748,14 @@ class Client:
         -----------
         entry: Union[:class:`Anime`, :class:`Manga`]
             Entry to fetch its trending
+        fields: Optional[Iterable[:class:`str`]]
+            Only fetch these fields. See :meth:`search`
+
+            .. versionadded:: 1.1.0
+        frame: :class:`bool`
+            Return an :class:`EntryFrame` instead of a list
+
+            .. versionadded:: 1.1.0
         """
         type_upper = type.value.upper()
         if type_upper not in ("ANIME", "MANGA"):
@@ -323,19 +768,101 @@ class Client:
         except (KeyError, TypeError):
             raise InvalidArgument
         variables = {"media": type_upper, "limit": limit}
-        data = await self.http.post_data(
-            data={"query": TRENDING_ENTRY, "variables": variables}
+        query = self.http._project(
+            TRENDING_ENTRY, ENTRY_FRAGMENTS[type_upper.lower()], fields
         )
+        data = await self.http.post_data(data={"query": query, "variables": variables})
         data_value = data["data"]["globalTrending"]["nodes"]
+        if frame:
+            return (
+                EntryFrame.from_nodes(type_upper.lower(), data_value, self.http)
+                if data_value
+                else None
+            )
         return (
-            [
-                entry(attributes=attributes, http=self.http, cache=self._cache)
-                for attributes in data_value
-            ]
+            await self.http._build(
+                lambda attributes: entry(
+                    attributes=attributes, http=self.http, cache=self.http._cache
+                ),
+                data_value,
+            )
             if data_value
             else None  # type: ignore
         )
 
+    async def hydrate(
+        self, entries: Iterable[Union[Anime, Manga]]
+    ) -> List[Union[Anime, Manga]]:
+        """|coro|
+
+        Fetch the missing fields of partial entries (see :meth:`search`)
+        using as few requests as possible
+
+        .. versionadded:: 1.1.0
+
+        Parameters
+        -----------
+        entries: Iterable[Union[:class:`Anime`, :class:`Manga`]]
+            The entries to complete
+        """
+        return list(await asyncio.gather(*(entry.hydrate() for entry in entries)))
+
+    async def load_relations(
+        self, entries: Iterable[Union[Anime, Manga]], *relations: str
+    ) -> None:
+        """|coro|
+
+        Fetch relations of many entries at once and cache them,
+        so reading them from each entry doesn't send a request.
+        Up to 25 entries are fetched per request,
+        skipping the relations already cached.
+
+        .. versionadded:: 1.1.0
+
+        Example
+        ---------
+        .. code-block:: python3
+
+            trending = await client.get_trending_entry(askitsu.Entries.ANIME, 20)
+            await client.load_relations(trending, "categories", "stream_links")
+            for anime in trending:
+                print(anime.title, await anime.categories)  # No request sent
+
+        Parameters
+        -----------
+        entries: Iterable[Union[:class:`Anime`, :class:`Manga`]]
+            The entries to load the relations of
+        relations: :class:`str`
+            ``categories``, ``characters``, and ``stream_links``,
+            ``episodes`` for anime or ``chapters`` for manga
+        """
+        await asyncio.gather(
+            *(self.http._load_relations(entry, relations) for entry in entries)
+        )
+
+    async def load_media(
+        self, entries: Iterable[LibraryEntry]
+    ) -> List[Union[Anime, Manga]]:
+        """|coro|
+
+        Fetch the linked media of many library entries at once.
+        Media already cached aren't fetched again, the others are
+        fetched 25 per request.
+
+        .. versionadded:: 1.1.0
+
+        Parameters
+        -----------
+        entries: Iterable[:class:`LibraryEntry`]
+            Library entries, e.g. from :meth:`User.iter_library`
+
+        Returns
+        -----------
+        List[Union[:class:`Anime`, :class:`Manga`]]
+            The media of every entry, in the same order
+        """
+        return await self.http._load_media(entries)
+
     async def get_reviews(
         self, entry: Union[Anime, Manga], limit: int = 1
     ) -> Optional[List[Review]]:
@@ -427,22 +954,19 @@ class Client:
         slug: :class:`str`
             Nickname of the user
         """
-        query = """
-            query checkUser ($slug: String!) {
-                findProfileBySlug(slug: $slug) {
-                    slug
-                }
-            }
-        """
         cache_res = await self.http._cache.get(f"user_{slug}")
         if cache_res:
             return True
         variables = {"slug": slug}
-        data = await self.http.post_data(data={"query": query, "variables": variables})
+        data = await self.http.post_data(
+            data={"query": USER_CHECK, "variables": variables}
+        )
         if data["data"]["findProfileBySlug"] is not None:
             await self.http._cache.add(f"user_{slug}", None)
         return bool(data["data"]["findProfileBySlug"])
 
     async def close(self) -> None:
         """Close client connection"""
+        if Serializable._default() is self.http:
+            Serializable._default_http = None
         return await self.http.close()
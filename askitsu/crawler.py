@@ -0,0 +1,606 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present ShomyKohai
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import re
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING, Union
+
+from .error import InvalidArgument
+from .pagination import Paginator
+from .queries import ENTRY_CATALOG, ENTRY_FRAGMENTS, ENTRY_UPDATES, QUERY_METHODS
+from .utils import parse_datetime
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .models.enums import Media
+
+__all__ = (
+    "Checkpoint",
+    "CrawlProgress",
+    "Crawler",
+    "JSONLinesSink",
+    "Sink",
+    "SQLiteSink",
+)
+__log__ = logging.getLogger(__name__)
+
+_TIMESTAMP = "%Y-%m-%dT%H:%M:%SZ"
+_UPDATED_AT = re.compile(rb'"updatedAt":"([^"]*)"')
+
+
+def _updated_at(node: dict) -> Optional[datetime]:
+    return parse_datetime(node.get("updatedAt"))
+
+
+def parse_since(since: Union[datetime, str]) -> datetime:
+    """
+    The start of a sync as a naive UTC datetime, like the ``updatedAt``
+    it's compared with. Strings are read by :func:`parse_datetime`: ISO 8601
+    calendar dates with an optional time, fraction and offset.
+    Raises :class:`InvalidArgument` for anything else.
+    """
+    if isinstance(since, str):
+        parsed = parse_datetime(since)
+        if parsed is None:
+            raise InvalidArgument(f"{since!r} is not an ISO 8601 date or timestamp")
+        since = parsed
+    if since.tzinfo is not None:
+        since = since.astimezone(timezone.utc).replace(tzinfo=None)
+    return since
+
+
+class Sink(ABC):
+    """
+    Destination of the nodes fetched by a :class:`Crawler`.
+
+    .. versionadded:: 1.1.0
+    """
+
+    @abstractmethod
+    def write(self, entry_type: str, nodes: List[dict]) -> None:
+        """Store a batch of raw nodes"""
+        ...
+
+    def flush(self) -> None:
+        """Make everything written so far durable"""
+
+    def state(self) -> Any:
+        """Position saved in the checkpoint after every :meth:`flush`"""
+        return None
+
+    def restore(self, state: Any) -> None:
+        """Go back to a position returned by :meth:`state`"""
+
+    def high_water_mark(self, entry_type: str) -> Optional[datetime]:
+        """Most recent ``updatedAt`` stored, used as the starting point of a sync"""
+        return None
+
+    def compact(self) -> None:
+        """Drop the older copies of nodes written more than once"""
+
+    def close(self) -> None:
+        ...
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class JSONLinesSink(Sink):
+    """
+    Append every node to a file, one JSON document per line.
+
+    When resuming, anything written after the last checkpoint is cut off,
+    so a crash never leaves duplicated lines behind.
+
+    The file is append-only: a ``sync`` writes every updated entry again,
+    and :meth:`compact` is called once the sync is done to keep only the
+    last line of every id. A file is meant to hold a single entry type.
+
+    .. versionadded:: 1.1.0
+
+    Parameters
+    -----------
+    path: :class:`str`
+        The file to append to
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "a+b")
+
+    def write(self, entry_type: str, nodes: List[dict]) -> None:
+        self._file.write(
+            b"".join(
+                json.dumps(node, separators=(",", ":")).encode() + b"\n"
+                for node in nodes
+            )
+        )
+
+    def flush(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def state(self) -> int:
+        return self._file.tell()
+
+    def restore(self, state: Optional[int]) -> None:
+        if state is not None:
+            self._file.truncate(state)
+            self._file.seek(state)
+
+    def high_water_mark(self, entry_type: str) -> Optional[datetime]:
+        self._file.seek(0)
+        # Timestamps share one format, so the biggest string is the latest
+        latest = max(
+            (match.group(1) for match in map(_UPDATED_AT.search, self._file) if match),
+            default=None,
+        )
+        self._file.seek(0, os.SEEK_END)
+        return parse_datetime(latest.decode()) if latest else None
+
+    def compact(self) -> None:
+        """
+        Rewrite the file keeping only the last line written for every id,
+        in the order those lines were written.
+
+        The file is streamed twice, once to find the last line of every id
+        and once to copy them, so only an offset per id is held in memory.
+        The new file replaces the old one atomically.
+        """
+        # Lines without an id are kept, keyed by their own offset
+        last: Dict[Any, int] = {}
+        self._file.seek(0)
+        offset = 0
+        for line in self._file:
+            last[json.loads(line).get("id", (offset,))] = offset
+            offset += len(line)
+        temp = f"{self.path}.tmp"
+        with open(temp, "wb") as file:
+            self._file.seek(0)
+            offset = 0
+            for line in self._file:
+                if last[json.loads(line).get("id", (offset,))] == offset:
+                    file.write(line)
+                offset += len(line)
+            file.flush()
+            os.fsync(file.fileno())
+        self._file.close()
+        os.replace(temp, self.path)
+        self._file = open(self.path, "a+b")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class SQLiteSink(Sink):
+    """
+    Upsert every node into an SQLite table keyed by type and id,
+    storing the raw node as JSON.
+
+    .. versionadded:: 1.1.0
+
+    Parameters
+    -----------
+    path: :class:`str`
+        Path of the database
+    table: :class:`str`
+        Name of the table. Defaults to ``entries``.
+    """
+
+    def __init__(self, path: str, table: str = "entries") -> None:
+        self.path = path
+        self.table = table
+        self._db = sqlite3.connect(path)
+        self._db.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} ("
+            "type TEXT NOT NULL, id INTEGER NOT NULL, updated_at TEXT, "
+            "data TEXT NOT NULL, PRIMARY KEY (type, id))"
+        )
+        self._db.commit()
+
+    def write(self, entry_type: str, nodes: List[dict]) -> None:
+        self._db.executemany(
+            f"INSERT OR REPLACE INTO {self.table} VALUES (?, ?, ?, ?)",
+            [
+                (
+                    entry_type,
+                    int(node["id"]),
+                    node.get("updatedAt"),
+                    json.dumps(node, separators=(",", ":")),
+                )
+                for node in nodes
+            ],
+        )
+
+    def flush(self) -> None:
+        self._db.commit()
+
+    def high_water_mark(self, entry_type: str) -> Optional[datetime]:
+        (latest,) = self._db.execute(
+            f"SELECT max(updated_at) FROM {self.table} WHERE type = ?", (entry_type,)
+        ).fetchone()
+        return parse_datetime(latest)
+
+    def close(self) -> None:
+        self._db.commit()
+        self._db.close()
+
+
+class Checkpoint:
+    """
+    Progress of a crawl saved as a small JSON file.
+    The file is replaced atomically, so it is never left half written.
+
+    .. versionadded:: 1.1.0
+
+    Parameters
+    -----------
+    path: :class:`str`
+        Where the checkpoint is stored
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def load(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "r") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def save(self, state: Dict[str, Any]) -> None:
+        temp = f"{self.path}.tmp"
+        with open(temp, "w") as file:
+            json.dump(state, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp, self.path)
+
+    def clear(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+class CrawlProgress:
+    """
+    Progress of a running crawl, passed to the `progress` callback
+    of :class:`Crawler` after every batch.
+
+    .. versionadded:: 1.1.0
+
+    Attributes
+    -----------
+    entry_type: :class:`str`
+        Type of the entries being crawled
+    done: :class:`int`
+        Entries (or ids, when crawling an id range) processed so far
+    total: Optional[:class:`int`]
+        How many there are in total, when known
+    written: :class:`int`
+        Entries sent to the sink
+    """
+
+    __slots__ = ("entry_type", "done", "total", "written", "_start", "_resumed")
+
+    def __init__(self, entry_type: str, done: int = 0, written: int = 0) -> None:
+        self.entry_type = entry_type
+        self.done = done
+        self.total: Optional[int] = None
+        self.written = written
+        self._start = time.monotonic()
+        self._resumed = done
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the crawl (re)started"""
+        return time.monotonic() - self._start
+
+    @property
+    def rate(self) -> float:
+        """Entries processed per second in this run"""
+        elapsed = self.elapsed
+        return (self.done - self._resumed) / elapsed if elapsed else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Estimated seconds left, when the total is known"""
+        rate = self.rate
+        if self.total is None or not rate:
+            return None
+        return max(self.total - self.done, 0) / rate
+
+    def __str__(self) -> str:
+        total = f"/{self.total}" if self.total is not None else ""
+        eta = self.eta
+        remaining = (
+            f", ETA {int(eta // 3600)}h{int(eta % 3600 // 60):02d}m{int(eta % 60):02d}s"
+            if eta is not None
+            else ""
+        )
+        return f"{self.entry_type}: {self.done}{total} ({self.rate:.1f}/s{remaining})"
+
+
+def _log_progress(progress: CrawlProgress) -> None:
+    __log__.info(str(progress))
+
+
+class Crawler:
+    """
+    Walk the whole anime or manga catalog, streaming every entry to a
+    :class:`Sink` and checkpointing after each batch so an interrupted
+    crawl resumes where it left off.
+
+    Requests go through the client, so its ``rate_limit`` is respected.
+    The checkpoint is removed once the crawl completes.
+
+    After a first full crawl, ``sync`` mode only fetches the entries
+    updated since the most recent one stored in the sink, and evicts them
+    from the client cache.
+
+    .. versionadded:: 1.1.0
+
+    Example
+    ---------
+    .. code-block:: python3
+
+        with askitsu.SQLiteSink("kitsu.db") as sink:
+            crawler = askitsu.Crawler(
+                client, askitsu.Entries.ANIME, sink, checkpoint="anime.ckpt"
+            )
+            await crawler.run()
+
+    Parameters
+    -----------
+    client: :class:`Client`
+        The client used to send requests
+    type: :class:`Entries`
+        :class:`Entries.ANIME` or :class:`Entries.MANGA`
+    sink: :class:`Sink`
+        Where the raw nodes are written
+    checkpoint: Optional[:class:`str`]
+        Path of the checkpoint file. Without it the crawl can't be resumed.
+    mode: :class:`str`
+        ``cursor`` walks the catalog connection page by page,
+        ``ids`` fetches ranges of ids in batched requests,
+        ``sync`` walks the catalog from the most recently updated entry
+        and stops at `since`, then calls :meth:`Sink.compact` since updated
+        entries are written again. Defaults to ``cursor``.
+    per_page: :class:`int`
+        Entries requested per page in ``cursor`` mode
+    concurrency: :class:`int`
+        Batched requests in flight at once in ``ids`` mode
+    start_id: :class:`int`
+        First id to fetch in ``ids`` mode
+    end_id: Optional[:class:`int`]
+        Last id to fetch in ``ids`` mode.
+        Without it the crawl stops after `max_gap` missing ids in a row.
+    max_gap: :class:`int`
+        Consecutive missing ids that end an open ended ``ids`` crawl
+    since: Optional[Union[:class:`datetime.datetime`, :class:`str`]]
+        Where a ``sync`` stops, as a datetime (naive ones are taken as UTC)
+        or an ISO 8601 calendar date with an optional time, fraction and
+        offset (``"2024-01-01"``, ``"20240101T12:00:00.5Z"``,
+        ``"2024-01-01T12:00:00+02:00"``...).
+        Defaults to the sink's :meth:`Sink.high_water_mark`.
+    progress: Optional[Callable[[:class:`CrawlProgress`], None]]
+        Called after every batch. Defaults to logging the progress.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        type: Media,
+        sink: Sink,
+        *,
+        checkpoint: Optional[str] = None,
+        mode: str = "cursor",
+        per_page: int = 100,
+        concurrency: int = 4,
+        start_id: int = 1,
+        end_id: Optional[int] = None,
+        max_gap: int = 500,
+        since: Optional[Union[datetime, str]] = None,
+        progress: Optional[Callable[[CrawlProgress], None]] = None,
+    ) -> None:
+        if mode not in ("cursor", "ids", "sync"):
+            raise InvalidArgument("mode must be one of 'cursor', 'ids' or 'sync'")
+        try:
+            self.entry_type: str = type.value
+            ENTRY_CATALOG[self.entry_type]
+        except (AttributeError, KeyError):
+            raise InvalidArgument("Only anime and manga can be crawled") from None
+        self._http = client.http
+        self.sink = sink
+        self.checkpoint = Checkpoint(checkpoint) if checkpoint else None
+        self.mode = mode
+        self.per_page = per_page
+        self.concurrency = concurrency
+        self.start_id = start_id
+        self.end_id = end_id
+        self.max_gap = max_gap
+        self.since: Optional[datetime] = (
+            parse_since(since) if since is not None else None
+        )
+        self._progress = progress or _log_progress
+
+    async def run(self) -> CrawlProgress:
+        """|coro|
+
+        Crawl until the end of the catalog, or of the id range
+
+        Returns
+        --------
+        :class:`CrawlProgress`
+            The final progress
+        """
+        state = self.checkpoint.load() if self.checkpoint else {}
+        if state and (state.get("type"), state.get("mode")) != (
+            self.entry_type,
+            self.mode,
+        ):
+            raise InvalidArgument(
+                f"{self.checkpoint.path} belongs to a different crawl"  # type: ignore
+            )
+        if state:
+            self.sink.restore(state.get("sink"))
+            __log__.info(f"Resuming {self.entry_type} crawl from {state}")
+        progress = CrawlProgress(
+            self.entry_type, state.get("done", 0), state.get("written", 0)
+        )
+        if self.mode == "cursor":
+            await self._crawl_cursor(state, progress)
+        elif self.mode == "sync":
+            await self._crawl_updates(state, progress)
+        else:
+            await self._crawl_ids(state, progress)
+        if self.checkpoint:
+            self.checkpoint.clear()
+        if self.mode == "sync":
+            self.sink.compact()
+        return progress
+
+    def _commit(self, progress: CrawlProgress, **position: Any) -> None:
+        """Make the batch durable, then record how far the crawl got"""
+        self.sink.flush()
+        if self.checkpoint:
+            self.checkpoint.save(
+                {
+                    "type": self.entry_type,
+                    "mode": self.mode,
+                    "done": progress.done,
+                    "written": progress.written,
+                    "sink": self.sink.state(),
+                    **position,
+                }
+            )
+        self._progress(progress)
+
+    async def _crawl_cursor(self, state: dict, progress: CrawlProgress) -> None:
+        paginator: Paginator[dict] = Paginator(
+            self._http,
+            ENTRY_CATALOG[self.entry_type],
+            {},
+            (self.entry_type,),
+            lambda node: node,
+            cache_key=None,
+            per_page=self.per_page,
+            after=state.get("cursor"),
+        )
+        async for nodes, cursor in paginator.pages():
+            self.sink.write(self.entry_type, nodes)
+            progress.done += len(nodes)
+            progress.written += len(nodes)
+            progress.total = paginator.total
+            self._commit(progress, cursor=cursor)
+
+    async def _crawl_ids(self, state: dict, progress: CrawlProgress) -> None:
+        method = QUERY_METHODS[f"{self.entry_type}_id"]
+        selection = f"...{ENTRY_FRAGMENTS[self.entry_type]}"
+        window = self.concurrency * self._http.batch_size
+        next_id = state.get("next_id", self.start_id)
+        gap = state.get("gap", 0)
+        if self.end_id is not None:
+            progress.total = self.end_id - self.start_id + 1
+        while self.end_id is None or next_id <= self.end_id:
+            stop = next_id + window
+            if self.end_id is not None:
+                stop = min(stop, self.end_id + 1)
+            # Fetched in the same loop iteration, these get coalesced
+            # into `concurrency` batched requests sent side by side
+            results = await asyncio.gather(
+                *(
+                    self._http._load_node(method, selection, id)
+                    for id in range(next_id, stop)
+                )
+            )
+            nodes = [node for node in results if node]
+            for node in results:
+                gap = 0 if node else gap + 1
+            if nodes:
+                self.sink.write(self.entry_type, nodes)
+            progress.done += stop - next_id
+            progress.written += len(nodes)
+            next_id = stop
+            self._commit(progress, next_id=next_id, gap=gap)
+            if self.end_id is None and gap >= self.max_gap:
+                break
+
+    async def _crawl_updates(self, state: dict, progress: CrawlProgress) -> None:
+        if "since" in state:
+            # Keep the mark of the interrupted run, the sink already moved past it
+            since = state["since"] and parse_since(state["since"])
+        else:
+            since = self.since or self.sink.high_water_mark(self.entry_type)
+        __log__.info(f"Syncing {self.entry_type} updated since {since}")
+        paginator: Paginator[dict] = Paginator(
+            self._http,
+            ENTRY_UPDATES[self.entry_type],
+            {},
+            (self.entry_type,),
+            lambda node: node,
+            cache_key=None,
+            per_page=self.per_page,
+            after=state.get("cursor"),
+        )
+        pages = paginator.pages()
+        try:
+            async for nodes, cursor in pages:
+                fresh = nodes
+                if since is not None:
+                    # Entries updated in the same second as the mark are
+                    # stored again, upserting them twice is harmless
+                    fresh = [
+                        node
+                        for node in nodes
+                        if (_updated_at(node) or datetime.max) >= since
+                    ]
+                self.sink.write(self.entry_type, fresh)
+                for node in fresh:
+                    await self._http._invalidate_entry(self.entry_type, node["id"])
+                progress.done += len(fresh)
+                progress.written += len(fresh)
+                self._commit(
+                    progress,
+                    cursor=cursor,
+                    since=since.strftime(_TIMESTAMP) if since else None,
+                )
+                if len(fresh) < len(nodes):
+                    break
+        finally:
+            await pages.aclose()  # type: ignore
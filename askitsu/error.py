@@ -31,6 +31,7 @@ __all__ = (
     "NotAuthenticated",
     "BadApiRequest",
     "NotFound",
+    "NotFetched",
 )
 
 
@@ -117,3 +118,26 @@ class NotFound(HTTPError):
 
     def __init__(self) -> None:
         super().__init__(f"{Fore.RED}Resource not found.\n{Style.RESET_ALL}", 404)
+
+
+class NotFetched(AskitsuException, AttributeError):
+    """
+    Raises when accessing a field of a partially fetched model
+    that was left out of its `fields` projection
+
+    .. versionadded:: 1.1.0
+
+    Parameters
+    -----------
+    field: :class:`str`
+        Name of the field that was not fetched
+    """
+
+    def __init__(self, field: str, model: object) -> None:
+        self.field = field
+        super().__init__(
+            # Not the model's repr, which may read the missing field
+            f"{Fore.RED}{field!r} was not fetched for {type(model).__name__}.\n"
+            f"Add it to {Fore.YELLOW}`fields`{Fore.RED} or await "
+            f"{Fore.YELLOW}hydrate(){Fore.RED} to access it{Style.RESET_ALL}"
+        )
@@ -0,0 +1,828 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present ShomyKohai
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from array import array
+import heapq
+from collections import Counter
+from copy import copy
+from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import compress, repeat
+from operator import itemgetter, ne
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+    TypeVar,
+    Union,
+)
+
+from .error import InvalidArgument
+from .models.enums import Entries, LibraryEntryStatus, MediaType
+from .models.users import LibraryEntry
+from .utils import intern, parse_datetime
+
+if TYPE_CHECKING:
+    from .catalog import Catalog
+    from .http import HTTPClient
+    from .models.anime import Anime
+    from .models.manga import Manga
+    from .models.users import User
+
+__all__ = ("Frame", "EntryFrame", "LibraryFrame")
+
+T = TypeVar("T")
+F = TypeVar("F", bound="Frame")
+Reader = Optional[Callable[[dict], int]]
+
+# Stands for a missing value in the columns that can lack one
+MISSING = -1
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+# Below this many rows NumPy's overhead outweighs what it saves
+_VECTOR_ROWS = 128
+
+
+@lru_cache(maxsize=None)
+def _numpy() -> Any:
+    """NumPy if it's installed, None otherwise"""
+    try:
+        import numpy  # type: ignore
+    except ImportError:
+        return None
+    return numpy
+
+
+def _positions(rows: Any) -> array:
+    """Row positions computed by NumPy, as the array a frame keeps"""
+    positions = array("q")
+    positions.frombytes(rows.astype("q").tobytes())
+    return positions
+
+
+def _integer(key: str) -> Callable[[dict], int]:
+    return lambda node: node.get(key) or 0
+
+
+def _optional(key: str) -> Callable[[dict], int]:
+    def read(node: dict) -> int:
+        value = node.get(key)
+        return MISSING if value is None else value
+
+    return read
+
+
+def _timestamp(key: str) -> Callable[[dict], int]:
+    def read(node: dict) -> int:
+        date = parse_datetime(node.get(key))
+        return MISSING if date is None else (date - _EPOCH) // _SECOND
+
+    return read
+
+
+def _picker(indices: List[int]) -> Callable[[Sequence[Any]], Sequence[Any]]:
+    # itemgetter returns a bare item instead of a tuple for a single index
+    if len(indices) == 1:
+        index = indices[0]
+        return lambda sequence: (sequence[index],)
+    if not indices:
+        return lambda sequence: ()
+    return itemgetter(*indices)
+
+
+def _code(key: str, codes: Dict[str, int]) -> Callable[[dict], int]:
+    return lambda node: codes.get(node.get(key), MISSING)
+
+
+class _Pool(list):
+    """
+    Distinct strings of a pooled column, the code of a string being its
+    position. Only grows, so codes stay valid across frames.
+    """
+
+    __slots__ = ("_codes",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._codes: Dict[str, int] = {}
+
+    def code(self, value: Optional[str]) -> int:
+        if value is None:
+            return MISSING
+        try:
+            return self._codes[value]
+        except KeyError:
+            code = self._codes[value] = len(self)
+            self.append(intern(value))
+            return code
+
+
+def _pooled(pool: _Pool, *keys: str) -> Callable[[dict], int]:
+    # The first of the keys the node has (Ex. `animesub` or `mangasub`)
+    def read(node: dict) -> int:
+        for key in keys:
+            if key in node:
+                return pool.code(node[key])
+        return MISSING
+
+    return read
+
+
+class Frame(Generic[T]):
+    """
+    Rows of the same kind stored as columns, every column a typed
+    :class:`array.array` instead of one Python object per row.
+    Filtering, sorting and aggregations run over the columns, and the
+    objects of the rows are only built when indexed or iterated.
+
+    A column is read from the fetched data the first time it's used,
+    so only the columns needed by the computations are ever built.
+    The frames returned by :meth:`filter`, :meth:`sort`, :meth:`top` and
+    :meth:`take` only hold the positions of their rows, and copy the
+    columns they use from the frame they come from.
+
+    Coded columns (Ex. `status`) hold the position of the value in
+    their enum or in the pool of the strings seen in that column,
+    and columns that can lack a value use :attr:`MISSING` (``-1``)
+    for it. Aggregations skip missing values.
+
+    With NumPy installed, :meth:`filter`, :meth:`sort` and :meth:`top`
+    run on the columns as NumPy arrays (boolean masks and stable sorts
+    over views of the same memory) once a frame has 128 rows or more,
+    and :meth:`to_numpy` exposes the columns without copying them.
+    Without it they run in pure Python, with the same results.
+
+    .. versionadded:: 1.1.0
+    """
+
+    __slots__ = ("_nodes", "_columns", "_parent", "_rows")
+
+    MISSING: ClassVar[int] = MISSING
+    # Typecode of every column, and how to read its value from a node
+    _schema: ClassVar[Dict[str, Tuple[str, Reader]]] = {}
+    # Columns that can hold MISSING
+    _nullable: ClassVar[Tuple[str, ...]] = ()
+    # Enum members or pooled strings of the coded columns, by code
+    _codes: ClassVar[Dict[str, Sequence[Any]]] = {}
+
+    def __init__(
+        self, nodes: Optional[List[dict]], columns: Optional[Dict[str, array]] = None
+    ) -> None:
+        # Without nodes every column is given, and rows are loaded elsewhere
+        self._nodes = nodes
+        # Columns built so far
+        self._columns: Dict[str, array] = columns if columns is not None else {}
+        # The frame the rows were taken from, and their positions in it
+        self._parent: Optional[Frame[T]] = None
+        self._rows: Optional[array] = None
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} rows={len(self)} columns={self.columns}>"
+
+    def __len__(self) -> int:
+        if self._rows is not None:
+            return len(self._rows)
+        if self._nodes is None:
+            return len(self._columns["id"])
+        return len(self._nodes)
+
+    def __getitem__(self, key: Union[str, int, slice]) -> Any:
+        if isinstance(key, str):
+            return self.column(key)
+        if isinstance(key, slice):
+            return self.take(range(len(self))[key])
+        return self._get(range(len(self))[key])
+
+    def __iter__(self) -> Iterator[T]:
+        return map(self._get, range(len(self)))
+
+    def _get(self, index: int) -> T:
+        if self._parent is not None:
+            return self._parent._get(self._rows[index])  # type: ignore
+        return self._row(index)
+
+    def _row(self, index: int) -> T:
+        raise NotImplementedError
+
+    def _read(self, name: str, typecode: str, read: Reader) -> array:
+        return array(typecode, map(read, self._nodes))  # type: ignore
+
+    def _resolve(self) -> Tuple[Frame[T], Sequence[int]]:
+        """The frame holding the rows, and their positions in it"""
+        if self._parent is None:
+            return self, range(len(self))
+        root, rows = self._parent._resolve()
+        return root, _picker(self._rows)(rows)  # type: ignore
+
+    @classmethod
+    def _join(cls, parts: List[Tuple[Any, Sequence[int]]]) -> Any:
+        nodes: List[dict] = []
+        for root, rows in parts:
+            nodes.extend(_picker(rows)(root._nodes))
+        return cls(nodes)
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        """Names of the columns"""
+        return tuple(self._schema)
+
+    def column(self, name: str) -> array:
+        """
+        The array of a column. It's shared with the frame,
+        so it must not be changed.
+        """
+        try:
+            return self._columns[name]
+        except KeyError:
+            pass
+        if self._parent is not None:
+            source = self._parent.column(name)
+            column = array(source.typecode, _picker(self._rows)(source))  # type: ignore
+        else:
+            try:
+                typecode, read = self._schema[name]
+            except KeyError:
+                raise InvalidArgument(
+                    f"{name!r} is not a column of {type(self).__name__}"
+                ) from None
+            column = self._read(name, typecode, read)
+        self._columns[name] = column
+        return column
+
+    def _encode(self, name: str, value: Any) -> int:
+        members = self._codes.get(name)
+        if members is None or isinstance(value, int):
+            return value
+        if isinstance(members, _Pool):
+            return members.code(value)
+        try:
+            return members.index(type(members[0])(value))
+        except ValueError:
+            raise InvalidArgument(f"{value!r} is not a value of {name!r}") from None
+
+    def _vectors(self) -> Any:
+        """NumPy, if it's installed and the frame is big enough to gain from it"""
+        return _numpy() if len(self) >= _VECTOR_ROWS else None
+
+    def _vector(self, numpy: Any, name: str) -> Any:
+        column = self.column(name)
+        return numpy.frombuffer(column, dtype=column.typecode)
+
+    def take(self: F, indices: Iterable[int]) -> F:
+        """A new frame with the given rows, in the given order"""
+        frame = copy(self)
+        frame._nodes = None
+        frame._columns = {}
+        frame._parent = self
+        frame._rows = array("q", indices)
+        return frame
+
+    def filter(self: F, mask: Optional[Iterable[Any]] = None, **equals: Any) -> F:
+        """
+        A new frame with the rows where `mask` is true, and every column
+        given as keyword equals the value, or one of the values
+        if a list, tuple or set is given.
+
+        .. code-block:: python3
+
+            frame.filter(status=LibraryEntryStatus.COMPLETED)
+            frame.filter(rating > 14 for rating in frame["rating"])
+            frame.filter(frame.to_numpy("progress") > 0)  # With NumPy
+
+        With NumPy the mask and the conditions are applied as boolean
+        arrays over the columns.
+        """
+        numpy = self._vectors()
+        if numpy is not None:
+            return self.take(_positions(self._filter_vectors(numpy, mask, equals)))
+        rows: Sequence[int] = range(len(self))
+        if mask is not None:
+            rows = list(compress(rows, mask))
+        # Every condition only looks at the rows left by the previous ones
+        for name, value in equals.items():
+            if not isinstance(value, (list, tuple, set, frozenset)):
+                value = (value,)
+            wanted = {self._encode(name, item) for item in value}
+            column = self.column(name)
+            values = (
+                column if isinstance(rows, range) else map(column.__getitem__, rows)
+            )
+            rows = list(compress(rows, map(wanted.__contains__, values)))
+        return self.take(rows)
+
+    def _filter_vectors(
+        self, numpy: Any, mask: Optional[Iterable[Any]], equals: Dict[str, Any]
+    ) -> Any:
+        rows = numpy.arange(len(self))
+        if mask is not None:
+            if not isinstance(mask, numpy.ndarray):
+                mask = numpy.fromiter(map(bool, mask), bool)
+            # Like compress, stop at the end of the shortest
+            mask = mask.astype(bool, copy=False)[: len(self)]
+            rows = rows[: len(mask)][mask]
+        for name, value in equals.items():
+            if not isinstance(value, (list, tuple, set, frozenset)):
+                value = (value,)
+            wanted = [self._encode(name, item) for item in value]
+            values = self._vector(numpy, name)[rows]
+            if len(wanted) > 8:
+                rows = rows[numpy.isin(values, wanted)]
+                continue
+            # isin has a fixed cost that a few comparisons avoid
+            keep = values == wanted[0]
+            for item in wanted[1:]:
+                keep |= values == item
+            rows = rows[keep]
+        return rows
+
+    def sort(self: F, *by: str, reverse: bool = False) -> F:
+        """
+        A new frame sorted by the given columns.
+        Missing values come first, or last with `reverse`.
+        The sort is stable: rows with equal values keep their order.
+
+        With NumPy the rows are ordered by :func:`numpy.lexsort`.
+        """
+        if not by:
+            raise InvalidArgument("sort needs at least one column")
+        numpy = self._vectors()
+        if numpy is not None:
+            keys = [self._vector(numpy, name) for name in by]
+            if not reverse:
+                return self.take(_positions(numpy.lexsort(keys[::-1])))
+            # Sorting the rows backwards then reversing the order
+            # keeps equal rows in their order, like sorted does
+            order = numpy.lexsort([key[::-1] for key in keys[::-1]])
+            return self.take(_positions((len(self) - 1 - order)[::-1]))
+        columns = [self.column(name) for name in by]
+        if len(columns) == 1:
+            key = columns[0].__getitem__
+        else:
+            key = lambda index: tuple(column[index] for column in columns)  # noqa
+        return self.take(sorted(range(len(self)), key=key, reverse=reverse))
+
+    def _present(self, name: str) -> Iterable[int]:
+        rows: Iterable[int] = range(len(self))
+        if name in self._nullable:
+            rows = compress(rows, map(ne, self.column(name), repeat(MISSING)))
+        return rows
+
+    def top(self: F, name: str, k: int = 10, *, smallest: bool = False) -> F:
+        """
+        A new frame with the `k` rows with the biggest values of a column,
+        or the smallest ones (Ex. for ranks), best first.
+        Rows missing the value are left out, and rows with equal values
+        keep their order.
+
+        With NumPy the present rows are picked with a boolean mask and
+        ordered with a stable :func:`numpy.argsort`.
+        """
+        numpy = self._vectors()
+        if numpy is not None:
+            values = self._vector(numpy, name)
+            rows = numpy.arange(len(self))
+            if name in self._nullable:
+                rows = rows[values != MISSING]
+                values = values[rows]
+            if smallest:
+                order = numpy.argsort(values, kind="stable")
+            else:
+                order = numpy.argsort(values[::-1], kind="stable")
+                order = (len(values) - 1 - order)[::-1]
+            return self.take(_positions(rows[order[: max(k, 0)]]))
+        column = self.column(name)
+        select = heapq.nsmallest if smallest else heapq.nlargest
+        return self.take(select(k, self._present(name), key=column.__getitem__))
+
+    def _total(self, name: str) -> Tuple[int, int]:
+        column = self.column(name)
+        total, count = sum(column), len(column)
+        if name in self._nullable:
+            missing = column.count(MISSING)
+            total, count = total - MISSING * missing, count - missing
+        return total, count
+
+    def sum(self, name: str) -> int:
+        """Sum of a column"""
+        return self._total(name)[0]
+
+    def mean(self, name: str) -> Optional[float]:
+        """Mean of a column, ``None`` if it has no values"""
+        total, count = self._total(name)
+        return total / count if count else None
+
+    def count_by(self, name: str) -> Dict[Any, int]:
+        """
+        How many rows have each value of a column,
+        with the enum member or the string as key for the coded columns.
+        """
+        counts = Counter(self.column(name))
+        if name in self._nullable:
+            counts.pop(MISSING, None)
+        members = self._codes.get(name)
+        if members is None:
+            return dict(counts)
+        return {members[code]: count for code, count in counts.items()}
+
+    def sum_by(self, name: str, by: str) -> Dict[Any, int]:
+        """Sum of a column for every value of the `by` column"""
+        sums: Dict[Any, int] = {}
+        skip = name in self._nullable
+        for value, key in zip(self.column(name), self.column(by)):
+            if skip and value == MISSING:
+                continue
+            sums[key] = sums.get(key, 0) + value
+        members = self._codes.get(by)
+        if members is None:
+            return sums
+        return {members[code]: total for code, total in sums.items()}
+
+    def weighted_sum(
+        self, name: str, weights: Mapping[int, float], by: str = "media_id"
+    ) -> float:
+        """
+        Sum of a column, every value multiplied by the weight of the
+        value of the `by` column in its row (0 if it has none)
+
+        .. code-block:: python3
+
+            # Minutes watched, with the episode length of every anime
+            frame.weighted_sum("progress", lengths)
+        """
+        get = weights.get
+        skip = name in self._nullable
+        return sum(
+            value * get(key, 0)
+            for value, key in zip(self.column(name), self.column(by))
+            if not (skip and value == MISSING)
+        )
+
+    def to_numpy(self, name: Optional[str] = None) -> Any:
+        """
+        A column as a NumPy array sharing the memory of the frame,
+        or a dict with all of them if no name is given.
+        Needs NumPy installed.
+        """
+        try:
+            import numpy  # type: ignore
+        except ImportError:
+            raise ImportError("to_numpy needs NumPy: pip install numpy") from None
+        names = self.columns if name is None else (name,)
+        arrays = {key: self._vector(numpy, key) for key in names}
+        return arrays if name is None else arrays[name]
+
+    @classmethod
+    def concat(cls, frames: Iterable[F]) -> F:
+        """
+        A frame with the rows of all the frames, in order.
+        Useful to aggregate the libraries of many users at once.
+        """
+        frames = list(frames)
+        parts = [frame._resolve() for frame in frames]
+        roots = {id(root) for root, _ in parts}
+        if len(roots) == 1:
+            # Rows of the same frame, taken again from it
+            root = parts[0][0]
+            return root.take(row for _, rows in parts for row in rows)
+        frame = cls._join(parts)
+        # Keep the columns every frame has already built,
+        # and the ones that can't be read again
+        for name, (typecode, read) in cls._schema.items():
+            if (
+                frame._nodes is None
+                or read is None
+                or all(name in part._columns for part in frames)
+            ):
+                column = frame._columns[name] = array(typecode)
+                for part in frames:
+                    column.extend(part.column(name))
+        return frame
+
+
+_STATUSES = tuple(LibraryEntryStatus)
+_MEDIA_TYPES = tuple(MediaType)
+_STATUS_CODES = {status.value: code for code, status in enumerate(_STATUSES)}
+_MEDIA_CODES = {media.value: code for code, media in enumerate(_MEDIA_TYPES)}
+
+
+class LibraryFrame(Frame[LibraryEntry]):
+    """
+    Library entries as columns, returned by :meth:`User.library`
+    with ``frame=True``
+
+    .. versionadded:: 1.1.0
+
+    Columns
+    ---------
+    id, user_id, media_id
+        IDs of the entry, of its user and of the linked media
+    media_type
+        Code of the :class:`MediaType` of the media
+    status
+        Code of the :class:`LibraryEntryStatus`
+    progress, reconsume_count
+        Progress in the media and number of reconsumes
+    rating
+        Rating given by the user, :attr:`MISSING` if not rated
+    created_at, progressed_at, finished_at
+        Seconds since the epoch (UTC), :attr:`MISSING` if unset
+
+    Example
+    ---------
+    .. code-block:: python3
+
+        frame = await user.library(MediaType.ANIME, limit=2000, frame=True)
+        completed = frame.filter(status=LibraryEntryStatus.COMPLETED)
+        print(len(completed) / len(frame), frame.mean("rating"))
+        print(frame.count_by("rating"))  # Rating histogram
+        for entry in frame.sort("progressed_at", reverse=True)[:5]:
+            print(await entry.media)  # LibraryEntry built here
+    """
+
+    __slots__ = ("_users", "_http")
+
+    _schema = {
+        "id": ("q", lambda node: int(node["id"])),
+        # Read from the users of the rows
+        "user_id": ("q", None),
+        "media_id": ("q", lambda node: int(node["media"]["id"])),
+        "media_type": (
+            "b",
+            lambda node: _MEDIA_CODES.get(node["media"]["type"].upper(), MISSING),
+        ),
+        "status": ("b", _code("status", _STATUS_CODES)),
+        "progress": ("i", _integer("progress")),
+        "reconsume_count": ("i", _integer("reconsumeCount")),
+        "rating": ("h", _optional("rating")),
+        "created_at": ("q", _timestamp("createdAt")),
+        "progressed_at": ("q", _timestamp("progressedAt")),
+        "finished_at": ("q", _timestamp("finishedAt")),
+    }
+    _nullable = ("rating", "created_at", "progressed_at", "finished_at")
+    _codes = {"status": _STATUSES, "media_type": _MEDIA_TYPES}
+
+    def __init__(
+        self,
+        nodes: List[dict],
+        users: List[User],
+        http: HTTPClient,
+    ) -> None:
+        super().__init__(nodes)
+        self._users = users
+        self._http = http
+
+    @classmethod
+    def from_nodes(
+        cls, nodes: List[dict], user: User, http: HTTPClient
+    ) -> LibraryFrame:
+        """A frame of the library entry nodes of a response"""
+        return cls(nodes, [user] * len(nodes), http)
+
+    def _row(self, index: int) -> LibraryEntry:
+        return LibraryEntry(
+            self._nodes[index], self._users[index], self._http  # type: ignore
+        )
+
+    def _read(self, name: str, typecode: str, read: Reader) -> array:
+        if read is None:
+            return array(typecode, [user.id for user in self._users])
+        return super()._read(name, typecode, read)
+
+    @classmethod
+    def _join(cls, parts: List[Tuple[LibraryFrame, Sequence[int]]]) -> LibraryFrame:
+        nodes: List[dict] = []
+        users: List[User] = []
+        for root, rows in parts:
+            pick = _picker(rows)
+            nodes.extend(pick(root._nodes))
+            users.extend(pick(root._users))
+        http = parts[0][0]._http if parts else None
+        return cls(nodes, users, http)  # type: ignore
+
+    @property
+    def entries(self) -> List[LibraryEntry]:
+        """All the rows as :class:`LibraryEntry`, built on every access"""
+        return list(self)
+
+
+_ENTRY_TYPES = (Entries.ANIME, Entries.MANGA)
+_ENTRY_STATUSES = _Pool()
+_AGE_RATINGS = _Pool()
+_SUBTYPES = _Pool()
+
+
+class EntryFrame(Frame["Union[Anime, Manga]"]):
+    """
+    Anime and manga as columns, to rank and filter many entries without
+    building an object for each one
+
+    Returned by :meth:`Client.get_trending_entry` with ``frame=True`` and
+    by :meth:`Catalog.frame`, or built from fetched entries with
+    :meth:`from_entries`.
+
+    .. versionadded:: 1.1.0
+
+    Columns
+    ---------
+    id
+        ID of the entry
+    entry_type
+        Code of the :class:`Entries` of the entry
+    status, age_rating, subtype
+        Pooled strings, the values are in :meth:`count_by` and the
+        filters take them as is (Ex. ``status="finished"``)
+    rating
+        Rating from the community, from 0 to 100
+    rating_rank, popularity_rank
+        Positions of the entry, 1 being the best
+    episode_count, episode_length, total_length
+        Number of episodes and their length in minutes, for anime
+    chapter_count, volume_count
+        Number of chapters and volumes, for manga
+    nsfw
+        1 if the anime is NSFW
+    started_at, ended_at, updated_at
+        Seconds since the epoch (UTC)
+
+    All but `id` and `entry_type` are :attr:`MISSING` when unknown.
+
+    :meth:`filter`, :meth:`sort` and :meth:`top` are the ones of
+    :class:`Frame`: with NumPy installed they run vectorised over the
+    columns, `rating` and the pooled strings included, so ranking a whole
+    catalog doesn't loop in Python.
+
+    Example
+    ---------
+    .. code-block:: python3
+
+        frame = catalog.frame(askitsu.Entries.ANIME, client)
+        airing = frame.filter(status="current", subtype=["TV", "ONA"])
+        for anime in airing.top("popularity_rank", 10, smallest=True):
+            print(anime.canonical_title)  # Anime built here
+    """
+
+    __slots__ = ("_http", "_catalog")
+
+    _schema = {
+        "id": ("q", lambda node: int(node["id"])),
+        # Given when the frame is built
+        "entry_type": ("b", None),
+        "status": ("h", _pooled(_ENTRY_STATUSES, "status")),
+        "age_rating": ("h", _pooled(_AGE_RATINGS, "ageRating")),
+        "subtype": ("h", _pooled(_SUBTYPES, "animesub", "mangasub")),
+        "rating": ("d", _optional("averageRating")),
+        "rating_rank": ("i", _optional("averageRatingRank")),
+        "popularity_rank": ("i", _optional("userCountRank")),
+        "episode_count": ("i", _optional("episodeCount")),
+        "episode_length": ("i", _optional("episodeLength")),
+        "total_length": ("i", _optional("totalLength")),
+        "chapter_count": ("i", _optional("chapterCount")),
+        "volume_count": ("i", _optional("volumeCount")),
+        "nsfw": (
+            "b",
+            lambda node: MISSING if node.get("sfw") is None else not node["sfw"],
+        ),
+        "started_at": ("q", _timestamp("startDate")),
+        "ended_at": ("q", _timestamp("endDate")),
+        "updated_at": ("q", _timestamp("updatedAt")),
+    }
+    _nullable = tuple(name for name in _schema if name not in ("id", "entry_type"))
+    _codes = {
+        "entry_type": _ENTRY_TYPES,
+        "status": _ENTRY_STATUSES,
+        "age_rating": _AGE_RATINGS,
+        "subtype": _SUBTYPES,
+    }
+
+    def __init__(
+        self,
+        nodes: Optional[List[dict]],
+        http: HTTPClient,
+        columns: Dict[str, array],
+        catalog: Optional[Catalog] = None,
+    ) -> None:
+        super().__init__(nodes, columns)
+        self._http = http
+        # Where the rows are loaded from when the nodes aren't kept
+        self._catalog = catalog
+
+    @staticmethod
+    def _types(entry_type: str, count: int) -> array:
+        return array("b", [_ENTRY_TYPES.index(Entries(entry_type))]) * count
+
+    @classmethod
+    def from_nodes(
+        cls, entry_type: str, nodes: List[dict], http: HTTPClient
+    ) -> EntryFrame:
+        """
+        A frame of the anime or manga nodes of a response,
+        kept to build the rows
+        """
+        return cls(nodes, http, {"entry_type": cls._types(entry_type, len(nodes))})
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Union[Anime, Manga]]) -> EntryFrame:
+        """
+        A frame of fetched entries, Ex. the results of a search.
+        The rows are built again from the data of the entries, so they
+        can't come from a slim :class:`Client`.
+        """
+        nodes = []
+        types = array("b")
+        http = None
+        for entry in entries:
+            if entry._http.slim:
+                raise InvalidArgument("Slim entries can't be put in a frame")
+            http = entry._http
+            nodes.append(entry._attributes)
+            types.append(_ENTRY_TYPES.index(Entries(entry.entry_type)))
+        return cls(nodes, http, {"entry_type": types})  # type: ignore
+
+    @classmethod
+    def from_catalog(
+        cls, catalog: Catalog, entry_type: str, http: HTTPClient
+    ) -> EntryFrame:
+        """
+        A frame of every stored entry of a type. Only the columns are
+        kept in memory, the rows are loaded back from the catalog.
+        """
+        readers = [
+            (name, read) for name, (_, read) in cls._schema.items() if read is not None
+        ]
+        values: Dict[str, list] = {name: [] for name, _ in readers}
+        for node in catalog.nodes(entry_type):
+            for name, read in readers:
+                values[name].append(read(node))
+        columns = {
+            name: array(cls._schema[name][0], column) for name, column in values.items()
+        }
+        columns["entry_type"] = cls._types(entry_type, len(columns["id"]))
+        return cls(None, http, columns, catalog)
+
+    def entry_type_of(self, index: int) -> Entries:
+        """The type of the entry of a row"""
+        return _ENTRY_TYPES[self.column("entry_type")[index]]
+
+    def _row(self, index: int) -> Union[Anime, Manga]:
+        entry_type = self.entry_type_of(index).value
+        if self._nodes is not None:
+            node = self._nodes[index]
+        else:
+            id = self._columns["id"][index]
+            node = self._catalog.get(entry_type, id)  # type: ignore
+            if node is None:
+                raise KeyError(f"Entry {id} left the catalog")
+        return self._http._entries[entry_type](
+            attributes=node, http=self._http, cache=self._http._cache
+        )
+
+    @classmethod
+    def _join(cls, parts: List[Tuple[EntryFrame, Sequence[int]]]) -> EntryFrame:
+        # Frames without nodes must come from the same catalog
+        nodes: Optional[List[dict]] = []
+        for root, rows in parts:
+            if root._nodes is None:
+                nodes = None
+                break
+            nodes.extend(_picker(rows)(root._nodes))  # type: ignore
+        http = parts[0][0]._http if parts else None
+        catalog = next((root._catalog for root, _ in parts if root._catalog), None)
+        return cls(nodes, http, {}, catalog)  # type: ignore
+
+    @property
+    def entries(self) -> List[Union[Anime, Manga]]:
+        """All the rows as :class:`Anime` or :class:`Manga`, built on every access"""
+        return list(self)
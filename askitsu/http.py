@@ -1,23 +1,62 @@
 from __future__ import annotations
 
 import aiohttp
+import asyncio
+import json
 import logging
-from typing import Any, List, Optional, overload, TYPE_CHECKING, Union
+import time
+from concurrent.futures import Executor
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    overload,
+    Sequence,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+    TypeVar,
+    Union,
+)
 from . import __version__
 from .cache import Cache
 from .error import HTTPError, InvalidArgument
-from .queries import ENTRY_ID, ENTRY_ID_CHARACTERS, ENTRY_ID_REVIEWS, ENTRY_TITLE
+from .stats import StallStats
+from .stream import NodeStream
+from .utils import edit_distance, normalize
+from .queries import (
+    batch_by_id,
+    encode_body,
+    include as include_relations,
+    project,
+    relation_selection,
+    ENTRY_FRAGMENTS,
+    ENTRY_ID,
+    ENTRY_ID_CHARACTERS,
+    ENTRY_ID_REVIEWS,
+    ENTRY_TITLE,
+    QUERY_METHODS,
+)
 from .models.character import Character
 from .models.enums import Fetchable
 
 if TYPE_CHECKING:
+    from .catalog import Catalog
     from .models.anime import Anime
     from .models.core import Review
     from .models.manga import Manga
+    from .models.users import LibraryEntry
 
 __all__ = ("HTTPClient",)
 __log__ = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
 class HTTPClient:
     def __init__(
         self,
@@ -25,6 +64,14 @@ class HTTPClient:
         cache_expiration: int,
         entries: dict,
         token: str = None,
+        offload_threshold: int = 262144,
+        offload_nodes: int = 256,
+        executor: Optional[Executor] = None,
+        rate_limit: Optional[float] = None,
+        catalog: Optional[Catalog] = None,
+        offline: bool = False,
+        fuzzy: int = 0,
+        slim: bool = False,
     ) -> None:
         self.__authorization = f"Bearer {token}" if token else ""
         self.__session = session
@@ -38,76 +85,449 @@ class HTTPClient:
         self._cache: Cache = Cache(expiration=cache_expiration)
         self._cache_expiration = cache_expiration
         self.token: Optional[str] = token
+        # Responses bigger than this (in bytes) get decoded outside the event loop,
+        # lists longer than offload_nodes get their models built there as well
+        self.offload_threshold = offload_threshold
+        self.offload_nodes = offload_nodes
+        # Time the event loop spent on inline work
+        self.stall_stats = StallStats()
+        self._executor = executor
+        # Ids waiting to be fetched together, by root and selection
+        self._pending: Dict[Tuple[str, str], Dict[int, asyncio.Future]] = {}
+        # Flushes running, the loop only keeps a weak reference to them
+        self._flushes: Set[asyncio.Task] = set()
+        self.batch_size = 25
+        # Requests per second, None means unlimited
+        self.rate_limit = rate_limit
+        self._next_slot = 0.0
+        # Local catalog searched before the API, or instead of it when offline
+        self.catalog = catalog
+        self.offline = offline
+        # Edit distance under which a cached search answers a similar query
+        self.fuzzy = fuzzy
+        # Normalised queries with a cached result, by type, limit and fields
+        self._searches: Dict[str, Dict[str, str]] = {}
+        # Whether models release the fetched tree once built
+        self.slim = slim
 
     @property
     def session(self) -> aiohttp.ClientSession:
         return self.__session
 
+    async def _throttle(self) -> None:
+        """Wait for the next free request slot when a rate limit is set"""
+        if not self.rate_limit:
+            return
+        now = asyncio.get_running_loop().time()
+        # Slots are reserved before sleeping, so concurrent callers queue up
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + 1 / self.rate_limit
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
     async def post_data(self, data: dict) -> Any:
+        await self._throttle()
         async with self.__session.post(
-            url="https://kitsu.app/api/graphql", json=data, headers=self.__headers
+            url="https://kitsu.app/api/graphql",
+            data=encode_body(data["query"], data.get("variables") or {}),
+            headers=self.__headers,
         ) as response:
             if response.status == 200:
                 __log__.info(
                     "Sent a request to Kitsu API"
                 )
-                return await response.json()
+                return await self._decode(await response.read())
             else:
                 raise HTTPError("Something went wrong.", response.status)
 
-    async def _search_entry(
-        self, entry_type: Fetchable, query: str, limit: int, method: str
-    ):
-        cache_res = await self._cache.get(
-            f"{entry_type.value}_{query.replace(' ', '_')}_{limit}"
+    async def stream_nodes(
+        self, data: dict, path: Sequence[str]
+    ) -> AsyncIterator[dict]:
+        """Send a request and yield the nodes found at `path` while
+        the response is still being received"""
+        await self._throttle()
+        async with self.__session.post(
+            url="https://kitsu.app/api/graphql",
+            data=encode_body(data["query"], data.get("variables") or {}),
+            headers=self.__headers,
+        ) as response:
+            if response.status != 200:
+                raise HTTPError("Something went wrong.", response.status)
+            __log__.info("Sent a streamed request to Kitsu API")
+            parser = NodeStream(path)
+            stats = self.stall_stats
+            async for chunk in response.content.iter_chunked(65536):
+                start = time.perf_counter()
+                nodes = parser.feed(chunk)
+                stats.record("stream", time.perf_counter() - start)
+                for node in nodes:
+                    yield node
+
+    async def _decode(self, body: bytes) -> Any:
+        if len(body) >= self.offload_threshold:
+            self.stall_stats.offloaded += 1
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, json.loads, body)
+        start = time.perf_counter()
+        data = json.loads(body)
+        self.stall_stats.record("decode", time.perf_counter() - start)
+        return data
+
+    async def _build(self, factory: Callable[[dict], T], nodes: List[dict]) -> List[T]:
+        """Build a model for every node, moving the work off the event loop
+        when the list is long enough to stall it"""
+        return await self._offload(lambda: [factory(node) for node in nodes], nodes)
+
+    async def _offload(self, work: Callable[[], T], nodes: List[dict]) -> T:
+        """Run `work` over `nodes`, in the executor when they are enough
+        to stall the event loop"""
+        if len(nodes) < self.offload_nodes:
+            start = time.perf_counter()
+            result = work()
+            self.stall_stats.record("build", time.perf_counter() - start)
+            return result
+        self.stall_stats.offloaded += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, work)
+
+    @staticmethod
+    def _project(
+        query: str, fragment: Optional[str], fields: Optional[Iterable[str]]
+    ) -> str:
+        """Reduce the `fragment` selection of a query to `fields`"""
+        if fields is None:
+            return query
+        try:
+            return project(query, fragment, frozenset(fields))  # type: ignore
+        except KeyError as e:
+            raise InvalidArgument(f"{e.args[0]!r} is not a valid field") from None
+
+    @staticmethod
+    def _fields_key(fields: Optional[Iterable[str]]) -> str:
+        """Cache key suffix that keeps projected results apart from full ones"""
+        return f"_fields_{'-'.join(sorted(set(fields)))}" if fields is not None else ""
+
+    @staticmethod
+    def _search_key(entry_type: str, query: str) -> str:
+        """Cache key prefix shared by every spelling of the same query"""
+        return f"{entry_type}_{normalize(query).replace(' ', '_')}"
+
+    async def _fuzzy_search(self, bucket: str, query: str) -> Optional[Any]:
+        """A cached result for a query close enough to `query`"""
+        searches = self._searches.get(bucket)
+        # Short queries are too close to each other to be trusted
+        limit = min(self.fuzzy, len(query) // 4)
+        if not searches or not limit:
+            return None
+        candidates = sorted(
+            (edit_distance(query, cached, limit), cached) for cached in searches
         )
+        for distance, cached in candidates:
+            if distance > limit:
+                break
+            cache_res = await self._cache.get(searches[cached])
+            if cache_res:
+                __log__.debug(f"Answered {query!r} with the results of {cached!r}")
+                return cache_res.value
+            # Expired in the meantime
+            del searches[cached]
+        return None
+
+    def _search_cache_key(
+        self, entry_type: str, query: str, limit: int, fields: Optional[Iterable[str]]
+    ) -> str:
+        return f"{self._search_key(entry_type, query)}_{limit}{self._fields_key(fields)}"
+
+    @staticmethod
+    def _unwrap(results: List[T]) -> Optional[Union[T, List[T]]]:
+        """Search methods return a single result on its own"""
+        if not results:
+            return None
+        return results if len(results) > 1 else results[0]
+
+    async def _search_local(
+        self,
+        entry_type: str,
+        query: str,
+        limit: int,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Optional[list]:
+        """
+        Answer a search from the cache, a similar cached query or the catalog.
+        None means it has to be sent to the API.
+        """
+        cache_key = self._search_cache_key(entry_type, query, limit, fields)
+        cache_res = await self._cache.get(cache_key)
         if cache_res:
-            return cache_res.value if len(cache_res.value) > 1 else cache_res.value[0]
+            return cache_res.value
+        if self.fuzzy:
+            fetched = await self._fuzzy_search(
+                f"{entry_type}_{limit}{self._fields_key(fields)}", normalize(query)
+            )
+            if fetched:
+                return fetched
+        if self.catalog is not None:
+            nodes = self.catalog.search(entry_type, query, limit)
+            if nodes or self.offline:
+                __log__.debug(f"Answered {cache_key} from the local catalog")
+                entry = self._entries[entry_type]
+                return [
+                    entry(attributes=node, http=self, cache=self._cache)
+                    for node in nodes
+                ]
+        return None
+
+    async def _search_store(
+        self,
+        entry_type: str,
+        query: str,
+        limit: int,
+        fields: Optional[Iterable[str]],
+        fetched: list,
+    ) -> None:
+        if not fetched:
+            return
+        cache_key = self._search_cache_key(entry_type, query, limit, fields)
+        await self._cache.add(
+            cache_key,
+            fetched,
+            remove_after=self._cache_expiration,
+        )
+        if self.fuzzy:
+            bucket = f"{entry_type}_{limit}{self._fields_key(fields)}"
+            self._searches.setdefault(bucket, {})[normalize(query)] = cache_key
+        __log__.debug(f"Added {cache_key} to cache")
+
+    async def _search_entry(
+        self,
+        entry_type: Fetchable,
+        query: str,
+        limit: int,
+        method: str,
+        fields: Optional[Iterable[str]] = None,
+        include: Optional[Iterable[str]] = None,
+    ):
         try:
             entry = self._entries[entry_type.value]
         except (KeyError, TypeError):
             raise InvalidArgument
+        relations = self._relations(entry_type.value, include)
+        local = await self._search_local(entry_type.value, query, limit, fields)
+        if local is not None:
+            for found in local:
+                if await self._missing_relations(
+                    entry_type.value, found.id, relations
+                ):
+                    break
+            else:
+                return self._unwrap(local)
         variables = {"title": query, "limit": limit}
-        query_fetch = ENTRY_TITLE.get(method)
+        fragment = ENTRY_FRAGMENTS[entry_type.value]
+        query_fetch = ENTRY_TITLE[method]
+        if relations:
+            query_fetch = include_relations(
+                query_fetch, fragment, entry_type.value, relations
+            )
+        query_fetch = self._project(query_fetch, fragment, fields)
         data = await self.post_data(data={"query": query_fetch, "variables": variables})
         __log__.info(f"Sent request to Kitsu API: {method}")
         if not data["data"][method]:
             return None
-        fetched = [
-            entry(attributes=attributes, http=self, cache=self._cache)
-            for attributes in data["data"][method]["nodes"]
-        ]
-        await self._cache.add(
-            f"{entry_type.value}_{query.replace(' ', '_')}_{limit}",
-            fetched,
-            remove_after=self._cache_expiration,
+        nodes = data["data"][method]["nodes"]
+        fetched = await self._build(
+            lambda attributes: entry(
+                attributes=attributes, http=self, cache=self._cache
+            ),
+            nodes,
         )
-        __log__.debug(f"Added {entry_type.value}_{query.replace(' ', '_')}_{limit} to cache")
-        return fetched if len(fetched) > 1 else fetched[0]
+        if relations:
+            for found, attributes in zip(fetched, nodes):
+                await found._prime(attributes, relations)
+        await self._search_store(entry_type.value, query, limit, fields, fetched)
+        return self._unwrap(fetched)
 
-    async def _get_entry_fetch(self, entry_type: Fetchable, id: int, method: str):
-        cache_res = await self._cache.get(f"{entry_type.value}_{id}")
-        if cache_res:
-            return cache_res.value
+    def _relations(self, entry_type: str, include: Optional[Iterable[str]]) -> tuple:
+        """Validated, deduplicated relation names"""
+        if not include:
+            return ()
+        relations = tuple(dict.fromkeys(include))
+        known = getattr(self._entries.get(entry_type), "_relations", {})
+        for relation in relations:
+            if relation not in known:
+                raise InvalidArgument(f"{relation!r} is not a relation of {entry_type}")
+        return relations
+
+    async def _missing_relations(
+        self, entry_type: str, id: int, relations: tuple
+    ) -> tuple:
+        """The relations of an entry that aren't cached yet"""
+        known = self._entries[entry_type]._relations
+        missing = []
+        for relation in relations:
+            if not await self._cache.get(f"{entry_type}_{id}_{known[relation][1]}"):
+                missing.append(relation)
+        return tuple(missing)
+
+    async def _get_entry_fetch(
+        self,
+        entry_type: Fetchable,
+        id: int,
+        method: str,
+        fields: Optional[Iterable[str]] = None,
+        include: Optional[Iterable[str]] = None,
+    ):
         try:
             entry = self._entries[entry_type.value]
         except (KeyError, TypeError):
             raise InvalidArgument
-        variables = {"id": id}
-        query_fetch = ENTRY_ID.get(method)
-        data = await self.post_data(data={"query": query_fetch, "variables": variables})
-        if not data["data"][method]:
+        relations = self._relations(entry_type.value, include)
+        cache_key = f"{entry_type.value}_{id}{self._fields_key(fields)}"
+        cache_res = await self._cache.get(cache_key)
+        if relations:
+            relations = await self._missing_relations(entry_type.value, id, relations)
+        if cache_res:
+            # Only the relations can be missing
+            await self._load_relations(cache_res.value, relations)
+            return cache_res.value
+        fragment = ENTRY_FRAGMENTS[entry_type.value]
+        if fields is None:
+            selection = f"...{fragment}"
+            if relations:
+                selection += f" {relation_selection(entry_type.value, relations)}"
+            attributes = await self._load_node(method, selection, id)
+        else:
+            variables = {"id": id}
+            query_fetch = ENTRY_ID[method]
+            if relations:
+                query_fetch = include_relations(
+                    query_fetch, fragment, entry_type.value, relations
+                )
+            query_fetch = self._project(query_fetch, fragment, fields)
+            data = await self.post_data(
+                data={"query": query_fetch, "variables": variables}
+            )
+            attributes = data["data"][method]
+        if not attributes:
             return None
-        fetched_entry = entry(
-            attributes=data["data"][method], http=self, cache=self._cache
-        )
-        await self._cache.add(f"{entry_type.value}_{id}", fetched_entry)
-        __log__.debug(f"Added {entry_type.value}_{id} to cache")
+        fetched_entry = entry(attributes=attributes, http=self, cache=self._cache)
+        if relations:
+            await fetched_entry._prime(attributes, relations)
+        await self._cache.add(cache_key, fetched_entry)
+        __log__.debug(f"Added {cache_key} to cache")
         return fetched_entry
 
+    async def _store_entries(self, entry_type: str, nodes: List[dict]) -> None:
+        """
+        Cache entries fetched along with something else,
+        keeping the ones already cached
+        """
+        entry = self._entries[entry_type]
+        missing: Dict[str, dict] = {}
+        for node in nodes:
+            if node and not await self._cache.get(f"{entry_type}_{node['id']}"):
+                missing[node["id"]] = node
+        fetched = await self._build(
+            lambda attributes: entry(
+                attributes=attributes, http=self, cache=self._cache
+            ),
+            list(missing.values()),
+        )
+        for fetched_entry in fetched:
+            await self._cache.add(f"{entry_type}_{fetched_entry.id}", fetched_entry)
+
+    async def _load_media(self, entries: Iterable[LibraryEntry]) -> list:
+        """
+        The media of many library entries. The ones not cached are
+        fetched together through the batched node loader.
+        """
+        entries = list(entries)
+        unique: Dict[Tuple[str, int], LibraryEntry] = {}
+        for entry in entries:
+            unique.setdefault((entry.media_type, entry.media_id), entry)
+        fetched = await asyncio.gather(*(entry.media for entry in unique.values()))
+        media = dict(zip(unique, fetched))
+        return [media[(entry.media_type, entry.media_id)] for entry in entries]
+
+    async def _load_relations(
+        self, entry: Union[Anime, Manga], relations: Iterable[str]
+    ) -> None:
+        """
+        Fetch and cache the relations of an entry that aren't cached yet.
+        Entries loading the same relations together share batched requests.
+        """
+        missing = await self._missing_relations(
+            entry.entry_type, entry.id, self._relations(entry.entry_type, relations)
+        )
+        if not missing:
+            return
+        attributes = await self._load_node(
+            QUERY_METHODS[f"{entry.entry_type}_id"],
+            f"id {relation_selection(entry.entry_type, missing)}",
+            entry.id,
+        )
+        if attributes:
+            await entry._prime(attributes, missing)
+
+    async def _load_node(self, root: str, selection: str, id: int) -> Optional[dict]:
+        """
+        Fetch a single node by id. Every call made during the same loop
+        iteration for the same root is coalesced into batched requests.
+        """
+        key = (root, selection)
+        pending = self._pending.setdefault(key, {})
+        future = pending.get(int(id))
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not pending:
+                loop.call_soon(self._start_flush, key)
+            future = pending[int(id)] = loop.create_future()
+        return await asyncio.shield(future)
+
+    def _start_flush(self, key: Tuple[str, str]) -> None:
+        task = asyncio.ensure_future(self._flush(key))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, key: Tuple[str, str]) -> None:
+        pending = self._pending.pop(key, {})
+        ids = list(pending)
+        await asyncio.gather(
+            *(
+                self._flush_chunk(*key, ids[start : start + self.batch_size], pending)
+                for start in range(0, len(ids), self.batch_size)
+            )
+        )
+
+    async def _flush_chunk(
+        self,
+        root: str,
+        selection: str,
+        chunk: List[int],
+        pending: Dict[int, asyncio.Future],
+    ) -> None:
+        query = batch_by_id(root, selection, len(chunk))
+        variables = {f"i{n}": id for n, id in enumerate(chunk)}
+        try:
+            data = await self.post_data(data={"query": query, "variables": variables})
+            nodes = [data["data"][f"e{n}"] for n in range(len(chunk))]
+        except Exception as e:
+            for id in chunk:
+                pending[id].set_exception(e)
+            return
+        __log__.debug(f"Fetched {len(chunk)} {root} nodes in one request")
+        for id, node in zip(chunk, nodes):
+            pending[id].set_result(node)
+
+    async def _invalidate_entry(self, entry_type: str, id: int) -> None:
+        """Drop an entry, its projections and its relations from the cache"""
+        await self._cache.remove(f"{entry_type}_{id}")
+        await self._cache.remove_prefix(f"{entry_type}_{id}_")
+
     async def _get_reviews_fetch(
         self, entry: Union[Manga, Anime], method: str, limit: int = 1
     ) -> Optional[List[Review]]:
+        from .models.core import Review
+
         variables = {"id": entry.id, "limit": limit}
         query_fetch = ENTRY_ID_REVIEWS.get(method)
         data = await self.post_data(data={"query": query_fetch, "variables": variables})
@@ -129,10 +549,10 @@ class HTTPClient:
         data = await self.post_data(data={"query": query_fetch, "variables": variables})
         if not data["data"][method]:
             return None
-        character = [
-            Character(attributes, entry_id=entry.id)
-            for attributes in data["data"][method]["characters"]["nodes"]
-        ]
+        character = await self._build(
+            lambda attributes: Character._shared(attributes, entry.id),
+            data["data"][method]["characters"]["nodes"],
+        )
         await self._cache.add(f"{entry.entry_type}_characters", character)
         return character
 
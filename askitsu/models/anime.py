@@ -23,13 +23,15 @@ DEALINGS IN THE SOFTWARE.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import AsyncIterator, ClassVar, List, Optional, Union
+from weakref import WeakValueDictionary
 
 
 from .character import Character
 from .core import Category, Entry, Review
-from ..cache import Cache
-from ..http import HTTPClient
+from .numbered import NumberedList, _path
+from .serializable import Serializable
+from ..pagination import Paginator
 from ..queries import (
     ANIME_BY_ID_CATEGORIES,
     ANIME_BY_ID_CHARACTERS,
@@ -37,12 +39,14 @@ from ..queries import (
     ANIME_BY_ID_REVIEWS,
     ANIME_BY_ID_STREAMLINKS,
 )
+from ..spec import ANIME_SPEC
+from ..utils import intern
 
 
-__all__ = ("Anime", "StreamLink", "Episode")
+__all__ = ("Anime", "StreamLink", "Episode", "EpisodeList")
 
 
-class StreamLink:
+class StreamLink(Serializable):
     """
     Represent an :class:`Anime` stream link
 
@@ -61,17 +65,28 @@ class StreamLink:
         Name of the stream service
     """
 
-    __slots__ = ("id", "url", "subs", "dub", "name")
+    __slots__ = ("id", "url", "subs", "dub", "name", "__weakref__")
+
+    # Stream links alive, by id
+    _instances: ClassVar[WeakValueDictionary] = WeakValueDictionary()
 
     def __init__(self, attributes: dict):
         self.id: int = int(attributes["id"])
-        self.name: str = attributes["streamer"]["siteName"]
+        self.name: str = intern(attributes["streamer"]["siteName"])
         self.url: str = attributes["url"]
-        self.subs: list = attributes["subs"]
-        self.dub: list = attributes["dubs"]
+        self.subs: list = [intern(language) for language in attributes["subs"]]
+        self.dub: list = [intern(language) for language in attributes["dubs"]]
+
+    @classmethod
+    def _shared(cls, attributes: dict) -> "StreamLink":
+        """The stream link already built for this id if there's one alive"""
+        link = cls._instances.get(attributes["id"])
+        if link is None:
+            link = cls._instances[attributes["id"]] = cls(attributes)
+        return link
 
 
-class Episode:
+class Episode(Serializable):
     """
     Represent an :class:`Anime` episode
 
@@ -105,17 +120,42 @@ class Episode:
         "number",
         "length",
         "thumbnail",
-        "_attributes",
     )
 
     def __init__(self, attributes: dict) -> None:
-        self._attributes = attributes
         self.id: int = int(attributes["id"])
         self.description: str = attributes["description"]
         self.title: str = attributes["titles"]["canonical"]
         self.number: int = attributes["number"]
         self.length: int = attributes["length"]
-        self.thumbnail: str = attributes["thumbnail"]["original"]["url"]
+        try:
+            self.thumbnail: Optional[str] = attributes["thumbnail"]["original"]["url"]
+        except (KeyError, TypeError):
+            self.thumbnail = None
+
+
+class EpisodeList(NumberedList[Episode]):
+    """
+    The episodes of an :class:`Anime`, stored compactly.
+    Every item is an :class:`Episode` built on access.
+
+    .. versionadded:: 1.1.0
+    """
+
+    __slots__ = ()
+
+    _model = Episode
+    _integer_fields = (
+        ("id", lambda node: int(node["id"])),
+        ("number", _path("number")),
+        ("length", _path("length")),
+    )
+    _text_fields = (
+        ("title", _path("titles", "canonical")),
+        ("description", _path("description")),
+        ("thumbnail", _path("thumbnail", "original", "url")),
+    )
+    _number = "number"
 
 
 class Anime(Entry):
@@ -214,49 +254,43 @@ class Anime(Entry):
         --------------
         Use :meth:`askitsu.Client.get_characters` if you want to set a limit\n
         The limit with this property is automatically set to 20 (The highest)
+
+    season: Optional[Literal['WINTER', 'SPRING', 'SUMMER', 'FALL']]
+        The season the anime started airing in
+
+        .. versionadded:: 1.1.0
+
+    partial: :class:`bool`
+        If the entry was fetched with a `fields` projection.
+        Accessing a field that was left out raises :class:`NotFetched`
+
+        .. versionadded:: 1.1.0
     """
 
     __slots__ = (
-        "id",
-        "entry_type",
-        "status",
-        "slug",
-        "description",
-        "canonical_title",
         "episode_count",
         "episode_length",
         "total_length",
         "nsfw",
         "yt_id",
-        "rating_rank",
-        "popularity_rank",
-        "rating",
-        "age_rating",
-        "subtype",
-        "_http",
-        "_titles",
-        "_attributes",
-        "_cache",
+        "season",
     )
 
-    def __init__(self, attributes: dict, http: HTTPClient, cache: Cache) -> None:
-        self.entry_type = "anime"
-        self.episode_count: int = attributes["episodeCount"]
-        self.episode_length: int = attributes["episodeLength"]
-        self.total_length: int = attributes["totalLength"]
-        self.nsfw: bool = not attributes["sfw"]
-        self.yt_id: Optional[str] = attributes["youtubeTrailerVideoId"]
-        self.subtype: str = attributes["animesub"]
-        super().__init__(
-            _id=attributes["id"],
-            _type=self.entry_type,
-            attributes=attributes,
-            http=http,
-            cache=cache,
-        )
+    entry_type = "anime"
+    _spec = ANIME_SPEC
+    _relations = {
+        **Entry._relations,
+        "stream_links": (
+            "streamingLinks",
+            "streamlinks",
+            lambda node, id: StreamLink._shared(node),
+        ),
+        # Same key as episodes() with the default limit
+        "episodes": ("episodes", "episodes_12", lambda node, id: Episode(node)),
+    }
 
     def __repr__(self) -> str:
-        return f"<Anime name='{self.canonical_title}' id={self.id}>"
+        return f"<Anime name='{getattr(self, 'canonical_title', None)}' id={self.id}>"
 
     @property
     def youtube_url(self) -> Optional[str]:
@@ -273,7 +307,7 @@ class Anime(Entry):
         )
         try:
             links = [
-                StreamLink(attributes=attributes)
+                StreamLink._shared(attributes)
                 for attributes in data["data"]["findAnimeById"]["streamingLinks"][
                     "nodes"
                 ]
@@ -293,7 +327,7 @@ class Anime(Entry):
             data={"query": ANIME_BY_ID_CATEGORIES, "variables": variables}
         )
         categories = [
-            Category(attributes)
+            Category._shared(attributes)
             for attributes in data["data"]["findAnimeById"]["categories"]["nodes"]
         ]
         await self._cache.add(
@@ -313,7 +347,7 @@ class Anime(Entry):
             data={"query": ANIME_BY_ID_CHARACTERS, "variables": variables}
         )
         characters = [
-            Character(attributes, entry_id=self.id)
+            Character._shared(attributes, self.id)
             for attributes in data["data"]["findAnimeById"]["characters"]["nodes"]
         ]
         await self._cache.add(
@@ -333,7 +367,9 @@ class Anime(Entry):
             for attributes in data["data"]["findAnimeById"]["reactions"]["nodes"]
         ]
 
-    async def episodes(self, limit: int = 12) -> List[Episode]:
+    async def episodes(
+        self, limit: int = 12, *, compact: bool = False
+    ) -> Union[List[Episode], EpisodeList]:
         """
         Returns a list of episodes
 
@@ -341,21 +377,72 @@ class Anime(Entry):
 
         limit: :class:`int`
             Limit of episodes to fetch. Defaults to 12.
+        compact: :class:`bool`
+            Return an :class:`EpisodeList` instead of a list, for long
+            series: it takes less memory and finds episodes by number
+            in logarithmic time.
+
+            .. versionadded:: 1.1.0
         """
-        cache_res = await self._cache.get(f"anime_{self.id}_episodes_{limit}")
+        cache_key = f"anime_{self.id}_episodes_{limit}{'_compact' if compact else ''}"
+        cache_res = await self._cache.get(cache_key)
         if cache_res:
             return cache_res.value
         variables = {"id": self.id, "limit": limit}
         data = await self._http.post_data(
             data={"query": ANIME_BY_ID_EPISODES, "variables": variables}
         )
-        episodes = [
-            Episode(attributes)
-            for attributes in data["data"]["findAnimeById"]["episodes"]["nodes"]
-        ]
+        nodes = data["data"]["findAnimeById"]["episodes"]["nodes"]
+        episodes: Union[List[Episode], EpisodeList]
+        if compact:
+            episodes = await self._http._offload(lambda: EpisodeList(nodes), nodes)
+        else:
+            episodes = await self._http._build(Episode, nodes)
         await self._cache.add(
-            f"anime_{self.id}_episodes_{limit}",
+            cache_key,
             episodes,
             remove_after=self._cache.expiration,
         )
         return episodes
+
+    def iter_episodes(
+        self, per_page: int = 20, limit: Optional[int] = None
+    ) -> Paginator[Episode]:
+        """
+        Iterate over all the episodes, page by page
+
+        .. versionadded:: 1.1.0
+
+        per_page: :class:`int`
+            Number of episodes fetched per request
+        limit: Optional[:class:`int`]
+            Stop after this many episodes
+        """
+        return Paginator(
+            self._http,
+            ANIME_BY_ID_EPISODES,
+            {"id": self.id},
+            ("findAnimeById", "episodes"),
+            Episode,
+            cache_key=f"anime_{self.id}_episodes",
+            per_page=per_page,
+            limit=limit,
+        )
+
+    async def stream_episodes(self, limit: int = 12) -> AsyncIterator[Episode]:
+        """
+        Same as :meth:`episodes`, but yields every episode as soon as
+        it has been received instead of waiting for the whole response.
+        Streamed episodes are not cached.
+
+        .. versionadded:: 1.1.0
+
+        limit: :class:`int`
+            Limit of episodes to fetch. Defaults to 12.
+        """
+        variables = {"id": self.id, "limit": limit}
+        async for attributes in self._http.stream_nodes(
+            data={"query": ANIME_BY_ID_EPISODES, "variables": variables},
+            path=("data", "findAnimeById", "episodes", "nodes"),
+        ):
+            yield Episode(attributes)
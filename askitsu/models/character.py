@@ -25,15 +25,19 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import ClassVar, Optional
+from weakref import WeakValueDictionary
+
 from .images import Image
+from .serializable import Serializable
 from ..cache import Cache
+from ..utils import intern
 
 
 __all__ = ("Character",)
 
 
-class Character:
+class Character(Serializable):
     """Represents a :class:`Character` istance
 
     .. versionadded:: 0.2.0
@@ -64,25 +68,38 @@ class Character:
         "slug",
         "description",
         "role",
-        "slug",
-        "_attributes",
+        "_image",
         "_cache",
+        "__weakref__",
     )
 
+    # Characters alive, by id and media
+    _instances: ClassVar[WeakValueDictionary] = WeakValueDictionary()
+
     def __init__(self, attributes: dict, entry_id: int = None, **kwargs):
         self._cache: Optional[Cache] = kwargs.pop("cache", None)
-        self._attributes = attributes
+        self._image: dict = attributes["character"]["image"]
         self.media_id = entry_id
         self.id: int = int(attributes["character"]["id"])
         self.type: str = "characters"
         self.name: str = attributes["character"]["names"]["canonical"]
         self.description: str = attributes["character"]["description"]
-        self.role: Optional[str] = attributes.get("role")
+        self.role: Optional[str] = intern(attributes.get("role"))
         self.slug: str = attributes["character"]["slug"]
 
+    @classmethod
+    def _shared(cls, attributes: dict, entry_id: Optional[int]) -> Character:
+        """The character already built for this media if there's one alive.
+        Characters aren't shared across media, as their role depends on it."""
+        key = (attributes["character"]["id"], entry_id)
+        character = cls._instances.get(key)
+        if character is None:
+            character = cls._instances[key] = cls(attributes, entry_id=entry_id)
+        return character
+
     def __repr__(self) -> str:
         return f"<Character name='{self.name}' media_id={self.media_id}>"
 
     @property
     def image(self) -> Image:
-        return Image(self._attributes["character"]["image"])
+        return Image(self._image)
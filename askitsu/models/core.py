@@ -26,18 +26,85 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Literal, Optional
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Optional, Tuple
+from weakref import WeakValueDictionary
 
 
 from .character import Character
+from .enums import Entries
 from .images import CoverImage, PosterImage
+from .serializable import Serializable
 from ..cache import Cache
+from ..error import NotFetched
 from ..http import HTTPClient
+from ..pagination import Paginator
+from ..queries import ENTRY_ID_CHARACTERS, ENTRY_ID_REVIEWS, QUERY_METHODS
+from ..spec import ENTRY_SPEC, Field, constructor
+from ..utils import intern, parse_datetime
 
 __all__ = ("Category", "Review", "Title", "Object")
 
 
-class Category:
+class Memoized(Serializable):
+    """
+    Base for models keeping the values derived from their raw
+    attributes (parsed dates...), computed on first access.
+    `_memo` has to be set to ``None`` by the constructor.
+
+    Slim models compute them up front instead: :meth:`_release` stores
+    the value of every property having a slot named after it
+    (``_created_at`` for ``created_at``) in that slot, then drops
+    `_attributes`.
+    """
+
+    __slots__ = ("_memo",)
+
+    _memo: Optional[Dict[str, Any]]
+    _attributes: Optional[dict]
+    # Properties kept in their slot by _release()
+    _kept: ClassVar[Tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._kept = tuple(
+            name
+            for name in dir(cls)
+            if isinstance(getattr(cls, name, None), property)
+            and hasattr(cls, f"_{name}")
+        )
+
+    def _release(self) -> None:
+        """Compute the kept properties into their slots, drop the raw attributes"""
+        for name in self._kept:
+            try:
+                value = getattr(self, name)
+            except (KeyError, NotFetched):
+                continue
+            setattr(self, f"_{name}", value)
+        self._attributes = None
+        self._memo = None
+
+    def _derived(self, name: str, compute: Callable[[], Any]) -> Any:
+        """:meth:`_memoized` for kept properties, read from their slot once released"""
+        if self._attributes is not None:
+            return self._memoized(name, compute)
+        try:
+            return getattr(self, f"_{name}")
+        except AttributeError:
+            raise NotFetched(name, self) from None
+
+    def _memoized(self, name: str, compute: Callable[[], Any]) -> Any:
+        memo = self._memo
+        if memo is None:
+            memo = self._memo = {}
+        try:
+            return memo[name]
+        except KeyError:
+            value = memo[name] = compute()
+            return value
+
+
+class Category(Memoized):
     """
     Represent a category of a media.
 
@@ -45,6 +112,10 @@ class Category:
 
     Attributes
     ------------
+    id: :class:`int`
+        ID of the category
+
+        .. versionadded:: 1.1.0
     title: :class:`str`
         Title of the category
     description: :class:`str`
@@ -55,40 +126,61 @@ class Category:
         If the category is NSFW or not
     """
 
-    __slots__ = ("title", "description", "slug", "nsfw", "_attributes")
+    __slots__ = (
+        "id",
+        "title",
+        "description",
+        "slug",
+        "nsfw",
+        "_attributes",
+        "__weakref__",
+    )
+
+    # Categories alive, by id
+    _instances: ClassVar[WeakValueDictionary] = WeakValueDictionary()
 
     def __init__(self, attributes: dict) -> None:
-        self._attributes = attributes
-        self.title: str = attributes["title"]["en"]
+        self._memo = None
+        # Only the dates are read later
+        self._attributes = {
+            key: attributes[key]
+            for key in ("createdAt", "updatedAt")
+            if key in attributes
+        }
+        self.id: int = int(attributes["id"])
+        self.title: str = intern(attributes["title"]["en"])
         self.description: str = attributes["description"]
-        self.slug: str = attributes["slug"]
+        self.slug: str = intern(attributes["slug"])
         self.nsfw: bool = attributes["isNsfw"]
 
+    @classmethod
+    def _shared(cls, attributes: dict) -> Category:
+        """The category already built for this id if there's one alive,
+        so the entries of a category all hold the same instance"""
+        category = cls._instances.get(attributes["id"])
+        if category is None:
+            category = cls._instances[attributes["id"]] = cls(attributes)
+        return category
+
     def __repr__(self) -> str:
         return f"<Category title={self.title}>"
 
     @property
     def created_at(self) -> Optional[datetime]:
         """When a category got added in Kitu DB"""
-        try:
-            return datetime.strptime(
-                self._attributes["createdAt"], "%Y-%m-%dT%H:%M:%SZ"
-            )
-        except ValueError:
-            return None
+        return self._memoized(
+            "created_at", lambda: parse_datetime(self._attributes.get("createdAt"))
+        )
 
     @property
     def updated_at(self) -> Optional[datetime]:
         """Last time a category got updated"""
-        try:
-            return datetime.strptime(
-                self._attributes["updatedAt"], "%Y-%m-%dT%H:%M:%SZ"
-            )
-        except ValueError:
-            return None
+        return self._memoized(
+            "updated_at", lambda: parse_datetime(self._attributes.get("updatedAt"))
+        )
 
 
-class Review:
+class Review(Serializable):
     """Represents a :class:`Review` instance.
     Reviews belong to a media (:class:`Anime`, :class:`Manga`)
 
@@ -121,7 +213,7 @@ class Review:
         self.progress: str = attributes["progress"]
 
 
-class Title:
+class Title(Serializable):
     """
     Represent the various titles that a entry can have
 
@@ -141,6 +233,8 @@ class Title:
         The title of the media in Japanese
     """
 
+    __slots__ = ("__data", "entry_id", "entry_type")
+
     def __init__(
         self, data: dict, entry_id: int = None, entry_type: str = None
     ) -> None:
@@ -165,11 +259,64 @@ class Title:
         return self.__data.get("ja_jp")
 
 
-class Entry(ABC):
+class Projectable(Memoized):
+    """
+    Base for models that can be built from a `fields` projection.
+
+    Subclasses declare their fields once in `_spec` (see :mod:`askitsu.spec`),
+    which also drives the selections of their GraphQL fragment. Unless the
+    class defines its own, a flat `__init__` taking `_parameters` and running
+    `_prologue` first is generated from it.
+
+    Every stored field is only set when its GraphQL key is in the fetched
+    attributes; accessing a missing one (or a property whose key is
+    missing) raises :class:`NotFetched`. Slim clients get the fetched
+    tree released, see :class:`Memoized`.
+    """
+
+    __slots__ = ()
+
+    _spec: ClassVar[Dict[str, Field]] = {}
+    # Derived from `_spec`: stored attribute -> field, property -> GraphQL key
+    _fields: ClassVar[Dict[str, Field]] = {}
+    _properties: ClassVar[Dict[str, str]] = {}
+    _parameters: ClassVar[str] = "attributes, http"
+    _prologue: ClassVar[Tuple[str, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        spec = cls._spec
+        cls._fields = {name: field for name, field in spec.items() if field.stored}
+        cls._properties = {
+            name: field.key for name, field in spec.items() if not field.stored
+        }
+        if spec and "__init__" not in cls.__dict__:
+            cls.__init__ = constructor(  # type: ignore[misc]
+                cls.__qualname__, cls._parameters, cls._prologue, spec
+            )
+
+    def _raw(self, key: str, name: str) -> Any:
+        try:
+            return self._attributes[key]  # type: ignore[index]
+        except KeyError:
+            raise NotFetched(name, self) from None
+
+    def _timestamp(self, key: str, name: str) -> Optional[datetime]:
+        """The raw date or timestamp at `key`, parsed once"""
+        return self._derived(name, lambda: parse_datetime(self._raw(key, name)))
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._fields or name in self._properties:
+            raise NotFetched(name, self)
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+
+class Entry(Projectable, ABC):
 
     __slots__ = (
         "id",
-        "entry_type",
         "status",
         "slug",
         "description",
@@ -179,57 +326,99 @@ class Entry(ABC):
         "rating",
         "age_rating",
         "subtype",
+        "partial",
+        "_titles",
+        "_created_at",
+        "_updated_at",
+        "_started_at",
+        "_ended_at",
+        "_poster_image",
+        "_cover_image",
+        "_attributes",
+        "_http",
+        "_cache",
     )
 
-    def __init__(
-        self, _id: int, _type: str, attributes: dict, http: HTTPClient, cache: Cache
-    ):
-        self._cache: Cache = cache
-        self._http: HTTPClient = http
-        self._attributes = attributes
-        self._titles: dict = attributes["titles"]["localized"]
-        self.id = int(_id)
-        self.entry_type = _type
-        self.status: str = attributes["status"]
-        self.slug: str = attributes["slug"]
-        self.canonical_title: str = attributes["titles"]["canonical"]
-        self.description: Optional[str] = attributes["description"].get("en", None)
-        self.rating_rank = attributes["averageRatingRank"]
-        self.popularity_rank = attributes["userCountRank"]
-        self.rating: float = attributes["averageRating"]
-        self.age_rating: Literal["G", "PG", "R", "R18"] = attributes["ageRating"]
+    # "anime" or "manga", set by the subclasses
+    entry_type: ClassVar[str]
+    _cache: Cache
+    _http: HTTPClient
+
+    _spec = ENTRY_SPEC
+    _parameters = "attributes, http, cache"
+    _prologue = ("self._cache = cache", "self._http = http")
+    # Relations that can be included with the entry:
+    # name -> (response field, cache key suffix, model factory)
+    _relations: ClassVar[Dict[str, Tuple[str, str, Callable[[dict, int], Any]]]] = {
+        "categories": (
+            "categories",
+            "categories",
+            lambda node, id: Category._shared(node),
+        ),
+        "characters": (
+            "characters",
+            "characters",
+            lambda node, id: Character._shared(node, id),
+        ),
+    }
+
+    async def _prime(self, attributes: dict, relations: Iterable[str]) -> None:
+        """Cache the relations fetched along with the entry,
+        where the properties reading them look first"""
+        for relation in relations:
+            field, suffix, factory = self._relations[relation]
+            nodes = (attributes.get(field) or {}).get("nodes") or []
+            await self._cache.add(
+                f"{self.entry_type}_{self.id}_{suffix}",
+                [factory(node, self.id) for node in nodes],
+                remove_after=self._cache.expiration,
+            )
+
+    async def hydrate(self) -> Entry:
+        """|coro|
+
+        Fetch the fields left out by a `fields` projection, filling this
+        entry in place. Does nothing if the entry is already complete.
+
+        Entries hydrating at the same time are fetched together in
+        batched requests.
+
+        .. versionadded:: 1.1.0
+        """
+        if not self.partial:
+            return self
+        full = await self._http._get_entry_fetch(
+            Entries(self.entry_type),
+            self.id,
+            QUERY_METHODS[f"{self.entry_type}_id"],
+        )
+        if full is not None:
+            # The full entry may be slim already, copy its fields and kept values
+            for name in self._fields:
+                setattr(self, name, getattr(full, name))
+            for name in self._kept:
+                if hasattr(full, f"_{name}"):
+                    setattr(self, f"_{name}", getattr(full, f"_{name}"))
+            self._attributes = full._attributes
+            self._memo = None
+            self.partial = False
+        return self
 
     @property
     def created_at(self) -> Optional[datetime]:
-        try:
-            return datetime.strptime(
-                self._attributes["createdAt"], "%Y-%m-%dT%H:%M:%SZ"
-            )
-        except (ValueError, TypeError):
-            return None
+        return self._timestamp("createdAt", "created_at")
 
     @property
     def updated_at(self) -> Optional[datetime]:
-        try:
-            return datetime.strptime(
-                self._attributes["updatedAt"], "%Y-%m-%dT%H:%M:%SZ"
-            )
-        except (ValueError, TypeError):
-            return None
+        return self._timestamp("updatedAt", "updated_at")
 
     @property
     def started_at(self) -> Optional[datetime]:
-        try:
-            return datetime.strptime(self._attributes["startDate"], "%Y-%m-%d")
-        except (ValueError, TypeError):
-            return None
+        return self._timestamp("startDate", "started_at")
 
     @property
     def ended_at(self) -> Optional[datetime]:
-        try:
-            return datetime.strptime(self._attributes["endDate"], "%Y-%m-%d")
-        except (ValueError, TypeError):
-            return None
+        return self._timestamp("endDate", "ended_at")
 
     @property
     def url(self) -> str:
@@ -237,15 +426,77 @@ class Entry(ABC):
 
     @property
     def title(self) -> Title:
-        return Title(self._titles, self.id, self.entry_type)
+        return self._memoized(
+            "title", lambda: Title(self._titles, self.id, self.entry_type)
+        )
 
     @property
     def poster_image(self) -> PosterImage:
-        return PosterImage(self._attributes["posterImage"], self.id, self.entry_type)
+        return self._derived(
+            "poster_image",
+            lambda: PosterImage(
+                self._raw("posterImage", "poster_image"), self.id, self.entry_type
+            ),
+        )
 
     @property
     def cover_image(self) -> CoverImage:
-        return CoverImage(self._attributes["bannerImage"], self.id, self.entry_type)
+        return self._derived(
+            "cover_image",
+            lambda: CoverImage(
+                self._raw("bannerImage", "cover_image"), self.id, self.entry_type
+            ),
+        )
+
+    def iter_characters(
+        self, per_page: int = 20, limit: Optional[int] = None
+    ) -> Paginator[Character]:
+        """
+        Iterate over all the characters of the entry, page by page
+
+        .. versionadded:: 1.1.0
+
+        per_page: :class:`int`
+            Number of characters fetched per request
+        limit: Optional[:class:`int`]
+            Stop after this many characters
+        """
+        method = QUERY_METHODS[f"{self.entry_type}_id"]
+        return Paginator(
+            self._http,
+            ENTRY_ID_CHARACTERS[method],
+            {"id": self.id},
+            (method, "characters"),
+            lambda attributes: Character._shared(attributes, self.id),
+            cache_key=f"{self.entry_type}_{self.id}_characters",
+            per_page=per_page,
+            limit=limit,
+        )
+
+    def iter_reviews(
+        self, per_page: int = 20, limit: Optional[int] = None
+    ) -> Paginator[Review]:
+        """
+        Iterate over all the reviews of the entry, page by page
+
+        .. versionadded:: 1.1.0
+
+        per_page: :class:`int`
+            Number of reviews fetched per request
+        limit: Optional[:class:`int`]
+            Stop after this many reviews
+        """
+        method = QUERY_METHODS[f"{self.entry_type}_id"]
+        return Paginator(
+            self._http,
+            ENTRY_ID_REVIEWS[method],
+            {"id": self.id},
+            (method, "reactions"),
+            lambda attributes: Review(self.id, self.entry_type, attributes),
+            cache_key=f"{self.entry_type}_{self.id}_reviews",
+            per_page=per_page,
+            limit=limit,
+        )
 
     @property
     @abstractmethod
@@ -262,7 +513,7 @@ class Entry(ABC):
         ...
 
 
-class Object:
+class Object(Serializable):
     """
     Represent a generic Object.
     This can be useful if you want to use some methods that require a
@@ -281,6 +532,8 @@ class Object:
         The type of the object
     """
 
+    __slots__ = ("id", "entry_type")
+
     def __init__(self, id: int, *, type: str = None) -> None:
         self.id: int = id
         self.entry_type: Optional[str] = type
@@ -6,6 +6,7 @@ class Entries(Enum):
     ANIME: str = "anime"
     MANGA: str = "manga"
     CHARACTER: str = "character"
+    USER: str = "user"
 
 
 Media = Literal[Entries.ANIME, Entries.MANGA]
@@ -24,26 +24,54 @@ DEALINGS IN THE SOFTWARE.
 
 from __future__ import annotations
 
-from typing import Literal, Optional
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Type,
+    TypeVar,
+    TYPE_CHECKING,
+)
 
+from .serializable import Serializable
+from ..utils import intern
 
-__all__ = ("Image", "PosterImage", "CoverImage")
+if TYPE_CHECKING:
+    from ..http import HTTPClient
 
 
-def get_dimension(dim: str, values: dict, value: str = "url") -> Optional[str]:
-    for dimensions in values:
-        if dim in dimensions.values():
-            try:
-                return dimensions.get(value, None)
-            except (KeyError, TypeError):
-                return None
-    return None
+__all__ = ("Image", "ImageView", "PosterImage", "CoverImage")
 
 
-class Image:
+class ImageView(NamedTuple):
+    """
+    A size an image is available in
+
+    .. versionadded:: 1.1.0
+    """
+
+    name: str
+    url: Optional[str]
+    width: Optional[int]
+    height: Optional[int]
+
+
+# Views of an image that came without a list of them
+_NO_VIEWS: Mapping[str, ImageView] = MappingProxyType({})
+
+I = TypeVar("I", bound="Image")
+
+
+class Image(Serializable):
     """
     Represent a general image
 
+    Its views are indexed by name once, when the image is created.
+
     Attributes
     ---------------
     tiny: :class:`str`
@@ -58,43 +86,122 @@ class Image:
         Poster image with original size
     """
 
+    __slots__ = ("_original", "_views")
+
     def __init__(self, data: dict) -> None:
-        self._data = data
+        try:
+            self._original: Optional[str] = data["original"].get("url")
+        except (KeyError, TypeError, AttributeError):
+            self._original = None
+        try:
+            self._views: Mapping[str, ImageView] = MappingProxyType(
+                {
+                    intern(view.get("name")): ImageView(
+                        intern(view.get("name")),
+                        view.get("url"),
+                        view.get("width"),
+                        view.get("height"),
+                    )
+                    for view in data["views"]
+                }
+            )
+        except (KeyError, TypeError):
+            self._views = _NO_VIEWS
+
+    def _values(self) -> Dict[str, Any]:
+        # Views are stored as plain lists, so the state stays JSON-compatible
+        values = super()._values()
+        views = values.get("_views")
+        if views is not None:
+            values["_views"] = (
+                None if views is _NO_VIEWS else [list(view) for view in views.values()]
+            )
+        return values
+
+    @classmethod
+    def _build(cls: Type[I], state: Dict[str, Any], http: Optional[HTTPClient]) -> I:
+        if "_views" in state:
+            views = state["_views"]
+            state = {
+                **state,
+                "_views": _NO_VIEWS
+                if views is None
+                else MappingProxyType({view[0]: ImageView(*view) for view in views}),
+            }
+        return super()._build(state, http)
+
+    def _url(self, size: str) -> Optional[str]:
+        view = self._views.get(size)
+        return view.url if view else None
 
     @property
     def tiny(self) -> Optional[str]:
-        try:
-            return get_dimension("tiny", self._data["views"])
-        except (KeyError, TypeError):
-            return None
+        return self._url("tiny")
 
     @property
     def small(self) -> Optional[str]:
-        try:
-            return get_dimension("small", self._data["views"])
-        except (KeyError, TypeError):
-            return None
+        return self._url("small")
 
     @property
     def medium(self) -> Optional[str]:
-        try:
-            return get_dimension("medium", self._data["views"])
-        except (KeyError, TypeError):
-            return None
+        return self._url("medium")
 
     @property
     def large(self) -> Optional[str]:
-        try:
-            return get_dimension("large", self._data["views"])
-        except (KeyError, TypeError):
-            return None
+        return self._url("large")
 
     @property
     def original(self) -> Optional[str]:
-        try:
-            return self._data["original"].get("url", None)
-        except (KeyError, TypeError):
+        return self._original
+
+    @property
+    def views(self) -> Mapping[str, ImageView]:
+        """
+        Every size of the image by name, with its width and height.
+        The mapping is read-only and shared by every access.
+
+        .. versionadded:: 1.1.0
+        """
+        return self._views
+
+    def fit(self, width: int = 0, height: int = 0) -> Optional[str]:
+        """
+        URL of the smallest view at least `width` x `height` pixels,
+        or of the original image when no view is big enough
+
+        .. versionadded:: 1.1.0
+
+        Example
+        ---------
+        .. code-block:: python3
+
+            embed.set_thumbnail(url=anime.poster_image.fit(width=200))
+        """
+        fitting = [
+            view
+            for view in self._views.values()
+            if view.url
+            and (view.width or 0) >= width
+            and (view.height or 0) >= height
+        ]
+        if not fitting:
+            return self._original
+        smallest = min(fitting, key=lambda view: (view.width or 0) * (view.height or 0))
+        return smallest.url
+
+    def dimension(
+        self, size: Literal["tiny", "small", "medium", "large"]
+    ) -> Optional[dict]:
+        """
+        Width and height of a size, both ``None`` if the image doesn't
+        come in it. ``None`` if the image has no views at all.
+        """
+        if self._views is _NO_VIEWS:
             return None
+        view = self._views.get(size)
+        if view is None:
+            return {"width": None, "height": None}
+        return {"width": view.width, "height": view.height}
 
 
 class PosterImage(Image):
@@ -119,23 +226,15 @@ class PosterImage(Image):
         Poster image with original size
     """
 
+    __slots__ = ("entry_id", "entry_type")
+
     def __init__(
         self, data: dict, entry_id: int = None, entry_type: str = None
     ) -> None:
-        self._data = data
+        super().__init__(data)
         self.entry_id = entry_id
         self.entry_type = entry_type
 
-    def dimension(
-        self, size: Literal["tiny", "small", "medium", "large"]
-    ) -> Optional[dict]:
-        try:
-            width = get_dimension(size, self._data["views"], value="width")
-            height = get_dimension(size, self._data["views"], value="height")
-            return {"width": width, "height": height}
-        except (KeyError, TypeError):
-            return None
-
 
 class CoverImage(Image):
     """
@@ -157,23 +256,15 @@ class CoverImage(Image):
         Cover image with original size
     """
 
+    __slots__ = ("entry_id", "entry_type")
+
     def __init__(
         self, data: dict, entry_id: int = None, entry_type: str = None
     ) -> None:
-        self._data = data
+        super().__init__(data)
         self.entry_id = entry_id
         self.entry_type = entry_type
 
     @property
     def medium(self) -> None:  # placeholder
         return None
-
-    def dimension(
-        self, size: Literal["tiny", "small", "medium", "large"]
-    ) -> Optional[dict]:
-        try:
-            width = get_dimension(size, self._data["views"], value="width")
-            height = get_dimension(size, self._data["views"], value="height")
-            return {"width": width, "height": height}
-        except (KeyError, TypeError):
-            return None
@@ -23,23 +23,25 @@ DEALINGS IN THE SOFTWARE.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from .character import Character
 from .core import Category, Entry, Review
-from ..cache import Cache
-from ..http import HTTPClient
+from .numbered import NumberedList, _path
+from .serializable import Serializable
+from ..pagination import Paginator
 from ..queries import (
     MANGA_BY_ID_CATEGORIES,
     MANGA_BY_ID_CHAPTERS,
     MANGA_BY_ID_CHARACTERS,
     MANGA_BY_ID_REVIEWS,
 )
+from ..spec import MANGA_SPEC
 
-__all__ = ("Manga", "Chapter")
+__all__ = ("Manga", "Chapter", "ChapterList")
 
 
-class Chapter:
+class Chapter(Serializable):
     """
     Represent a :class:`Manga` chapter
 
@@ -66,24 +68,24 @@ class Chapter:
         "volume_number",
         "chapter",
         "length",
-        "_attributes",
+        "_thumbnail",
     )
 
     def __init__(self, attributes: dict) -> None:
-        self._attributes = attributes
         self.id: int = int(attributes["id"])
         self.description: str = attributes["description"]["en"]
         self.title: str = attributes["titles"]["romanized"]
         self.chapter: int = attributes["number"]
         # self.length: int = attributes["length"]
+        try:
+            self._thumbnail: Optional[str] = attributes["thumbnail"]["original"]["url"]
+        except (KeyError, TypeError):
+            self._thumbnail = None
 
     @property
     def thumbnail(self) -> Optional[str]:
         """Url of the thumbnail"""
-        try:
-            return self._attributes["thumbnail"]["original"]["url"]
-        except (KeyError, TypeError):
-            return None
+        return self._thumbnail
 
     # @property
     # def published(self) -> Optional[datetime]:
@@ -94,6 +96,29 @@ class Chapter:
     #         return None
 
 
+class ChapterList(NumberedList[Chapter]):
+    """
+    The chapters of a :class:`Manga`, stored compactly.
+    Every item is a :class:`Chapter` built on access.
+
+    .. versionadded:: 1.1.0
+    """
+
+    __slots__ = ()
+
+    _model = Chapter
+    _integer_fields = (
+        ("id", lambda node: int(node["id"])),
+        ("chapter", _path("number")),
+    )
+    _text_fields = (
+        ("title", _path("titles", "romanized")),
+        ("description", _path("description", "en")),
+        ("_thumbnail", _path("thumbnail", "original", "url")),
+    )
+    _number = "chapter"
+
+
 class Manga(Entry):
     """Represents a :class:`Manga` instance
 
@@ -176,48 +201,35 @@ class Manga(Entry):
         --------------
         Use :meth:`askitsu.Client.get_characters` if you want to set a limit\n
         The limit with this property is automatically set to 20 (The highest)
+
+    partial: :class:`bool`
+        If the entry was fetched with a `fields` projection.
+        Accessing a field that was left out raises :class:`NotFetched`
+
+        .. versionadded:: 1.1.0
     """
 
     __slots__ = (
-        "id",
-        "entry_type",
-        "status",
-        "slug",
         "synopsis",
-        "canonical_title",
-        "rating_rank",
-        "popularity_rank",
         "chapter_count",
         "volume_count",
         "serialization",
-        "rating",
-        "age_rating",
-        "subtype",
-        "_http",
-        "_titles",
-        "_attributes",
-        "_cache",
     )
 
-    def __init__(self, attributes: dict, http: HTTPClient, cache: Cache) -> None:
-        self._http = http
-        self.entry_type: str = "manga"
-        self.chapter_count: int = attributes["chapterCount"]
-        self.volume_count: int = attributes["volumeCount"]
-        self.subtype: str = attributes["mangasub"]
-        # self.serialization: str = data["serialization"]
-        super().__init__(
-            _id=attributes["id"],
-            _type=self.entry_type,
-            attributes=attributes,
-            http=http,
-            cache=cache,
-        )
+    entry_type = "manga"
+    _spec = MANGA_SPEC
+    _relations = {
+        **Entry._relations,
+        # Same key as chapters() with the default limit
+        "chapters": ("chapters", "chapters_12", lambda node, id: Chapter(node)),
+    }
 
     def __repr__(self) -> str:
-        return f"<Manga name='{self.canonical_title}' id={self.id}>"
+        return f"<Manga name='{getattr(self, 'canonical_title', None)}' id={self.id}>"
 
-    async def chapters(self, limit: int = 12) -> List[Chapter]:
+    async def chapters(
+        self, limit: int = 12, *, compact: bool = False
+    ) -> Union[List[Chapter], ChapterList]:
         """
         Returns a chapter list of chapters
 
@@ -225,25 +237,58 @@ class Manga(Entry):
 
         limit: :class:`int`
             Limit of chapters to fetch. Defaults to 12.
+        compact: :class:`bool`
+            Return a :class:`ChapterList` instead of a list, for long
+            series: it takes less memory and finds chapters by number
+            in logarithmic time.
+
+            .. versionadded:: 1.1.0
         """
-        cache_res = await self._cache.get(f"manga_{self.id}_chapters_{limit}")
+        cache_key = f"manga_{self.id}_chapters_{limit}{'_compact' if compact else ''}"
+        cache_res = await self._cache.get(cache_key)
         if cache_res:
             return cache_res.value
         variables = {"id": self.id, "limit": limit}
         data = await self._http.post_data(
             data={"query": MANGA_BY_ID_CHAPTERS, "variables": variables}
         )
-        chapters = [
-            Chapter(attributes)
-            for attributes in data["data"]["findMangaById"]["chapters"]["nodes"]
-        ]
+        nodes = data["data"]["findMangaById"]["chapters"]["nodes"]
+        chapters: Union[List[Chapter], ChapterList]
+        if compact:
+            chapters = await self._http._offload(lambda: ChapterList(nodes), nodes)
+        else:
+            chapters = await self._http._build(Chapter, nodes)
         await self._cache.add(
-            f"manga_{self.id}_chapters_{limit}",
+            cache_key,
             chapters,
             remove_after=self._cache.expiration,
         )
         return chapters
 
+    def iter_chapters(
+        self, per_page: int = 20, limit: Optional[int] = None
+    ) -> Paginator[Chapter]:
+        """
+        Iterate over all the chapters, page by page
+
+        .. versionadded:: 1.1.0
+
+        per_page: :class:`int`
+            Number of chapters fetched per request
+        limit: Optional[:class:`int`]
+            Stop after this many chapters
+        """
+        return Paginator(
+            self._http,
+            MANGA_BY_ID_CHAPTERS,
+            {"id": self.id},
+            ("findMangaById", "chapters"),
+            Chapter,
+            cache_key=f"manga_{self.id}_chapters",
+            per_page=per_page,
+            limit=limit,
+        )
+
     @property
     async def categories(self) -> List[Category]:
         cache_res = await self._cache.get(f"manga_{self.id}_categories")
@@ -254,7 +299,7 @@ class Manga(Entry):
             data={"query": MANGA_BY_ID_CATEGORIES, "variables": variables}
         )
         categories = [
-            Category(attributes)
+            Category._shared(attributes)
             for attributes in data["data"]["findMangaById"]["categories"]["nodes"]
         ]
         await self._cache.add(
@@ -274,7 +319,7 @@ class Manga(Entry):
             data={"query": MANGA_BY_ID_CHARACTERS, "variables": variables}
         )
         characters = [
-            Character(attributes, entry_id=self.id)
+            Character._shared(attributes, self.id)
             for attributes in data["data"]["findMangaById"]["characters"]["nodes"]
         ]
         await self._cache.add(
@@ -291,5 +336,5 @@ class Manga(Entry):
         )
         return [
             Review(self.id, self.entry_type, attributes)
-            for attributes in data["data"]["findAnimeById"]["reactions"]["nodes"]
+            for attributes in data["data"]["findMangaById"]["reactions"]["nodes"]
         ]
@@ -0,0 +1,248 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present ShomyKohai
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from .serializable import Serializable
+from ..error import InvalidArgument
+
+__all__ = ("NumberedList",)
+
+T = TypeVar("T", bound=Serializable)
+Reader = Callable[[dict], Any]
+
+# Stands for a missing number
+MISSING = -1
+
+
+def _path(*keys: str) -> Reader:
+    """Read a nested value, None if any level is missing"""
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda node: node.get(key)
+
+    def read(node: dict) -> Any:
+        try:
+            value: Any = node
+            for key in keys:
+                value = value[key]
+            return value
+        except (KeyError, TypeError):
+            return None
+
+    return read
+
+
+class NumberedList(Sequence[T]):
+    """
+    A compact, read-only list of numbered items (episodes, chapters...).
+
+    Instead of an object per item, the integer fields are kept in typed
+    arrays and the text fields (strings or localized maps) as codes into
+    a table of the distinct values of the list. Items are built on access,
+    so every access returns a new (equal) object.
+
+    Items can be found by number in logarithmic time with
+    :meth:`by_number` and :meth:`between`.
+
+    .. versionadded:: 1.1.0
+    """
+
+    __slots__ = ("_integers", "_texts", "_table", "_keys", "_order")
+
+    # Set by the subclasses: the model built on access, how to read its
+    # integer and text fields from a node, and which field is the number
+    _model: ClassVar[Type[Serializable]]
+    _integer_fields: ClassVar[Tuple[Tuple[str, Reader], ...]]
+    _text_fields: ClassVar[Tuple[Tuple[str, Reader], ...]]
+    _number: ClassVar[str]
+
+    def __init__(self, nodes: Iterable[dict]) -> None:
+        nodes = nodes if isinstance(nodes, list) else list(nodes)
+        self._integers = tuple(
+            array("q", [MISSING if item is None else item for item in map(read, nodes)])
+            for _, read in self._integer_fields
+        )
+        # Code of every distinct string, shared by the text columns
+        known: Dict[Any, int] = {}
+        texts: List[Sequence[Any]] = []
+        for _, read in self._text_fields:
+            values = list(map(read, nodes))
+            try:
+                codes = [known.setdefault(value, len(known)) for value in values]
+            except TypeError:
+                try:
+                    # Localized maps are kept as the tuple of their items
+                    codes = [
+                        known.setdefault(
+                            None if value is None else tuple(value.items()),
+                            len(known),
+                        )
+                        for value in values
+                    ]
+                except (AttributeError, TypeError):
+                    texts.append(values)
+                    continue
+            texts.append(array("i", codes))
+        self._texts = tuple(texts)
+        self._table = list(known)
+        numbers = self._integers[self._position(self._number)]
+        ordered = sorted(numbers)
+        if numbers == array("q", ordered):
+            self._keys = numbers
+            self._order: Optional[array] = None
+        else:
+            self._keys = array("q", ordered)
+            self._order = array(
+                "q", sorted(range(len(numbers)), key=numbers.__getitem__)
+            )
+
+    @classmethod
+    def _position(cls, name: str) -> int:
+        for position, (field, _) in enumerate(cls._integer_fields):
+            if field == name:
+                return position
+        raise InvalidArgument(f"{name!r} is not an integer field")
+
+    def __len__(self) -> int:
+        return len(self._integers[0])
+
+    def _item(self, index: int) -> T:
+        state: Dict[str, Any] = {}
+        for (name, _), column in zip(self._integer_fields, self._integers):
+            value = column[index]
+            state[name] = None if value == MISSING else value
+        table = self._table
+        for (name, _), column in zip(self._text_fields, self._texts):
+            value = table[column[index]] if type(column) is array else column[index]
+            state[name] = dict(value) if type(value) is tuple else value
+        return self._model._build(state, None)  # type: ignore[return-value]
+
+    @overload
+    def __getitem__(self, index: int) -> T:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        if isinstance(index, slice):
+            return [self._item(position) for position in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return self._item(index)
+
+    def __iter__(self) -> Iterator[T]:
+        return map(self._item, range(len(self)))
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} items={len(self)}>"
+
+    def column(self, name: str) -> Sequence[Any]:
+        """
+        Every value of a field, without building the items.
+        Integer fields come as an :class:`array.array`, where ``-1``
+        stands for a missing value.
+
+        Parameters
+        -----------
+        name: :class:`str`
+            Name of the field
+
+        Raises
+        -----------
+        InvalidArgument
+            There's no such field
+        """
+        for (field, _), column in zip(self._text_fields, self._texts):
+            if field == name:
+                if type(column) is not array:
+                    return list(column)
+                table = self._table
+                return [
+                    dict(value) if type(value) is tuple else value
+                    for value in map(table.__getitem__, column)
+                ]
+        return self._integers[self._position(name)]
+
+    def _positions(self, start: int, stop: int) -> Sequence[int]:
+        # Positions in the list of the sorted keys from start to stop
+        if self._order is None:
+            return range(start, stop)
+        return self._order[start:stop]
+
+    def by_number(self, number: int) -> Optional[T]:
+        """
+        The first item with this number, if there's one
+
+        Parameters
+        -----------
+        number: :class:`int`
+            The number of the episode or chapter
+        """
+        keys = self._keys
+        start = bisect_left(keys, number)
+        if start < len(keys) and keys[start] == number:
+            return self._item(self._positions(start, start + 1)[0])
+        return None
+
+    def between(self, first: int, last: int) -> List[T]:
+        """
+        Every item numbered from `first` to `last` (included),
+        by number
+
+        Parameters
+        -----------
+        first: :class:`int`
+            The lowest number
+        last: :class:`int`
+            The highest number
+        """
+        keys = self._keys
+        positions = self._positions(
+            bisect_left(keys, first), bisect_right(keys, last)
+        )
+        return [self._item(position) for position in positions]
@@ -0,0 +1,291 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present ShomyKohai
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    TYPE_CHECKING,
+)
+from weakref import ReferenceType, ref
+
+from ..error import InvalidArgument
+
+if TYPE_CHECKING:
+    from ..client import Client
+    from ..http import HTTPClient
+
+__all__ = ("Serializable",)
+
+S = TypeVar("S", bound="Serializable")
+
+# Slots that aren't part of the state of a model
+_SKIPPED = frozenset({"__weakref__", "__dict__", "_memo"})
+
+
+def _restore(model: Type[S], state: Dict[str, Any]) -> S:
+    """Rebuild a pickled model, attached to the default client"""
+    return model._build(state, Serializable._default())
+
+
+def _unknown(model: type, state: Dict[str, Any]) -> None:
+    name = next(name for name in state if name not in model._state)
+    raise InvalidArgument(f"{model.__name__} has no field named {name!r}")
+
+
+class Serializable:
+    """
+    Base for models that can be turned into plain data and back.
+
+    The state of a model is the value of its slots, except for the client
+    (and cache) it's bound to: those get dropped and reattached when the
+    model is loaded, either to the given client or to the last one created
+    if it's still alive. Values derived on access (parsed dates...) are
+    recomputed, unless a slim model computed them into its slots.
+
+    Models are pickled the same way, so they can be sent to other processes
+    or stored in persistent caches.
+
+    .. versionadded:: 1.1.0
+    """
+
+    __slots__ = ()
+
+    # Model classes by name, to load nested models
+    _models: ClassVar[Dict[str, Type[Serializable]]] = {}
+    # Set per class: the slots holding the state, and the ones holding
+    # the client, with whether they hold its cache instead
+    _state: ClassVar[FrozenSet[str]] = frozenset()
+    _links: ClassVar[Tuple[Tuple[str, bool], ...]] = ()
+    _has_memo: ClassVar[bool] = False
+    _codec_functions: ClassVar[Tuple[Callable[..., Any], Callable[..., Any]]]
+    # Set by every new client
+    _default_http: ClassVar[Optional[ReferenceType]] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        Serializable._models[cls.__name__] = cls
+        state = []
+        links = []
+        for klass in reversed(cls.__mro__):
+            slots = klass.__dict__.get("__slots__", ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if name.startswith("__") and not name.endswith("__"):
+                    name = f"_{klass.__name__.lstrip('_')}{name}"
+                if name == "_memo":
+                    cls._has_memo = True
+                if name in _SKIPPED:
+                    continue
+                if name == "_http" or name.endswith("__http"):
+                    links.append((name, False))
+                elif name == "_cache":
+                    links.append((name, True))
+                else:
+                    state.append(name)
+        cls._state = frozenset(state)
+        cls._links = tuple(links)
+
+    @staticmethod
+    def _make_default(http: HTTPClient) -> None:
+        Serializable._default_http = ref(http)
+
+    @staticmethod
+    def _default() -> Optional[HTTPClient]:
+        default = Serializable._default_http
+        return default() if default is not None else None
+
+    @classmethod
+    def _codec(cls) -> Tuple[Callable[..., Dict[str, Any]], Callable[..., Any]]:
+        """
+        Functions reading and setting the state of the class, generated
+        on first use: they access every slot directly, without looping
+        over descriptors
+        """
+        codec = cls.__dict__.get("_codec_functions")
+        if codec is not None:
+            return codec
+        names = sorted(cls._state)
+        lines = ["def _values(self):", "    values = {}"]
+        for name in names:
+            lines += [
+                "    try:",
+                f"        values[{name!r}] = self.{name}",
+                "    except AttributeError:",
+                "        pass",
+            ]
+        lines += [
+            "    return values",
+            "def _build(state, http):",
+            "    self = _new(_model)",
+            "    if not state.keys() <= _names:",
+            "        _unknown(_model, state)",
+        ]
+        for name in names:
+            lines += [
+                f"    if {name!r} in state:",
+                f"        self.{name} = state[{name!r}]",
+            ]
+        if cls._has_memo:
+            lines.append("    self._memo = None")
+        if cls._links:
+            lines.append("    if http is not None:")
+            lines += (
+                f"        self.{name} = http{'._cache' if cache else ''}"
+                for name, cache in cls._links
+            )
+        lines.append("    return self")
+        namespace = {
+            "_new": object.__new__,
+            "_model": cls,
+            "_names": cls._state,
+            "_unknown": _unknown,
+        }
+        exec(compile("\n".join(lines), f"<{cls.__name__} codec>", "exec"), namespace)
+        codec = cls._codec_functions = (namespace["_values"], namespace["_build"])
+        return codec
+
+    def _values(self) -> Dict[str, Any]:
+        return self._codec()[0](self)
+
+    @classmethod
+    def _build(cls: Type[S], state: Dict[str, Any], http: Optional[HTTPClient]) -> S:
+        return cls._codec()[1](state, http)
+
+    @classmethod
+    def _load(cls: Type[S], data: Dict[str, Any], http: Optional[HTTPClient]) -> S:
+        name = data.get("__model__", cls.__name__)
+        model = Serializable._models.get(name)
+        if model is None or not issubclass(model, cls):
+            raise InvalidArgument(f"{name!r} is not a {cls.__name__}")
+        state = {}
+        for key, value in data.items():
+            if key == "__model__":
+                continue
+            if type(value) is dict:
+                if "__model__" in value:
+                    value = Serializable._load(value, http)
+                elif "__datetime__" in value:
+                    value = datetime.fromisoformat(value["__datetime__"])
+            state[key] = value
+        return model._build(state, http)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        The state of the model as a :class:`dict` of JSON-compatible values,
+        nested models and dates included.
+
+        .. versionadded:: 1.1.0
+        """
+        data: Dict[str, Any] = {"__model__": type(self).__name__}
+        for name, value in self._values().items():
+            if isinstance(value, Serializable):
+                value = value.to_dict()
+            elif isinstance(value, datetime):
+                value = {"__datetime__": value.isoformat()}
+            data[name] = value
+        return data
+
+    @classmethod
+    def from_dict(
+        cls: Type[S], data: Dict[str, Any], client: Optional[Client] = None
+    ) -> S:
+        """
+        Load a model from the output of :meth:`to_dict`.
+        Called on :class:`Serializable` itself, it loads a model of any type.
+
+        .. versionadded:: 1.1.0
+
+        Parameters
+        -----------
+        data: :class:`dict`
+            The state of the model
+        client: Optional[:class:`Client`]
+            The client the model gets attached to.
+            Defaults to the last one created, if it's still alive
+
+        Raises
+        -----------
+        InvalidArgument
+            `data` doesn't hold a model of this type
+        """
+        return cls._load(data, client.http if client is not None else cls._default())
+
+    def to_msgpack(self) -> bytes:
+        """
+        The output of :meth:`to_dict` encoded with MessagePack.
+        Needs msgpack installed.
+
+        .. versionadded:: 1.1.0
+        """
+        try:
+            import msgpack  # type: ignore
+        except ImportError:
+            raise ImportError("to_msgpack needs msgpack: pip install msgpack") from None
+        return msgpack.packb(self.to_dict(), use_bin_type=True)
+
+    @classmethod
+    def from_msgpack(cls: Type[S], data: bytes, client: Optional[Client] = None) -> S:
+        """
+        Load a model from the output of :meth:`to_msgpack`.
+        Needs msgpack installed.
+
+        .. versionadded:: 1.1.0
+
+        Parameters
+        -----------
+        data: :class:`bytes`
+            The encoded state of the model
+        client: Optional[:class:`Client`]
+            The client the model gets attached to.
+            Defaults to the last one created, if it's still alive
+        """
+        try:
+            import msgpack  # type: ignore
+        except ImportError:
+            raise ImportError(
+                "from_msgpack needs msgpack: pip install msgpack"
+            ) from None
+        return cls.from_dict(msgpack.unpackb(data, raw=False), client)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (_restore, (type(self), self._values()))
+
+    def __copy__(self: S) -> S:
+        # Copies stay bound to the same client
+        clone = self._build(self._values(), None)
+        for name, _ in self._links:
+            try:
+                setattr(clone, name, getattr(self, name))
+            except AttributeError:
+                pass
+        return clone
@@ -25,24 +25,38 @@ DEALINGS IN THE SOFTWARE.
 from __future__ import annotations
 
 from colorama import Fore, Style  # type: ignore
-from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import AsyncIterator, Iterable, List, Optional, TYPE_CHECKING, Union
 
 from .anime import Anime
+from .core import Memoized, Projectable
 from .enums import Entries, MediaType, LibraryEntryStatus
 from .images import CoverImage, Image
 from .manga import Manga
+from .serializable import Serializable
 from ..cache import Cache
 from ..error import InvalidArgument, NotFound
 from ..http import HTTPClient
-from ..queries import USERS_BY_ID_SOCIAL, USER_LIBRARY, POSTS_FROM_USER
+from ..pagination import Paginator
+from ..queries import (
+    library_media,
+    ENTRY_FRAGMENTS,
+    USERS_BY_ID_SOCIAL,
+    USER_LIBRARY,
+    USER_LIBRARY_COUNT,
+    POSTS_FROM_USER,
+)
+from ..spec import LIBRARY_ENTRY_SPEC
+from ..utils import intern, parse_datetime
+
+if TYPE_CHECKING:
+    from ..frames import LibraryFrame
 
 
 __all__ = ("User", "UserProfile", "Post", "LibraryEntry")
 
 
-class User:
+class User(Memoized):
     """
     Represents a user of Kitsu
 
@@ -100,6 +114,10 @@ class User:
         "media_reaction",
         "pro",
         "pro_tier",
+        "_birthday",
+        "_avatar",
+        "_cover_image",
+        "_created_at",
         "_attributes",
         "_http",
         "_cache",
@@ -109,6 +127,7 @@ class User:
         self._cache = cache
         self._http = http
         self._attributes = attributes
+        self._memo = None
         self.id: int = int(attributes["id"])
         self.entry_type: str = "users"
         self.name: str = attributes["name"]
@@ -118,13 +137,15 @@ class User:
         self.waifu_husbando: Optional[str] = attributes["waifuOrHusbando"]
         self.followers: int = attributes["followers"]["totalCount"]
         self.following: int = attributes["following"]["totalCount"]
-        self.gender: Optional[str] = attributes["gender"]
+        self.gender: Optional[str] = intern(attributes["gender"])
         self.comments_count: int = attributes["comments"]["totalCount"]
         self.favorites_count: int = attributes["favorites"]["totalCount"]
         self.posts_count: int = attributes["posts"]["totalCount"]
         self.media_reaction: int = attributes["mediaReactions"]["totalCount"]
         self.pro: bool = True if attributes["proTier"] else False
-        self.pro_tier: Optional[str] = attributes["proTier"]
+        self.pro_tier: Optional[str] = intern(attributes["proTier"])
+        if http.slim:
+            self._release()
 
     def __repr__(self) -> str:
         return f"<User slug='{self.slug}' id={self.id}>"
@@ -136,26 +157,29 @@ class User:
     @property
     def birthday(self) -> Optional[datetime]:
         """Birthday of the user (if set)"""
-        try:
-            return datetime.strptime(self._attributes["birthday"], "%Y-%m-%d")
-        except TypeError:
-            return None
+        return self._derived(
+            "birthday", lambda: parse_datetime(self._attributes["birthday"])
+        )
 
     @property
     def avatar(self) -> Optional[Image]:
         """Avatar of the user"""
-        avatar = self._attributes["avatarImage"]
-        return Image(avatar) if avatar else None
+
+        def avatar() -> Optional[Image]:
+            node = self._attributes["avatarImage"]  # type: ignore[index]
+            return Image(node) if node else None
+
+        return self._derived("avatar", avatar)
 
     @property
     def cover_image(self) -> Optional[CoverImage]:
         """Background of the user profile"""
-        cover = self._attributes["bannerImage"]
-        return (
-            CoverImage(cover, entry_id=self.id, entry_type=self.entry_type)
-            if cover
-            else None
-        )
+
+        def cover() -> Optional[CoverImage]:
+            node = self._attributes["bannerImage"]  # type: ignore[index]
+            return CoverImage(node, self.id, self.entry_type) if node else None
+
+        return self._derived("cover_image", cover)
 
     @property
     def banner(self) -> Optional[CoverImage]:
@@ -187,30 +211,18 @@ class User:
             return None
 
     async def library_entries_count(self, media: MediaType) -> int:
-        query = """
-            query library_entries_count ($id: ID!, $media: MediaTypeEnum!) {
-                findProfileById(id: $id) {
-                    library{
-                        all(mediaType: $media, first: 2000){
-                            totalCount
-                        }
-                    }
-                }
-            }
-        """
         variables = {"id": self.id, "media": str(media.value).upper()}
-        data = await self._http.post_data(data={"query": query, "variables": variables})
+        data = await self._http.post_data(
+            data={"query": USER_LIBRARY_COUNT, "variables": variables}
+        )
         return data["data"]["findProfileById"]["library"]["all"].get("totalCount", 0)
 
     @property
     def created_at(self) -> Optional[datetime]:
         """When the user registered to Kitsu"""
-        try:
-            return datetime.strptime(
-                self._attributes["createdAt"], "%Y-%m-%dT%H:%M:%SZ"
-            )
-        except ValueError:
-            return None
+        return self._derived(
+            "created_at", lambda: parse_datetime(self._attributes["createdAt"])
+        )
 
     async def posts(self, limit: int = 10) -> Optional[List[Post]]:
         if limit > 2000:
@@ -225,10 +237,10 @@ class User:
             data={"query": POSTS_FROM_USER, "variables": variables}
         )
         try:
-            posts = [
-                Post(attributes, self)
-                for attributes in data["data"]["findProfileById"]["posts"]["nodes"]
-            ]
+            posts = await self._http._build(
+                lambda attributes: Post(attributes, self),
+                data["data"]["findProfileById"]["posts"]["nodes"],
+            )
             await self._cache.add(
                 f"user_{self.slug}_posts",
                 posts,
@@ -238,30 +250,126 @@ class User:
         except KeyError:
             return None
 
+    def iter_posts(
+        self, per_page: int = 20, limit: Optional[int] = None
+    ) -> Paginator[Post]:
+        """
+        Iterate over all the posts of the user, page by page.
+        Unlike :meth:`posts`, this is not capped at 2000.
+
+        .. versionadded:: 1.1.0
+
+        per_page: :class:`int`
+            Number of posts fetched per request
+        limit: Optional[:class:`int`]
+            Stop after this many posts
+        """
+        return Paginator(
+            self._http,
+            POSTS_FROM_USER,
+            {"id": self.id},
+            ("findProfileById", "posts"),
+            lambda attributes: Post(attributes, self),
+            cache_key=f"user_{self.slug}_posts",
+            per_page=per_page,
+            limit=limit,
+        )
+
+    async def stream_posts(self, limit: int = 10) -> AsyncIterator[Post]:
+        """
+        Same as :meth:`posts`, but yields every post as soon as it
+        has been received instead of waiting for the whole response.
+        Streamed posts are not cached.
+
+        .. versionadded:: 1.1.0
+        """
+        if limit > 2000:
+            raise InvalidArgument(
+                f"{Fore.RED}The argument {Fore.YELLOW}`limit` {Fore.RED}can't exceed {Fore.LIGHTCYAN_EX}2000{Style.RESET_ALL}"
+            )
+        variables = {"id": self.id, "limit": limit}
+        async for attributes in self._http.stream_nodes(
+            data={"query": POSTS_FROM_USER, "variables": variables},
+            path=("data", "findProfileById", "posts", "nodes"),
+        ):
+            yield Post(attributes, self)
+
     async def library(
-        self, media: MediaType, filter: LibraryEntryStatus = None, limit: int = 10
-    ) -> Optional[List[LibraryEntry]]:
+        self,
+        media: MediaType,
+        filter: LibraryEntryStatus = None,
+        limit: int = 10,
+        *,
+        fields: Optional[Iterable[str]] = None,
+        with_media: bool = False,
+        frame: bool = False,
+    ) -> Union[List[LibraryEntry], LibraryFrame, None]:
+        """
+        Fetch the library entries of the user
+
+        media: :class:`MediaType`
+            The type of media of the entries
+        filter: Optional[:class:`LibraryEntryStatus`]
+            Only fetch entries with this status
+        limit: :class:`int`
+            Number of entries to fetch (max 2000)
+        fields: Optional[Iterable[:class:`str`]]
+            Only fetch these fields of every entry (`id` and the linked
+            media are always fetched). Accessing a field that was not
+            fetched raises :class:`NotFetched`.
+
+            .. versionadded:: 1.1.0
+        with_media: :class:`bool`
+            Fetch the whole linked media of every entry in the same request,
+            so :attr:`LibraryEntry.media` doesn't send one per entry.
+            Media already cached are kept.
+
+            .. versionadded:: 1.1.0
+        frame: :class:`bool`
+            Return a :class:`LibraryFrame` with the entries as columns
+            instead of a list, for statistics over big libraries.
+            :class:`LibraryEntry` objects are only built for the rows used.
+
+            .. versionadded:: 1.1.0
+        """
         if limit > 2000:
             raise InvalidArgument(
                 f"{Fore.RED}The argument {Fore.YELLOW}`limit` {Fore.RED}can't exceed {Fore.LIGHTCYAN_EX}2000{Style.RESET_ALL}"
             )
-        cache_res = await self._cache.get(
+        cache_key = (
             f"user_{self.slug}_library_{media.value}_{limit}_{filter.value if filter else 'ALL'}"
+            f"{self._http._fields_key(fields)}{'_frame' if frame else ''}"
         )
+        cache_res = await self._cache.get(cache_key)
         if cache_res:
+            if with_media:
+                # Cached without their media, or the media expired since
+                await self._http._load_media(cache_res.value)
             return cache_res.value
         variables = {"media": str(media.value).upper(), "id": self.id, "limit": limit}
-        query = USER_LIBRARY % f'{f", status: {filter.value}" if filter else ""}'
+        query = USER_LIBRARY
+        if with_media:
+            query = library_media(query, ENTRY_FRAGMENTS[media.value.lower()])
+        query = self._http._project(query, "LibraryEntryFields", fields)
+        query = query % f'{f", status: {filter.value}" if filter else ""}'
         data = await self._http.post_data(data={"query": query, "variables": variables})
         try:
-            entries = [
-                LibraryEntry(attributes, self, self._http)
-                for attributes in data["data"]["findProfileById"]["library"]["all"][
-                    "nodes"
-                ]
-            ]
+            nodes = data["data"]["findProfileById"]["library"]["all"]["nodes"]
+            if frame:
+                from ..frames import LibraryFrame
+
+                entries = LibraryFrame.from_nodes(nodes, self, self._http)
+            else:
+                entries = await self._http._build(
+                    lambda attributes: LibraryEntry(attributes, self, self._http),
+                    nodes,
+                )
+            if with_media:
+                await self._http._store_entries(
+                    media.value.lower(), [node["media"] for node in nodes]
+                )
             await self._cache.add(
-                f"user_{self.slug}_library_{media.value}_{limit}_{filter.value if filter else 'ALL'}",
+                cache_key,
                 entries,
                 remove_after=self._cache.expiration,
             )
@@ -269,9 +377,66 @@ class User:
         except KeyError:
             return None
 
+    def iter_library(
+        self,
+        media: MediaType,
+        filter: LibraryEntryStatus = None,
+        per_page: int = 50,
+        limit: Optional[int] = None,
+    ) -> Paginator[LibraryEntry]:
+        """
+        Iterate over the whole library of the user, page by page.
+        Unlike :meth:`library`, this is not capped at 2000.
+
+        .. versionadded:: 1.1.0
+
+        media: :class:`MediaType`
+            The type of media of the entries
+        filter: Optional[:class:`LibraryEntryStatus`]
+            Only fetch entries with this status
+        per_page: :class:`int`
+            Number of entries fetched per request
+        limit: Optional[:class:`int`]
+            Stop after this many entries
+        """
+        return Paginator(
+            self._http,
+            USER_LIBRARY % f'{f", status: {filter.value}" if filter else ""}',
+            {"media": str(media.value).upper(), "id": self.id},
+            ("findProfileById", "library", "all"),
+            lambda attributes: LibraryEntry(attributes, self, self._http),
+            cache_key=(
+                f"user_{self.slug}_library_{media.value}_"
+                f"{filter.value if filter else 'ALL'}"
+            ),
+            per_page=per_page,
+            limit=limit,
+        )
 
-@dataclass()
-class UserProfile:
+    async def stream_library(
+        self, media: MediaType, filter: LibraryEntryStatus = None, limit: int = 10
+    ) -> AsyncIterator[LibraryEntry]:
+        """
+        Same as :meth:`library`, but yields every library entry as soon as
+        it has been received instead of waiting for the whole response.
+        Streamed entries are not cached.
+
+        .. versionadded:: 1.1.0
+        """
+        if limit > 2000:
+            raise InvalidArgument(
+                f"{Fore.RED}The argument {Fore.YELLOW}`limit` {Fore.RED}can't exceed {Fore.LIGHTCYAN_EX}2000{Style.RESET_ALL}"
+            )
+        variables = {"media": str(media.value).upper(), "id": self.id, "limit": limit}
+        query = USER_LIBRARY % f'{f", status: {filter.value}" if filter else ""}'
+        async for attributes in self._http.stream_nodes(
+            data={"query": query, "variables": variables},
+            path=("data", "findProfileById", "library", "all", "nodes"),
+        ):
+            yield LibraryEntry(attributes, self, self._http)
+
+
+class UserProfile(Serializable):
     """
     A profile linked to a :class:`User`
 
@@ -287,8 +452,9 @@ class UserProfile:
         The url to the profile of the user
     """
 
+    __slots__ = ("id", "name", "user", "url")
+
     def __init__(self, attributes: dict, user: str) -> None:
-        self._attributes = attributes
         self.id: int = int(attributes["id"])
         self.name: str = attributes["site"]["name"]
         self.user: str = user
@@ -298,7 +464,7 @@ class UserProfile:
         return f"<UserProfile id={self.id} slug={self.user}>"
 
 
-class Post:
+class Post(Memoized):
     """
     A post made by a :class:`User`
 
@@ -318,27 +484,38 @@ class Post:
         The author of the Post
     """
 
+    __slots__ = (
+        "id",
+        "content",
+        "nsfw",
+        "spoiler",
+        "likes_count",
+        "author",
+        "_created_at",
+        "_attributes",
+    )
+
     def __init__(self, attributes: dict, author: User) -> None:
         self._attributes = attributes
+        self._memo = None
         self.id: int = int(attributes["id"])
         self.content: str = attributes["content"]
         self.nsfw: bool = attributes["isNsfw"]
         self.spoiler: bool = attributes["isSpoiler"]
         self.likes_count: int = int(attributes["likes"]["totalCount"])
         self.author = author
+        if author._http.slim:
+            self._release()
 
     @property
     def created_at(self) -> Optional[datetime]:
-        """When the user registered to Kitsu"""
-        try:
-            return datetime.strptime(
-                self._attributes["createdAt"], "%Y-%m-%dT%H:%M:%SZ"
-            )
-        except ValueError:
-            return None
+        """When the post got published"""
+        return self._derived(
+            "created_at", lambda: parse_datetime(self._attributes["createdAt"])
+        )
 
 
-class LibraryEntry:
+class LibraryEntry(Projectable):
     """
     A library entry that belongs to a :class:`User`
 
@@ -369,23 +546,37 @@ class LibraryEntry:
         If the library entry is NSFW or not
     notes: Optional[:class:`str`]
         Additional notes made by the user
+    partial: :class:`bool`
+        If the entry was fetched with a `fields` projection
+
+        .. versionadded:: 1.1.0
     """
 
-    def __init__(self, attributes: dict, user: User, http: HTTPClient) -> None:
-        self.__http = http
-        self._attributes = attributes
-        self.media_type: str = attributes["media"]["type"]
-        self.media_id: int = attributes["media"]["id"]
-        self.id = int(attributes["id"])
-        self.user: User = user
-        self.progress: int = int(attributes["progress"])
-        self.nsfw: bool = attributes["nsfw"]
-        self.status: LibraryEntryStatus = attributes["status"]
-        self.reconsume_count: int = attributes["reconsumeCount"]
-        self.reconsuming: bool = attributes["reconsuming"]
-        self.rating: Optional[int] = attributes["rating"]
-        self.notes: Optional[str] = attributes["notes"]
-        self.private: bool = attributes["private"]
+    __slots__ = (
+        "id",
+        "media_type",
+        "media_id",
+        "progress",
+        "nsfw",
+        "status",
+        "reconsume_count",
+        "reconsuming",
+        "rating",
+        "notes",
+        "private",
+        "user",
+        "partial",
+        "_created_at",
+        "_progressed_at",
+        "_finished_at",
+        "_attributes",
+        "__http",
+    )
+
+    _spec = LIBRARY_ENTRY_SPEC
+    _parameters = "attributes, user, http"
+    # Name mangling doesn't apply to the generated constructor
+    _prologue = ("self._LibraryEntry__http = http", "self.user = user")
 
     def __repr__(self) -> str:
         return f"<LibraryEntry id={self.id} type={self.media_type} media_id={self.media_id} user={self.user}>"
@@ -409,29 +600,14 @@ class LibraryEntry:
     @property
     def created_at(self) -> Optional[datetime]:
         """When the library entry got created"""
-        try:
-            return datetime.strptime(
-                self._attributes["createdAt"], "%Y-%m-%dT%H:%M:%SZ"
-            )
-        except ValueError:
-            return None
+        return self._timestamp("createdAt", "created_at")
 
     @property
     def progressed_at(self) -> Optional[datetime]:
         """When the library entry got a progress update"""
-        try:
-            return datetime.strptime(
-                self._attributes["progressedAt"], "%Y-%m-%dT%H:%M:%SZ"
-            )
-        except ValueError:
-            return None
+        return self._timestamp("progressedAt", "progressed_at")
 
     @property
     def finished_at(self) -> Optional[datetime]:
-        """When the library entry got finished"""
-        try:
-            return datetime.strptime(
-                self._attributes["finishedAt"], "%Y-%m-%dT%H:%M:%SZ"
-            )
-        except ValueError:
-            return None
+        """When the library entry got finished, if it did"""
+        return self._timestamp("finishedAt", "finished_at")
@@ -0,0 +1,188 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present ShomyKohai
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import (
+    AsyncIterator,
+    Callable,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    TYPE_CHECKING,
+)
+
+if TYPE_CHECKING:
+    from .http import HTTPClient
+
+__all__ = ("Paginator",)
+
+T = TypeVar("T")
+Page = Tuple[List[T], Optional[str], bool]
+
+
+class Paginator(Generic[T]):
+    """
+    Async iterator that walks a GraphQL connection page by page
+    using its ``pageInfo { endCursor hasNextPage }``.
+
+    The next page is requested while the current one is being consumed,
+    and every page is cached, so iterating again is free until the
+    cache expires.
+
+    .. versionadded:: 1.1.0
+
+    Example
+    ---------
+    .. code-block:: python3
+
+        async for episode in anime.iter_episodes(per_page=50):
+            print(episode.number, episode.title)
+
+    Parameters
+    -----------
+    per_page: :class:`int`
+        Number of items fetched per request
+    limit: Optional[:class:`int`]
+        Stop after this many items. Defaults to the whole connection.
+    after: Optional[:class:`str`]
+        Cursor to start after. Defaults to the first page.
+    """
+
+    def __init__(
+        self,
+        http: HTTPClient,
+        query: str,
+        variables: dict,
+        path: Sequence[str],
+        factory: Callable[[dict], T],
+        *,
+        cache_key: Optional[str],
+        per_page: int = 20,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> None:
+        self._http = http
+        self._query = query
+        self._variables = variables
+        self._path = path
+        self._factory = factory
+        self._cache_key = cache_key
+        self.per_page = per_page
+        self.limit = limit
+        self.after = after
+        # totalCount of the connection, when the query selects it
+        self.total: Optional[int] = None
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self._iterate()
+
+    async def flatten(self) -> List[T]:
+        """|coro|
+
+        Fetch every page and return all the items in a list
+        """
+        return [item async for item in self]
+
+    async def pages(self) -> AsyncIterator[Tuple[List[T], Optional[str]]]:
+        """
+        Iterate over whole pages, as ``(items, end_cursor)`` tuples.
+        Passing an end cursor as `after` resumes right after that page.
+        With a `limit`, no more items than needed are requested.
+        """
+        remaining = self.limit
+        if remaining is not None and remaining <= 0:
+            return
+        task: Optional[asyncio.Task] = asyncio.ensure_future(
+            self._page(self.after, self._size(remaining))
+        )
+        try:
+            while task is not None:
+                items, cursor, has_next = await task
+                if remaining is not None:
+                    remaining -= len(items)
+                # Read the next page ahead while this one is consumed,
+                # unless the limit is already reached
+                task = (
+                    asyncio.ensure_future(self._page(cursor, self._size(remaining)))
+                    if has_next and cursor and (remaining is None or remaining > 0)
+                    else None
+                )
+                yield items, cursor
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def _iterate(self) -> AsyncIterator[T]:
+        remaining = self.limit
+        pages = self.pages()
+        try:
+            async for items, _ in pages:
+                for item in items:
+                    if remaining is not None:
+                        if remaining <= 0:
+                            return
+                        remaining -= 1
+                    yield item
+                if remaining is not None and remaining <= 0:
+                    return
+        finally:
+            await pages.aclose()  # type: ignore
+
+    def _size(self, remaining: Optional[int]) -> int:
+        """Items to request for the next page"""
+        return self.per_page if remaining is None else min(self.per_page, remaining)
+
+    async def _page(self, cursor: Optional[str], size: int) -> Page[T]:
+        cache_key = (
+            f"{self._cache_key}_page_{size}_{cursor or 'start'}"
+            if self._cache_key
+            else None
+        )
+        if cache_key:
+            cache_res = await self._http._cache.get(cache_key)
+            if cache_res:
+                return cache_res.value
+        variables = {**self._variables, "limit": size, "after": cursor}
+        data = await self._http.post_data(
+            data={"query": self._query, "variables": variables}
+        )
+        connection = data["data"]
+        for key in self._path:
+            connection = connection[key] if connection else None
+        if not connection:
+            return [], None, False
+        self.total = connection.get("totalCount", self.total)
+        items = await self._http._build(self._factory, connection["nodes"])
+        page_info = connection["pageInfo"]
+        page = (items, page_info["endCursor"], page_info["hasNextPage"])
+        if cache_key:
+            await self._http._cache.add(
+                cache_key, page, remove_after=self._http._cache_expiration
+            )
+        return page
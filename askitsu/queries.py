@@ -1,681 +1,618 @@
 # QUERIES FOR KITSU GRAPHQL API
 
+import json
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Tuple
 
-# ================ ANIME ================
+from .spec import ANIME_SPEC, LIBRARY_ENTRY_SPEC, MANGA_SPEC, selections
 
-ANIME_BY_ID: str = """
-            query animeByID($id: ID!) {
-                findAnimeById(id: $id) {
-                    id
-                    slug
-                    createdAt
-                    updatedAt
-                    startDate
-                    endDate
-                    description
-                    status
-                    sfw
-                    animesub: subtype
-                    ageRating
-                    endDate
-                    season
-                    episodeCount
-                    episodeLength
-                    totalLength
-                    youtubeTrailerVideoId
-                    averageRatingRank
-                    averageRating
-                    userCountRank
-                    titles{
-                        canonical
-                        localized
-                    }
-                    posterImage {
-                        original {
-                            url
-                        }
-                        views {
-                            name
-                            url
-                          	width
-                          	height
-                        }
-                    }
-                    bannerImage {
-                    original {
-                        url
-                    }
-                    views {
-                        name
-                        url
-                      	width
-                      	height
-                    }      
-                    }
-                }
+
+# ================ COMPILER ================
+
+_WHITESPACE = re.compile(r"\s+")
+_PUNCTUATION = re.compile(r" ?([{}()\[\]:,=!]) ?")
+_SPREAD = re.compile(r"\.\.\.\s*([_A-Za-z]\w*)")
+
+FRAGMENTS: Dict[str, str] = {}
+
+
+def minify(query: str) -> str:
+    """Strip every insignificant whitespace from a GraphQL document"""
+    return _PUNCTUATION.sub(r"\1", _WHITESPACE.sub(" ", query).strip())
+
+
+def fragment(name: str, on: str, fields: str) -> str:
+    """Register a fragment that :func:`compile_query` can append to queries"""
+    FRAGMENTS[name] = minify(f"fragment {name} on {on} {{ {fields} }}")
+    return fields
+
+
+def _used_fragments(document: str, found: List[str]) -> List[str]:
+    for name in _SPREAD.findall(document):
+        if name != "on" and name not in found:
+            found.append(name)
+            _used_fragments(FRAGMENTS[name], found)
+    return found
+
+
+def compile_query(query: str) -> str:
+    """Minify a query and append the fragments it spreads"""
+    query = minify(query)
+    return " ".join([query, *(FRAGMENTS[name] for name in _used_fragments(query, []))])
+
+
+@lru_cache(maxsize=512)
+def encode_prefix(query: str) -> bytes:
+    """The request body up to the variables object, already encoded.
+    Sending a query only needs the variables to be serialized."""
+    return (json.dumps({"query": query})[:-1] + ',"variables":').encode()
+
+
+def encode_body(query: str, variables: dict) -> bytes:
+    return (
+        encode_prefix(query)
+        + json.dumps(variables, separators=(",", ":")).encode()
+        + b"}"
+    )
+
+
+# ================ FIELD SETS ================
+
+IMAGE_FIELDS = fragment(
+    "ImageFields",
+    "Image",
+    """
+    original {
+        url
+    }
+    views {
+        name
+        url
+        width
+        height
+    }
+""",
+)
+
+# Selection needed by every field (or property) of a model, used to build
+# both the full fragments and the reduced ones of :func:`project`
+ANIME_SELECTIONS: Dict[str, str] = selections(ANIME_SPEC)
+MANGA_SELECTIONS: Dict[str, str] = selections(MANGA_SPEC)
+LIBRARY_ENTRY_SELECTIONS: Dict[str, str] = selections(LIBRARY_ENTRY_SPEC)
+
+SELECTIONS: Dict[str, Dict[str, str]] = {}
+# Fields that are always fetched, even when not requested
+REQUIRED: Dict[str, Tuple[str, ...]] = {
+    "AnimeFields": ("id",),
+    "MangaFields": ("id",),
+    "LibraryEntryFields": ("id", "media_id"),
+}
+
+
+def selection_fragment(name: str, on: str, selections: Dict[str, str]) -> str:
+    SELECTIONS[name] = selections
+    return fragment(name, on, " ".join(dict.fromkeys(selections.values())))
+
+
+ANIME_FIELDS = selection_fragment("AnimeFields", "Anime", ANIME_SELECTIONS)
+MANGA_FIELDS = selection_fragment("MangaFields", "Manga", MANGA_SELECTIONS)
+LIBRARY_ENTRY_FIELDS = selection_fragment(
+    "LibraryEntryFields", "LibraryEntry", LIBRARY_ENTRY_SELECTIONS
+)
+
+
+@lru_cache(maxsize=256)
+def project(query: str, name: str, fields: FrozenSet[str]) -> str:
+    """
+    Replace the spread of the `name` fragment in a compiled query
+    with the selections needed by `fields` only.
+    Raises :class:`KeyError` for unknown fields.
+    """
+    selections = SELECTIONS[name]
+    wanted = [*REQUIRED[name], *sorted(fields)]
+    selection = " ".join(dict.fromkeys(selections[field] for field in wanted))
+    operation = query.split(" fragment ", 1)[0]
+    return compile_query(operation.replace(f"...{name}", selection))
+
+
+PROFILE_FIELDS = fragment(
+    "ProfileFields",
+    "Profile",
+    """
+    id
+    createdAt
+    name
+    slug
+    birthday
+    about
+    location
+    waifuOrHusbando
+    gender
+    proTier
+    url
+    posts (first: 1) {
+        totalCount
+    }
+    mediaReactions (first: 1) {
+        totalCount
+    }
+    comments (first: 1) {
+        totalCount
+    }
+    followers (first: 1) {
+        totalCount
+    }
+    following (first: 1) {
+        totalCount
+    }
+    favorites (first: 1) {
+        totalCount
+    }
+    avatarImage {
+        ...ImageFields
+    }
+    bannerImage {
+        ...ImageFields
+    }
+""",
+)
+
+CHARACTER_FIELDS = """
+    role
+    character {
+        id
+        slug
+        description
+        names {
+            canonical
+            localized
+        }
+        image {
+            original {
+                url
+            }
+            views {
+                url
             }
+        }
+    }
 """
 
-ANIME_BY_ID_EPISODES: str = """
-            query episodes ($id: ID!, $limit: Int!) {
-                findAnimeById(id: $id) {
-                episodes (first: $limit) {
-                nodes {
-                    id
-                    length
-                    number
-                    titles {
-                        canonical
-                        localized
-                    }
-                    description
-                    thumbnail {
-                        original {
-                            url
-                        }
-                    }
-                    }
-                }
-                }
-            } 
+CATEGORY_FIELDS = """
+    id
+    title
+    slug
+    description
+    isNsfw
 """
 
-ANIME_BY_ID_REVIEWS: str = """
-            query reviews ($id: ID!, $limit: Int!) {
-                findAnimeById(id: $id) {
-                reactions (first: $limit) {
-                nodes {
-                    id
-                    progress
-                    reaction
-                }
-                }
-                }
-            }
+PAGE_INFO = "pageInfo { endCursor hasNextPage }"
+
+EPISODE_FIELDS = """
+    id
+    length
+    number
+    titles {
+        canonical
+        localized
+    }
+    description
+    thumbnail {
+        original {
+            url
+        }
+    }
 """
 
-ANIME_BY_ID_CHARACTERS: str = """
-            query characters ($id: ID!, $limit: Int) {
-                findAnimeById(id: $id) {
-                characters (first: $limit) {
-                nodes {
-                    role
-                    character {
-                    id
-                    slug
-                    description
-                    names {
-                        canonical
-                        localized
-                    }
-                    image {
-                        original {
-                        url
-                        }
-                        views {
-                        url
-                        }
-                    }
-                    }
-                }
-                }
-                }
-            }
+CHAPTER_FIELDS = """
+    id
+    titles {
+        romanized
+    }
+    description
+    number
+    thumbnail {
+        original {
+            url
+        }
+    }
 """
 
-ANIME_BY_ID_CATEGORIES: str = """
-            query category ($id: ID!) {
-                findAnimeById(id: $id) {
-                categories (first: 25) {
-                nodes {
-                    title
-                    slug
-                    description
-                    isNsfw
-                }
-                }
-                }
-            }
+STREAMLINK_FIELDS = """
+    id
+    streamer {
+        siteName
+    }
+    subs
+    dubs
+    url
 """
 
-ANIME_BY_ID_STREAMLINKS: str = """
-            query streamLinks ($id: ID!) {
-                findAnimeById(id: $id) {
-                streamingLinks (first: 10) {
-                nodes {
-                    id
-                    streamer {
-                        siteName
-                    }
-                    subs
-                    dubs
-                    url
-                } 
-                }
-                }
-            }
+REVIEW_FIELDS = """
+    id
+    progress
+    reaction
 """
 
-ANIME_BY_TITLE: str = """
-        query animeByTitle($title: String!, $limit: Int) {
-            searchAnimeByTitle(first: $limit, title: $title) {
+
+@lru_cache(maxsize=64)
+def batch_by_id(root: str, selection: str, count: int) -> str:
+    """
+    A query fetching `count` ids from the same root at once,
+    aliased as ``e0``, ``e1``, ... and taking ``$i0``, ``$i1``, ... as ids
+    """
+    variables = ", ".join(f"$i{n}: ID!" for n in range(count))
+    roots = " ".join(f"e{n}: {root}(id: $i{n}) {{ {selection} }}" for n in range(count))
+    return compile_query(f"query batch({variables}) {{ {roots} }}")
+
+
+def _connection(field: str, selection: str) -> str:
+    return (
+        f"{field} (first: $limit, after: $after) "
+        f"{{ nodes {{ {selection} }} {PAGE_INFO} }}"
+    )
+
+
+def _by_id(name: str, root: str, selection: str, arguments: str = "") -> str:
+    return compile_query(
+        f"query {name} ($id: ID!{arguments}) {{ {root}(id: $id) {{ {selection} }} }}"
+    )
+
+
+# ================ ANIME ================
+
+ANIME_BY_ID: str = _by_id("animeByID", "findAnimeById", "...AnimeFields")
+
+ANIME_BY_ID_EPISODES: str = _by_id(
+    "episodes",
+    "findAnimeById",
+    _connection("episodes", EPISODE_FIELDS),
+    ", $limit: Int!, $after: String",
+)
+
+ANIME_BY_ID_REVIEWS: str = _by_id(
+    "reviews",
+    "findAnimeById",
+    _connection("reactions", REVIEW_FIELDS),
+    ", $limit: Int!, $after: String",
+)
+
+ANIME_BY_ID_CHARACTERS: str = _by_id(
+    "characters",
+    "findAnimeById",
+    _connection("characters", CHARACTER_FIELDS),
+    ", $limit: Int, $after: String",
+)
+
+ANIME_BY_ID_CATEGORIES: str = _by_id(
+    "category",
+    "findAnimeById",
+    f"categories (first: 25) {{ nodes {{ {CATEGORY_FIELDS} }} }}",
+)
+
+ANIME_BY_ID_STREAMLINKS: str = _by_id(
+    "streamLinks",
+    "findAnimeById",
+    f"streamingLinks (first: 10) {{ nodes {{ {STREAMLINK_FIELDS} }} }}",
+)
+
+ANIME_BY_TITLE: str = compile_query(
+    """
+    query animeByTitle($title: String!, $limit: Int, $after: String) {
+        searchAnimeByTitle(first: $limit, after: $after, title: $title) {
             nodes {
-                id
-                slug
-                createdAt
-                updatedAt
-                startDate
-                endDate
-                description
-                status
-                sfw
-                animesub: subtype
-                ageRating
-                endDate
-                season
-                episodeCount
-                episodeLength
-                totalLength
-                youtubeTrailerVideoId
-                averageRatingRank
-                averageRating
-                userCountRank
-                titles{
-                    canonical
-                    localized
-                }
-                posterImage {
-                    original {
-                        url
-                    }
-                    views {
-                        name
-                        url
-                        width
-                        height
-                    }
-                }
-                bannerImage {
-                original {
-                    url
-                }
-                views {
-                    name
-                    url
-                    width
-                    height
-                }      
-                }
-            }
+                ...AnimeFields
             }
+            %s
         }
+    }
 """
+    % PAGE_INFO
+)
 
 # ================ MANGA ================
 
-MANGA_BY_ID: str = """
-        query mangaByID ($id: ID!) {
-        findMangaById(id: $id) {
-            id
-            slug
-            createdAt
-            updatedAt
-            startDate
-            endDate
-            description
-            status
-            sfw
-            mangasub: subtype
-            ageRating
-            endDate
-            chapterCount
-            volumeCount
-            averageRatingRank
-            averageRating
-            userCountRank
-            titles{
-            canonical
-            localized
-            }
-            posterImage {
-            original {
-                url
-            }
-            views {
-                name
-                url
-                width
-                height
-            }
-            }
-            bannerImage {
-            original {
-                url
-            }
-            views {
-                name
-                url
-                width
-                height
-            }      
+MANGA_BY_ID: str = _by_id("mangaByID", "findMangaById", "...MangaFields")
+
+MANGA_BY_ID_CHAPTERS: str = _by_id(
+    "chapters",
+    "findMangaById",
+    _connection("chapters", CHAPTER_FIELDS),
+    ", $limit: Int, $after: String",
+)
+
+MANGA_BY_ID_CHARACTERS: str = _by_id(
+    "characters",
+    "findMangaById",
+    _connection("characters", CHARACTER_FIELDS),
+    ", $limit: Int, $after: String",
+)
+
+MANGA_BY_ID_CATEGORIES: str = _by_id(
+    "category",
+    "findMangaById",
+    f"categories (first: 25) {{ nodes {{ {CATEGORY_FIELDS} }} }}",
+)
+
+MANGA_BY_ID_REVIEWS: str = _by_id(
+    "reviews",
+    "findMangaById",
+    _connection("reactions", REVIEW_FIELDS),
+    ", $limit: Int!, $after: String",
+)
+
+MANGA_BY_TITLE: str = compile_query(
+    """
+    query mangaByTitle($title: String!, $limit: Int, $after: String) {
+        searchMangaByTitle(first: $limit, after: $after, title: $title) {
+            nodes {
+                ...MangaFields
             }
+            %s
         }
+    }
+"""
+    % PAGE_INFO
+)
+
+# ================ USERS ================
+
+USERS_BY_ID: str = _by_id("userByID", "findProfileById", "...ProfileFields")
 
+USERS_BY_ID_SOCIAL = _by_id(
+    "socials",
+    "findProfileById",
+    """
+    siteLinks (first: 30) {
+        nodes {
+            id
+            url
+            site {
+                name
+            }
         }
-"""
+    }
+""",
+)
 
-MANGA_BY_ID_CHAPTERS = """
-        query chapters ($id: ID!, $limit: Int) {
-        findMangaById(id: $id) {
-            chapters (first: $limit) {
+USER_BY_USERNAME = compile_query(
+    """
+    query userByUsername ($name: String!) {
+        searchProfileByUsername (first: 1, username: $name) {
             nodes {
-                id
-                titles {
-                romanized
-                }
-                description
-                number
-                thumbnail {
-                original {
-                    url
-                }
-            }
-            }
+                ...ProfileFields
             }
         }
+    }
+"""
+)
+
+USER_CHECK = compile_query(
+    """
+    query checkUser ($slug: String!) {
+        findProfileBySlug(slug: $slug) {
+            slug
         }
+    }
 """
+)
 
-MANGA_BY_ID_CHARACTERS: str = """
-            query characters ($id: ID!, $limit: Int) {
-                findMangaById(id: $id) {
-                characters (first: $limit) {
-                nodes {
-                    role
-                    character {
-                    id
-                    slug
-                    description
-                    names {
-                        canonical
-                        localized
+USER_LIBRARY = compile_query(
+    """
+    query Library ($media: MediaTypeEnum!, $id: ID!, $limit: Int, $after: String) {
+        findProfileById(id: $id) {
+            library {
+                all(mediaType: $media, first: $limit, after: $after%s) {
+                    nodes {
+                        ...LibraryEntryFields
                     }
-                    image {
-                        original {
-                        url
-                        }
-                        views {
-                        url
-                        }
+                    pageInfo {
+                        endCursor
+                        hasNextPage
                     }
-                    }
-                }
-                }
                 }
             }
+        }
+    }
 """
+)
 
-MANGA_BY_ID_CATEGORIES: str = """
-            query category ($id: ID!) {
-                findMangaById(id: $id) {
-                categories (first: 25) {
-                nodes {
-                    title
-                    slug
-                    description
-                    isNsfw
-                }
-                }
-                }
-            }
-"""
+USER_LIBRARY_COUNT = _by_id(
+    "library_entries_count",
+    "findProfileById",
+    """
+    library {
+        all(mediaType: $media, first: 2000) {
+            totalCount
+        }
+    }
+""",
+    ", $media: MediaTypeEnum!",
+)
 
-MANGA_BY_ID_REVIEWS: str = """
-            query reviews ($id: ID!, $limit: Int!) {
-                findAnimeById(id: $id) {
-                reactions (first: $limit) {
-                nodes {
-                    id
-                    progress
-                    reaction
-                }
+# ================ MISC ================
+
+TRENDING_ENTRY = compile_query(
+    """
+    query trending ($media: MediaTypeEnum!, $limit: Int) {
+        globalTrending (first: $limit, mediaType: $media) {
+            nodes {
+                ... on Anime {
+                    ...AnimeFields
                 }
+                ... on Manga {
+                    ...MangaFields
                 }
             }
+        }
+    }
 """
+)
 
-MANGA_BY_TITLE: str = """
-            query mangaByTitle($title: String!, $limit: Int) {
-                searchMangaByTitle(first: $limit, title: $title) {
-                nodes {
-                    id
-                        slug
-                        createdAt
-                        updatedAt
-                        startDate
-                        endDate
-                        description
-                        status
-                        sfw
-                        mangasub: subtype
-                        ageRating
-                        endDate
-                        chapterCount
-                        volumeCount
-                        averageRatingRank
-                        averageRating
-                        userCountRank
-                        titles{
-                        canonical
-                        localized
-                        }
-                        posterImage {
-                        original {
-                            url
-                        }
-                        views {
-                            name
-                            url
-                            width
-                            height
-                        }
-                        }
-                        bannerImage {
-                        original {
-                            url
-                        }
-                        views {
-                            name
-                            url
-                            width
-                            height
-                        }      
-                        }
-                } 
-            }
+POSTS_FROM_USER = _by_id(
+    "posts",
+    "findProfileById",
+    """
+    posts (first: $limit, after: $after) {
+        nodes {
+            id
+            createdAt
+            content
+            isNsfw
+            isSpoiler
+            likes (first: 1) {
+                totalCount
             }
-"""
-# ================ USERS ================
+        }
+        %s
+    }
+""" % PAGE_INFO,
+    ", $limit: Int, $after: String",
+)
 
-USERS_BY_ID: str = """
-            query userByID ($id: ID!) {
-            findProfileById (id: $id) {
-                id
-                createdAt
-                name
-                slug
-                birthday 
-                about
-                location
-                waifuOrHusbando
-                gender
-                proTier
-                url
-                posts (first: 1) {
-                    totalCount
-                }
-                mediaReactions(first: 1){
-                    totalCount
-                }
-                comments (first: 1) {
-                    totalCount
-                }
-                followers (first: 1){
-                    totalCount
-                }
-                following (first: 1){
-                    totalCount
-                }
-                favorites (first: 1){
-                    totalCount
-                }
-                avatarImage {
-                    original {
-                        url
-                    }
-                    views {
-                        name
-                        url
-                    }
-                }
-                bannerImage {
-                    original {
-                        url
-                    }
-                    views {
-                        name
-                        url
-                        width
-                        height
-                    }
-                }
-            }
+# ================ CATALOG ================
+
+ANIME_CATALOG = compile_query(
+    """
+    query animeCatalog ($limit: Int, $after: String) {
+        anime (first: $limit, after: $after) {
+            totalCount
+            nodes {
+                ...AnimeFields
             }
+            %s
+        }
+    }
 """
+    % PAGE_INFO
+)
 
-USERS_BY_ID_SOCIAL = """
-            query socials ($id: ID!) {
-            findProfileById (id: $id) {
-                siteLinks (first: 30) {
-                nodes {
-                    id
-                    url
-                    site{
-                        name
-                    }
-                }
-                }
-            }
+MANGA_CATALOG = compile_query(
+    """
+    query mangaCatalog ($limit: Int, $after: String) {
+        manga (first: $limit, after: $after) {
+            totalCount
+            nodes {
+                ...MangaFields
             }
+            %s
+        }
+    }
 """
+    % PAGE_INFO
+)
 
-USER_BY_USERNAME = """
-            query userByUsername ($name: String!) {
-                searchProfileByUsername (first: 1, username: $name) {
-                nodes {
-                    id
-                    createdAt
-                    name
-                    slug
-                    birthday 
-                    about
-                    location
-                    waifuOrHusbando
-                    gender
-                    url
-                        proTier
-                    posts (first: 1) {
-                        totalCount
-                    }
-                    mediaReactions(first: 1){
-                        totalCount
-                    }
-                    comments (first: 1) {
-                        totalCount
-                    }
-                    followers (first: 1){
-                        totalCount
-                    }
-                    following (first: 1){
-                        totalCount
-                    }
-                    favorites (first: 1){
-                        totalCount
-                    }
-                    avatarImage {
-                        original {
-                            url
-                        }
-                        views {
-                            name
-                            url
-                        }
-                    }
-                    bannerImage {
-                        original {
-                            url
-                        }
-                        views {
-                            name
-                            url
-                            width
-                            height
-                        }
-                    }
-                    }
-                    }
+# Most recently updated first, for incremental syncs
+ANIME_UPDATES = compile_query(
+    """
+    query animeUpdates ($limit: Int, $after: String) {
+        anime (first: $limit, after: $after, sort: [{on: UPDATED_AT, direction: DESCENDING}]) {
+            nodes {
+                ...AnimeFields
             }
+            %s
+        }
+    }
 """
+    % PAGE_INFO
+)
 
-USER_LIBRARY = """
-            query Library ($media: MediaTypeEnum!, $id: ID!, $limit: Int){
-                findProfileById(id: $id){
-                library{
-                    all(mediaType:$media, first: $limit%s){
-                    nodes{
-                        createdAt
-                        progressedAt
-                        finishedAt
-                        media {
-                        id
-                        type
-                        }
-                        id
-                        nsfw
-                        status
-                        reconsuming
-                        reconsumeCount
-                        rating
-                        notes
-                        private
-                        progress
-                    }
-                }
-                }
-            }
+MANGA_UPDATES = compile_query(
+    """
+    query mangaUpdates ($limit: Int, $after: String) {
+        manga (first: $limit, after: $after, sort: [{on: UPDATED_AT, direction: DESCENDING}]) {
+            nodes {
+                ...MangaFields
             }
+            %s
+        }
+    }
 """
+    % PAGE_INFO
+)
 
-# ================ MISC ================
+# ================ RELATIONS ================
+
+# Selections of the relations that can be fetched along with an entry,
+# with the same arguments as the queries their properties send
+_CATEGORIES = f"categories (first: 25) {{ nodes {{ {CATEGORY_FIELDS} }} }}"
+_CHARACTERS = f"characters (first: 100) {{ nodes {{ {CHARACTER_FIELDS} }} }}"
+
+RELATIONS: Dict[str, Dict[str, str]] = {
+    "anime": {
+        "categories": _CATEGORIES,
+        "characters": _CHARACTERS,
+        "stream_links": (
+            f"streamingLinks (first: 10) {{ nodes {{ {STREAMLINK_FIELDS} }} }}"
+        ),
+        "episodes": f"episodes (first: 12) {{ nodes {{ {EPISODE_FIELDS} }} }}",
+    },
+    "manga": {
+        "categories": _CATEGORIES,
+        "characters": _CHARACTERS,
+        "chapters": f"chapters (first: 12) {{ nodes {{ {CHAPTER_FIELDS} }} }}",
+    },
+}
+
+
+def relation_selection(entry_type: str, relations: Tuple[str, ...]) -> str:
+    """
+    Selection of `relations`, raises :class:`KeyError` for unknown ones
+    """
+    return " ".join(RELATIONS[entry_type][relation] for relation in relations)
+
+
+@lru_cache(maxsize=64)
+def include(query: str, name: str, entry_type: str, relations: Tuple[str, ...]) -> str:
+    """
+    Select `relations` next to the spread of the `name` fragment
+    in a compiled query
+    """
+    selection = relation_selection(entry_type, relations)
+    operation = query.split(" fragment ", 1)[0]
+    return compile_query(operation.replace(f"...{name}", f"...{name} {selection}"))
+
+
+@lru_cache(maxsize=16)
+def library_media(query: str, media_fragment: str) -> str:
+    """
+    Select the whole linked media of every entry in a compiled
+    library query, next to the spread of ``LibraryEntryFields``
+    """
+    operation = query.split(" fragment ", 1)[0]
+    return compile_query(
+        operation.replace(
+            "...LibraryEntryFields",
+            f"...LibraryEntryFields media {{ ...{media_fragment} }}",
+        )
+    )
+
+
+# ================ SEARCH ================
+
+# Root field, argument taking the query, and selection of each searchable type
+SEARCH_ROOTS = {
+    "anime": ("searchAnimeByTitle", "title", "...AnimeFields"),
+    "manga": ("searchMangaByTitle", "title", "...MangaFields"),
+    "user": ("searchProfileByUsername", "username", "...ProfileFields"),
+}
+
+
+@lru_cache(maxsize=16)
+def search_all(types: Tuple[str, ...]) -> str:
+    """
+    A query searching every type at once, each one aliased with its name,
+    e.g. ``anime: searchAnimeByTitle(...)``
+    """
+    roots = " ".join(
+        f"{type}: {SEARCH_ROOTS[type][0]} (first: $limit, "
+        f"{SEARCH_ROOTS[type][1]}: $query) {{ nodes {{ {SEARCH_ROOTS[type][2]} }} }}"
+        for type in types
+    )
+    return compile_query(f"query searchAll ($query: String!, $limit: Int) {{ {roots} }}")
 
-TRENDING_ENTRY = """
-            query checkUser ($media: MediaTypeEnum!, $limit: Int) {
-            globalTrending (first: $limit, mediaType: $media) {
-                nodes {
-                ... on Anime {
-                        id
-                        slug
-                        createdAt
-                        updatedAt
-                        startDate
-                        endDate
-                        description
-                        status
-                        sfw
-                        animesub: subtype
-                        ageRating
-                        endDate
-                        season
-                        episodeCount
-                        episodeLength
-                        totalLength
-                        youtubeTrailerVideoId
-                        averageRatingRank
-                        averageRating
-                        userCountRank
-                        titles{
-                            canonical
-                            localized
-                        }
-                        posterImage {
-                            original {
-                                url
-                            }
-                            views {
-                                name
-                                url
-                                width
-                                height
-                            }
-                        }
-                        bannerImage {
-                        original {
-                            url
-                        }
-                        views {
-                            name
-                            url
-                            width
-                            height
-                        }      
-                        }
-                }
-                ... on Manga {
-                                id
-                        slug
-                        createdAt
-                        updatedAt
-                        startDate
-                        endDate
-                        description
-                        status
-                        sfw
-                        mangasub: subtype
-                        ageRating
-                        endDate
-                        chapterCount
-                        volumeCount
-                        averageRatingRank
-                        averageRating
-                        userCountRank
-                        titles{
-                        canonical
-                        localized
-                        }
-                        posterImage {
-                        original {
-                            url
-                        }
-                        views {
-                            name
-                            url
-                            width
-                            height
-                        }
-                        }
-                        bannerImage {
-                        original {
-                            url
-                        }
-                        views {
-                            name
-                            url
-                            width
-                            height
-                        }      
-                        }
-                }
-                }
-            }
-            }
-"""
 
-POSTS_FROM_USER = """
-            query posts($id: ID!, $limit: Int) {
-            findProfileById (id: $id) {
-              posts (first: $limit) {
-                nodes{
-                  id
-                  createdAt
-                  content
-                  isNsfw
-                  isSpoiler
-                  likes(first: 1){
-                    totalCount
-                  }
-                }
-              }
-            }}"""
 # ================ METHODS ================
 
 QUERY_METHODS = {
@@ -686,6 +623,11 @@ QUERY_METHODS = {
     # "character_search": "findCharacterBySlug"
 }
 
+ENTRY_FRAGMENTS = {
+    "anime": "AnimeFields",
+    "manga": "MangaFields",
+}
+
 ENTRY_TITLE = {
     "searchAnimeByTitle": ANIME_BY_TITLE,
     "searchMangaByTitle": MANGA_BY_TITLE,
@@ -701,7 +643,23 @@ ENTRY_ID_REVIEWS = {
     "findMangaById": MANGA_BY_ID_REVIEWS,
 }
 
+ENTRY_CATALOG = {
+    "anime": ANIME_CATALOG,
+    "manga": MANGA_CATALOG,
+}
+
+ENTRY_UPDATES = {
+    "anime": ANIME_UPDATES,
+    "manga": MANGA_UPDATES,
+}
+
 ENTRY_ID_CHARACTERS = {
     "findAnimeById": ANIME_BY_ID_CHARACTERS,
     "findMangaById": MANGA_BY_ID_CHARACTERS,
 }
+
+# Static queries get their request body prefix encoded once, at import time
+for _query in [value for value in list(globals().values()) if isinstance(value, str)]:
+    if _query.startswith("query ") and "%s" not in _query:
+        encode_prefix(_query)
+del _query
@@ -0,0 +1,200 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present ShomyKohai
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from types import CodeType
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Union
+
+from .utils import intern
+
+__all__ = (
+    "Field",
+    "ENTRY_SPEC",
+    "ANIME_SPEC",
+    "MANGA_SPEC",
+    "LIBRARY_ENTRY_SPEC",
+    "constructor",
+    "selections",
+)
+
+
+class Field(NamedTuple):
+    """
+    How a model attribute (or property) maps to the fetched GraphQL tree.
+
+    key: the response key holding the value
+    selection: what to select for it, defaults to `key`
+    convert: applied to the value before storing it, either a callable or an
+        expression of `value` inlined in the generated constructor
+        (:func:`intern` is in scope)
+    stored: whether the constructor sets it, properties only need the
+        raw `key` to be kept
+    """
+
+    key: str
+    selection: Optional[str] = None
+    convert: Union[str, Callable[[Any], Any], None] = None
+    stored: bool = True
+
+
+_TITLES = "titles { canonical localized }"
+
+# Private attributes (leading underscore) are filled by the constructor but
+# can't be requested with `fields`
+ENTRY_SPEC: Dict[str, Field] = {
+    "id": Field("id", convert="int(value)"),
+    "slug": Field("slug"),
+    "description": Field("description", convert="value.get('en')"),
+    "status": Field("status", convert="intern(value)"),
+    "age_rating": Field("ageRating", convert="intern(value)"),
+    "rating_rank": Field("averageRatingRank"),
+    "rating": Field("averageRating"),
+    "popularity_rank": Field("userCountRank"),
+    "canonical_title": Field("titles", _TITLES, "value['canonical']"),
+    "_titles": Field("titles", _TITLES, "value['localized']"),
+    "url": Field("slug", stored=False),
+    "created_at": Field("createdAt", stored=False),
+    "updated_at": Field("updatedAt", stored=False),
+    "started_at": Field("startDate", stored=False),
+    "ended_at": Field("endDate", stored=False),
+    "title": Field("titles", _TITLES, stored=False),
+    "poster_image": Field(
+        "posterImage", "posterImage { ...ImageFields }", stored=False
+    ),
+    "cover_image": Field(
+        "bannerImage", "bannerImage { ...ImageFields }", stored=False
+    ),
+}
+
+ANIME_SPEC: Dict[str, Field] = {
+    **ENTRY_SPEC,
+    "nsfw": Field("sfw", convert="not value"),
+    "subtype": Field("animesub", "animesub: subtype", "intern(value)"),
+    "episode_count": Field("episodeCount"),
+    "episode_length": Field("episodeLength"),
+    "total_length": Field("totalLength"),
+    "yt_id": Field("youtubeTrailerVideoId"),
+    "season": Field("season", convert="intern(value)"),
+    "youtube_url": Field("youtubeTrailerVideoId", stored=False),
+}
+
+MANGA_SPEC: Dict[str, Field] = {
+    **ENTRY_SPEC,
+    "subtype": Field("mangasub", "mangasub: subtype", "intern(value)"),
+    "chapter_count": Field("chapterCount"),
+    "volume_count": Field("volumeCount"),
+}
+
+LIBRARY_ENTRY_SPEC: Dict[str, Field] = {
+    "id": Field("id", convert="int(value)"),
+    "media_id": Field("media", "media { id type }", "value['id']"),
+    "media_type": Field("media", "media { id type }", "intern(value['type'])"),
+    "progress": Field("progress", convert="int(value)"),
+    "nsfw": Field("nsfw"),
+    "status": Field("status", convert="intern(value)"),
+    "reconsuming": Field("reconsuming"),
+    "reconsume_count": Field("reconsumeCount"),
+    "rating": Field("rating"),
+    "notes": Field("notes"),
+    "private": Field("private"),
+    "created_at": Field("createdAt", stored=False),
+    "progressed_at": Field("progressedAt", stored=False),
+    "finished_at": Field("finishedAt", stored=False),
+}
+
+
+def selections(spec: Dict[str, Field]) -> Dict[str, str]:
+    """The selection each public field of `spec` needs"""
+    return {
+        name: field.selection or field.key
+        for name, field in spec.items()
+        if not name.startswith("_")
+    }
+
+
+@lru_cache(maxsize=None)
+def _compile(source: str) -> CodeType:
+    # Subclasses sharing a spec (and every reload of it) compile once
+    return compile(source, "<askitsu.spec>", "exec")
+
+
+def constructor(
+    qualname: str, parameters: str, prologue: Iterable[str], spec: Dict[str, Field]
+) -> Callable[..., None]:
+    """
+    Generate the `__init__` of a model from its spec.
+
+    The function runs `prologue`, then sets every stored field whose key was
+    fetched without any loop or per-field lookup: keys shared by several
+    fields are read once and expressions are inlined. A single subset test
+    against every key of the spec, properties included, tells complete
+    trees from projected ones (`partial`), so only the latter check every key.
+    Slim clients get the fetched tree released.
+    """
+    namespace: Dict[str, Any] = {"intern": intern}
+    grouped: Dict[str, List[str]] = {}
+    for name, field in spec.items():
+        if not field.stored:
+            continue
+        convert = field.convert
+        if convert is None:
+            expression = "value"
+        elif isinstance(convert, str):
+            expression = f"({convert})"
+        else:
+            # Named by position so equal specs produce the same source
+            function = f"_convert_{len(namespace)}"
+            namespace[function] = convert
+            expression = f"{function}(value)"
+        grouped.setdefault(field.key, []).append(f"self.{name} = {expression}")
+    # Complete trees take the first branch, projected ones check each key.
+    # The keys only read by properties count too, or a projection lacking
+    # one of them would look complete and never get hydrated
+    namespace["_keys"] = frozenset(field.key for field in spec.values())
+    lines = [
+        f"def __init__(self, {parameters}):",
+        *prologue,
+        "self._attributes = attributes",
+        "self._memo = None",
+        "if attributes.keys() >= _keys:",
+        "    self.partial = False",
+    ]
+    for key, assignments in grouped.items():
+        lines.append(f"    value = attributes[{key!r}]")
+        lines += (f"    {assignment}" for assignment in assignments)
+    lines += ["else:", "    self.partial = True"]
+    for key, assignments in grouped.items():
+        lines += [
+            f"    if {key!r} in attributes:",
+            f"        value = attributes[{key!r}]",
+            *(f"        {assignment}" for assignment in assignments),
+        ]
+    lines += ["if http.slim:", "    self._release()"]
+    source = "\n    ".join(lines)
+    exec(_compile(source), namespace)
+    init = namespace["__init__"]
+    init.__qualname__ = f"{qualname}.__init__"
+    return init
@@ -0,0 +1,100 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present ShomyKohai
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional
+
+__all__ = ("StallStats",)
+
+# Upper bounds (in seconds) of the histogram buckets, the last one is open
+_BOUNDS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5)
+
+
+def _label(index: int) -> str:
+    if index == len(_BOUNDS):
+        return f">{_BOUNDS[-1] * 1000:g}ms"
+    return f"<={_BOUNDS[index] * 1000:g}ms"
+
+
+class StallStats:
+    """
+    How long the event loop got blocked by the client: decoding responses,
+    parsing streamed chunks and building models inline. Work moved to the
+    executor only counts as offloaded, since it doesn't stall the loop.
+
+    Read it from :attr:`Client.stall_stats` before and after a workload
+    to compare settings such as `offload_threshold` and `offload_nodes`.
+
+    .. versionadded:: 1.1.0
+
+    Attributes
+    -----------
+    count: :class:`int`
+        Number of inline operations recorded
+    total: :class:`float`
+        Seconds the loop spent on them
+    worst: :class:`float`
+        Longest of them, in seconds
+    offloaded: :class:`int`
+        Number of operations run in the executor instead
+    on_stall: Optional[Callable[[:class:`str`, :class:`float`], None]]
+        Called with the kind of work (``"decode"``, ``"stream"`` or
+        ``"build"``) and its duration after every inline operation
+    """
+
+    __slots__ = ("count", "total", "worst", "offloaded", "on_stall", "_buckets")
+
+    def __init__(self) -> None:
+        self.on_stall: Optional[Callable[[str, float], None]] = None
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget every recorded operation"""
+        self.count = 0
+        self.total = 0.0
+        self.worst = 0.0
+        self.offloaded = 0
+        self._buckets: List[int] = [0] * (len(_BOUNDS) + 1)
+
+    def record(self, kind: str, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.worst:
+            self.worst = seconds
+        self._buckets[bisect_left(_BOUNDS, seconds)] += 1
+        if self.on_stall is not None:
+            self.on_stall(kind, seconds)
+
+    @property
+    def histogram(self) -> Dict[str, int]:
+        """Number of inline operations by duration bucket"""
+        return {_label(index): count for index, count in enumerate(self._buckets)}
+
+    def __repr__(self) -> str:
+        return (
+            f"<StallStats count={self.count} total={self.total * 1000:.1f}ms "
+            f"worst={self.worst * 1000:.1f}ms offloaded={self.offloaded}>"
+        )
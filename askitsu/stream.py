@@ -0,0 +1,118 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present ShomyKohai
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import List, Optional, Sequence
+
+
+__all__ = ("NodeStream",)
+
+# A complete string, a bracket, or the opening quote of a string
+# that has not been fully received yet
+_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]|"')
+_SKIP = re.compile(r"[\s,]*")
+_decoder = json.JSONDecoder()
+
+
+class NodeStream:
+    """
+    Incremental parser that extracts the objects of a single JSON array
+    as soon as each one has been fully received.
+
+    Only the text of the node currently being read is kept in memory,
+    everything that comes before it is discarded.
+
+    .. versionadded:: 1.1.0
+
+    Parameters
+    -----------
+    path: Sequence[:class:`str`]
+        Keys leading from the root object to the array, e.g.
+        ``("data", "findAnimeById", "episodes", "nodes")``
+    """
+
+    __slots__ = ("_path", "_text", "_buffer", "_stack", "_last", "_inside")
+
+    def __init__(self, path: Sequence[str]) -> None:
+        self._path = [json.dumps(key) for key in path]
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        # Key of every open container, starting from the root
+        self._stack: List[Optional[str]] = []
+        self._last: Optional[str] = None
+        self._inside = False
+
+    def feed(self, chunk: bytes) -> List[dict]:
+        """Feed the next chunk of the body, returning the nodes it completed"""
+        buffer = self._buffer + self._text.decode(chunk)
+        nodes: List[dict] = []
+        pos = 0
+        while True:
+            if self._inside:
+                pos = _SKIP.match(buffer, pos).end()  # type: ignore
+                if pos == len(buffer):
+                    break
+                if buffer[pos] == "]":
+                    self._inside = False
+                    pos += 1
+                    continue
+                try:
+                    node, pos = _decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # The node is still incomplete
+                    break
+                nodes.append(node)
+                continue
+            match = _TOKEN.search(buffer, pos)
+            if match is None:
+                pos = len(buffer)
+                break
+            token = match.group()
+            if token == '"':
+                # Unterminated string, wait for the rest of it
+                pos = match.start()
+                break
+            pos = match.end()
+            if token[0] == '"':
+                self._last = token
+            elif token in ("{", "["):
+                key = self._last if self._stack else None
+                if token == "[" and self._is_target(key):
+                    self._inside = True
+                else:
+                    self._stack.append(key)
+                self._last = None
+            else:
+                if self._stack:
+                    self._stack.pop()
+                self._last = None
+        self._buffer = buffer[pos:]
+        return nodes
+
+    def _is_target(self, key: Optional[str]) -> bool:
+        return key == self._path[-1] and self._stack[1:] == self._path[:-1]
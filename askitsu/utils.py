@@ -0,0 +1,164 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present ShomyKohai
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from __future__ import annotations
+
+import re
+import sys
+import unicodedata
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, List, Optional
+
+__all__ = ("edit_distance", "intern", "normalize", "parse_datetime")
+
+# Latin accents and macrons (ō, é, ü...), Japanese voicing marks are kept
+_ACCENTS = re.compile(r"[\u0300-\u036f]")
+_APOSTROPHES = re.compile("['’`]")
+_SEPARATORS = re.compile(r"[\W_]+")
+# The ISO 8601 forms datetime.fromisoformat only reads since Python 3.11:
+# basic format (20230220T160013), any fraction length, offsets without colon
+_ISO_8601 = re.compile(
+    r"(\d{4})-?(\d\d)-?(\d\d)"
+    r"(?:[T ](\d\d)(?::?(\d\d)(?::?(\d\d)(?:[.,](\d+))?)?)?"
+    r"(Z|[+-]\d\d(?::?\d\d)?)?)?$"
+)
+
+
+@lru_cache(maxsize=4096)
+def normalize(text: str) -> str:
+    """
+    Fold a title or a query into a comparable form:
+    lowercase, without accents or punctuation, single spaced.
+
+    ``"Shingeki no Kyojin: Sōzō-hen"`` becomes ``"shingeki no kyojin sozo hen"``
+    and ``"JoJo's"`` becomes ``"jojos"``.
+
+    .. versionadded:: 1.1.0
+    """
+    text = _ACCENTS.sub("", unicodedata.normalize("NFKD", text))
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = _APOSTROPHES.sub("", text)
+    return _SEPARATORS.sub(" ", text).strip()
+
+
+def intern(value: Any) -> Any:
+    """
+    The canonical instance of a string, so that the copies of a
+    low-cardinality value (statuses, subtypes, names...) decoded
+    from many responses share one object. Anything else is returned as is.
+
+    .. versionadded:: 1.1.0
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def parse_datetime(value: Any) -> Optional[datetime]:
+    """
+    Parse a date or a timestamp as sent by Kitsu (``"2013-02-20"``,
+    ``"2013-02-20T16:00:13Z"``), many times faster than
+    :meth:`datetime.strptime`. Returns ``None`` for missing or
+    malformed values.
+
+    Any ISO 8601 calendar date, with an optional time of day, fraction of
+    second and offset, is accepted on every supported Python version
+    (``"20130220"``, ``"2013-02-20T16:00:13.5Z"``,
+    ``"2013-02-20T18:00+0200"``...). Week and ordinal dates are only
+    read from Python 3.11.
+
+    The result is naive, like the one of :meth:`datetime.strptime`,
+    unless the value has an offset other than ``Z``.
+
+    .. versionadded:: 1.1.0
+    """
+    try:
+        if value[-1] == "Z":
+            value = value[:-1]
+        return datetime.fromisoformat(value)
+    except (IndexError, TypeError):
+        return None
+    except ValueError:
+        return _parse_iso_8601(value)
+
+
+def _parse_iso_8601(value: str) -> Optional[datetime]:
+    """The slower path of :func:`parse_datetime`, for Python < 3.11"""
+    match = _ISO_8601.match(value)
+    if match is None:
+        return None
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    tzinfo = None
+    if offset and offset != "Z":
+        minutes = int(offset[1:3]) * 60 + int(offset[-2:] if len(offset) > 3 else 0)
+        tzinfo = timezone(timedelta(minutes=-minutes if offset[0] == "-" else minutes))
+    try:
+        return datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour or 0),
+            int(minute or 0),
+            int(second or 0),
+            int((fraction or "0")[:6].ljust(6, "0")),
+            tzinfo,
+        )
+    except ValueError:
+        return None
+
+
+def edit_distance(first: str, second: str, limit: int) -> int:
+    """
+    Edit distance between two strings, counting insertions, deletions,
+    substitutions and swaps of two adjacent characters as one edit each.
+    Gives up as soon as it's certain to exceed `limit`,
+    returning ``limit + 1``.
+
+    .. versionadded:: 1.1.0
+    """
+    if abs(len(first) - len(second)) > limit:
+        return limit + 1
+    if len(first) > len(second):
+        first, second = second, first
+    before: List[int] = []
+    previous = list(range(len(first) + 1))
+    for row, char in enumerate(second, 1):
+        current = [row]
+        for column, other in enumerate(first, 1):
+            cost = min(
+                previous[column] + 1,
+                current[column - 1] + 1,
+                previous[column - 1] + (char != other),
+            )
+            if (
+                row > 1
+                and column > 1
+                and char == first[column - 2]
+                and second[row - 2] == other
+            ):
+                cost = min(cost, before[column - 2] + 1)
+            current.append(cost)
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return min(previous[-1], limit + 1)
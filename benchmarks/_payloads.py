@@ -0,0 +1,168 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present ShomyKohai
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# Nodes shaped like the ones the GraphQL API sends, shared by the benchmarks.
+# Every call returns fresh objects, as json.loads would.
+# Importing it puts the repository on sys.path, so the benchmarks run
+# from a checkout without installing askitsu.
+
+from __future__ import annotations
+
+import os
+import sys
+from datetime import datetime, timedelta
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+_EPOCH = datetime(2013, 2, 20, 16, 0, 13)
+
+
+def timestamp(offset: int) -> str:
+    """A Kitsu timestamp `offset` hours after the first one"""
+    return (_EPOCH + timedelta(hours=offset)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def image() -> dict:
+    return {
+        "original": {"url": "https://media.kitsu.io/original.jpg"},
+        "views": [
+            {
+                "name": name,
+                "url": f"https://media.kitsu.io/{name}.jpg",
+                "width": width,
+                "height": width * 3 // 2,
+            }
+            for name, width in (
+                ("tiny", 110),
+                ("small", 284),
+                ("medium", 390),
+                ("large", 550),
+            )
+        ],
+    }
+
+
+def _entry(i: int) -> dict:
+    return {
+        "id": str(i),
+        "slug": f"entry-{i}",
+        "createdAt": timestamp(i),
+        "updatedAt": timestamp(i * 7),
+        "startDate": "2002-10-03",
+        "endDate": "2007-02-08",
+        "description": {"en": f"Description of the entry number {i}."},
+        "status": "finished",
+        "sfw": True,
+        "ageRating": "PG",
+        "averageRating": 80.12,
+        "averageRatingRank": i,
+        "userCountRank": i,
+        "titles": {
+            "canonical": f"Entry {i}",
+            "localized": {
+                "en_us": f"Entry {i}",
+                "en_jp": f"Entri {i}",
+                "ja_jp": f"エントリー {i}",
+            },
+        },
+        "posterImage": image(),
+        "bannerImage": image(),
+    }
+
+
+def anime(i: int) -> dict:
+    node = _entry(i)
+    node.update(
+        animesub="TV",
+        season="FALL",
+        episodeCount=220,
+        episodeLength=23,
+        totalLength=5060,
+        youtubeTrailerVideoId="j2hiC9BmJlQ",
+    )
+    return node
+
+
+def manga(i: int) -> dict:
+    node = _entry(i)
+    node.update(mangasub="manga", chapterCount=700, volumeCount=72)
+    return node
+
+
+def user(i: int) -> dict:
+    count = {"totalCount": i}
+    return {
+        "id": str(i),
+        "createdAt": timestamp(i),
+        "name": f"User {i}",
+        "slug": f"user-{i}",
+        "birthday": "1995-06-14",
+        "about": "Watching everything, reading the rest.",
+        "location": None,
+        "waifuOrHusbando": None,
+        "gender": None,
+        "proTier": None,
+        "url": f"https://kitsu.io/users/user-{i}",
+        "posts": dict(count),
+        "mediaReactions": dict(count),
+        "comments": dict(count),
+        "followers": dict(count),
+        "following": dict(count),
+        "favorites": dict(count),
+        "avatarImage": image(),
+        "bannerImage": image(),
+    }
+
+
+def post(i: int) -> dict:
+    return {
+        "id": str(i),
+        "createdAt": timestamp(i),
+        "content": f"Post number {i}, with a few words in it.",
+        "isNsfw": False,
+        "isSpoiler": False,
+        "likes": {"totalCount": i % 50},
+    }
+
+
+def library_entry(i: int) -> dict:
+    # One entry in three is still in progress
+    finished: Optional[str] = timestamp(i * 5 + 3) if i % 3 else None
+    return {
+        "id": str(1000 + i),
+        "createdAt": timestamp(i),
+        # Out of order, so sorting has some work to do
+        "progressedAt": timestamp((i * 7919) % 20000),
+        "finishedAt": finished,
+        "media": {"id": str(i), "type": "Anime"},
+        "nsfw": False,
+        "status": "COMPLETED" if finished else "CURRENT",
+        "reconsuming": False,
+        "reconsumeCount": 0,
+        "rating": 14,
+        "notes": None,
+        "private": False,
+        "progress": 12,
+    }
@@ -0,0 +1,199 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present ShomyKohai
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# The constructors generated by spec.constructor() against the hand-written
+# __init__ chain they replaced (subclass __init__, super().__init__, then a
+# loop over the fields), built from the same nodes.
+#
+#   python benchmarks/constructors.py [--count 2000]
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import timeit
+from typing import Any, Callable, Dict, List, Tuple
+
+import _payloads  # before askitsu, it puts the repository on sys.path
+import askitsu
+from askitsu.models.users import LibraryEntry, User
+from askitsu.spec import ANIME_SPEC, LIBRARY_ENTRY_SPEC, MANGA_SPEC, Field
+from askitsu.utils import intern
+
+
+def _converters(spec: Dict[str, Field]) -> Dict[str, Tuple[str, Any]]:
+    """attribute -> (GraphQL key, converter), the table the chain looped over"""
+    fields = {}
+    for name, field in spec.items():
+        convert = field.convert
+        if isinstance(convert, str):
+            convert = eval(f"lambda value: {convert}", {"intern": intern})
+        if field.stored:
+            fields[name] = (field.key, convert)
+    return fields
+
+
+class _HandWritten:
+    """The Projectable and Entry constructors before they were generated"""
+
+    __slots__ = ()
+
+    _hand_fields: Dict[str, Tuple[str, Any]]
+
+    def _populate(self, attributes: dict) -> bool:
+        partial = False
+        for name, (key, convert) in self._hand_fields.items():
+            try:
+                value = attributes[key]
+            except KeyError:
+                partial = True
+                continue
+            setattr(self, name, convert(value) if convert else value)
+        return partial
+
+    def __init__(self, _id: Any, _type: str, attributes: dict, http: Any, cache: Any):
+        self._cache = cache
+        self._http = http
+        self._attributes = attributes
+        self._memo = None
+        self.id = int(_id)
+        # entry_type used to be set here too, it's a class attribute now
+        self.partial = self._populate(attributes)
+        if http.slim:
+            self._release()
+
+
+class HandAnime(_HandWritten, askitsu.Anime):
+    __slots__ = ()
+
+    _hand_fields = _converters(ANIME_SPEC)
+
+    def __init__(self, attributes: dict, http: Any, cache: Any) -> None:
+        super().__init__(
+            _id=attributes["id"],
+            _type="anime",
+            attributes=attributes,
+            http=http,
+            cache=cache,
+        )
+
+
+class HandManga(_HandWritten, askitsu.Manga):
+    __slots__ = ()
+
+    _hand_fields = _converters(MANGA_SPEC)
+
+    def __init__(self, attributes: dict, http: Any, cache: Any) -> None:
+        super().__init__(
+            _id=attributes["id"],
+            _type="manga",
+            attributes=attributes,
+            http=http,
+            cache=cache,
+        )
+
+
+class HandLibraryEntry(LibraryEntry):
+    __slots__ = ()
+
+    _hand_fields = _converters(LIBRARY_ENTRY_SPEC)
+    _populate = _HandWritten._populate
+
+    def __init__(self, attributes: dict, user: Any, http: Any) -> None:
+        self._LibraryEntry__http = http
+        self._attributes = attributes
+        self._memo = None
+        self.user = user
+        self.partial = self._populate(attributes)
+        if http.slim:
+            self._release()
+
+
+def _projected(node: dict, keys: Tuple[str, ...]) -> dict:
+    """The node as fetched with a `fields` projection"""
+    return {key: node[key] for key in keys}
+
+
+def best(build: Callable[[dict], Any], nodes: List[dict]) -> float:
+    """Best time in ns per object over a few repeats"""
+    total = min(
+        timeit.repeat(lambda: [build(node) for node in nodes], number=1, repeat=7)
+    )
+    return total / len(nodes) * 1e9
+
+
+async def main(count: int) -> None:
+    client = askitsu.Client()
+    try:
+        http, cache = client.http, client.http._cache
+        user = User(_payloads.user(0), http, cache)
+        anime = [_payloads.anime(i) for i in range(count)]
+        manga = [_payloads.manga(i) for i in range(count)]
+        library = [_payloads.library_entry(i) for i in range(count)]
+        projected = [_projected(node, ("id", "slug", "titles")) for node in anime]
+        cases: List[Tuple[str, List[dict], Callable, Callable]] = [
+            (
+                "Anime",
+                anime,
+                lambda node: askitsu.Anime(node, http, cache),
+                lambda node: HandAnime(node, http, cache),
+            ),
+            (
+                "Anime projected",
+                projected,
+                lambda node: askitsu.Anime(node, http, cache),
+                lambda node: HandAnime(node, http, cache),
+            ),
+            (
+                "Manga",
+                manga,
+                lambda node: askitsu.Manga(node, http, cache),
+                lambda node: HandManga(node, http, cache),
+            ),
+            (
+                "LibraryEntry",
+                library,
+                lambda node: LibraryEntry(node, user, http),
+                lambda node: HandLibraryEntry(node, user, http),
+            ),
+        ]
+        print(f"{'model':16s} {'hand-written':>13s} {'generated':>10s}   ns per object")
+        for name, nodes, generated, hand_written in cases:
+            # Same attributes either way
+            expected = hand_written(nodes[0])._values()
+            assert generated(nodes[0])._values() == expected, name
+            print(
+                f"{name:16s} {best(hand_written, nodes):13.0f} "
+                f"{best(generated, nodes):10.0f}"
+            )
+    finally:
+        await client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generated constructors against the hand-written ones"
+    )
+    parser.add_argument("--count", type=int, default=2000, help="objects per model")
+    asyncio.run(main(parser.parse_args().count))
@@ -0,0 +1,105 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present ShomyKohai
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# Bytes kept alive by every model, with and without ``slim=True``.
+#
+# Each model is built from a freshly decoded node, then the nodes are dropped,
+# so the number counts the model and whatever part of its node it retains.
+#
+#   python benchmarks/memory.py [--count 2000]
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import tracemalloc
+from typing import Callable
+
+import _payloads  # before askitsu, it puts the repository on sys.path
+import askitsu
+from askitsu.http import HTTPClient
+from askitsu.models.users import LibraryEntry, Post, User
+
+
+def retained(
+    payload: Callable[[int], dict], build: Callable[[dict], object], count: int
+) -> float:
+    """Bytes per model still allocated once the decoded nodes are gone"""
+    body = json.dumps([payload(i) for i in range(count)])
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    decoded = json.loads(body)
+    models = [build(node) for node in decoded]
+    del decoded
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(models)
+
+
+def builders(http: HTTPClient) -> dict:
+    author = User(_payloads.user(0), http, http._cache)
+    return {
+        "Anime": (
+            _payloads.anime,
+            lambda node: askitsu.Anime(node, http, http._cache),
+        ),
+        "Manga": (
+            _payloads.manga,
+            lambda node: askitsu.Manga(node, http, http._cache),
+        ),
+        "User": (_payloads.user, lambda node: User(node, http, http._cache)),
+        "Post": (_payloads.post, lambda node: Post(node, author)),
+        "LibraryEntry": (
+            _payloads.library_entry,
+            lambda node: LibraryEntry(node, author, http),
+        ),
+    }
+
+
+async def main(count: int) -> None:
+    full = askitsu.Client()
+    slim = askitsu.Client(slim=True)
+    try:
+        print(f"{'model':14s} {'default':>10s} {'slim':>10s}   bytes per object")
+        defaults = builders(full.http)
+        for name, (payload, build) in builders(slim.http).items():
+            print(
+                f"{name:14s} {retained(payload, defaults[name][1], count):10.0f} "
+                f"{retained(payload, build, count):10.0f}"
+            )
+    finally:
+        await full.close()
+        await slim.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Bytes kept alive by every model, default and slim"
+    )
+    parser.add_argument("--count", type=int, default=2000, help="models per type")
+    asyncio.run(main(parser.parse_args().count))
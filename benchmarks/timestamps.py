@@ -0,0 +1,110 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present ShomyKohai
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# Sorting a library by progressed_at and keeping the finished entries,
+# with the timestamps read through LibraryEntry (parse_datetime, memoized)
+# and with the strptime call every property used to make on each access.
+#
+#   python benchmarks/timestamps.py [--count 2000] [--rounds 3]
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import timeit
+from datetime import datetime
+from typing import Callable, List, Optional
+
+import _payloads  # before askitsu, it puts the repository on sys.path
+import askitsu
+from askitsu.models.users import LibraryEntry, User
+
+
+def strptime(entry: LibraryEntry, key: str, name: str) -> Optional[datetime]:
+    """How the properties parsed timestamps before parse_datetime"""
+    try:
+        return datetime.strptime(entry._raw(key, name), "%Y-%m-%dT%H:%M:%SZ")
+    except (TypeError, ValueError):
+        return None
+
+
+def current(entries: List[LibraryEntry], rounds: int) -> None:
+    for _ in range(rounds):
+        entries.sort(key=lambda entry: entry.progressed_at or datetime.min)
+        [entry for entry in entries if entry.finished_at]
+
+
+def previous(entries: List[LibraryEntry], rounds: int) -> None:
+    for _ in range(rounds):
+        entries.sort(
+            key=lambda entry: strptime(entry, "progressedAt", "progressed_at")
+            or datetime.min
+        )
+        [entry for entry in entries if strptime(entry, "finishedAt", "finished_at")]
+
+
+def best(
+    run: Callable[[List[LibraryEntry], int], None],
+    build: Callable[[], List[LibraryEntry]],
+    rounds: int,
+) -> float:
+    """Best time in ms over a few repeats, every repeat on new entries"""
+    return 1000 * min(
+        timeit.repeat(
+            "run(entries, rounds)",
+            setup="entries = build()",
+            globals={"run": run, "build": build, "rounds": rounds},
+            number=1,
+            repeat=7,
+        )
+    )
+
+
+async def main(count: int, rounds: int) -> None:
+    client = askitsu.Client()
+    try:
+        http = client.http
+        user = User(_payloads.user(0), http, http._cache)
+        nodes = [_payloads.library_entry(i) for i in range(count)]
+
+        def build() -> List[LibraryEntry]:
+            return [LibraryEntry(node, user, http) for node in nodes]
+
+        print(f"{count} entries, {rounds} sort and filter rounds")
+        for label, run in (("strptime", previous), ("parse_datetime", current)):
+            print(f"{label:16s} {best(run, build, rounds):8.2f} ms")
+    finally:
+        await client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Sort and filter library entries by their timestamps"
+    )
+    parser.add_argument("--count", type=int, default=2000, help="library entries")
+    parser.add_argument(
+        "--rounds", type=int, default=3, help="sorts and filters on the same entries"
+    )
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.count, arguments.rounds))
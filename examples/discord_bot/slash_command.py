@@ -19,6 +19,9 @@ intents = discord.Intents.default()
 client = discord.Client(intents=intents)
 client.tree = discord.app_commands.CommandTree(client)
 kitsu = askitsu.Client()
+# Every anime the client fetches becomes a suggestion
+titles = askitsu.TitleIndex()
+titles.attach(kitsu)
 
 @client.tree.command()
 async def anime(interaction: discord.Interaction, *, query: str) -> None:
@@ -27,4 +30,12 @@ async def anime(interaction: discord.Interaction, *, query: str) -> None:
     await interaction.response.send_message(f"Anime: {anime.title}\nEpisodes: {anime.episode_count}")
     await kitsu.close()
 
+@anime.autocomplete("query")
+async def anime_autocomplete(interaction: discord.Interaction, current: str):
+    # Answered from memory, no request is sent on each keystroke
+    return [
+        discord.app_commands.Choice(name=suggestion.title, value=suggestion.title)
+        for suggestion in titles.complete(current, type="anime")
+    ]
+
 client.run(TOKEN)
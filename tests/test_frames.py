@@ -0,0 +1,180 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present ShomyKohai
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# filter, sort and top give the same rows, in the same order,
+# in pure Python and with NumPy.
+
+import random
+from typing import Callable, List
+
+import pytest
+
+from askitsu import frames
+from askitsu.frames import EntryFrame, LibraryFrame
+from askitsu.http import HTTPClient
+from askitsu.models.enums import LibraryEntryStatus
+from askitsu.models.users import User
+
+HTTP = HTTPClient(session=None, cache_expiration=300, entries={})  # type: ignore
+
+STATUSES = ["CURRENT", "COMPLETED", "PLANNED", "DROPPED", "ON_HOLD"]
+
+
+def _timestamp(rng: random.Random) -> str:
+    year, month, day = rng.randint(10, 23), rng.randint(1, 9), rng.randint(10, 19)
+    return f"20{year}-0{month}-{day}T00:00:00Z"
+
+
+def _library(rows: int) -> List[dict]:
+    rng = random.Random(rows)
+    return [
+        {
+            "id": str(index),
+            "createdAt": _timestamp(rng),
+            "progressedAt": _timestamp(rng),
+            # Ties and missing values on purpose
+            "finishedAt": rng.choice([None, _timestamp(rng)]),
+            "media": {"id": str(rng.randint(1, 50)), "type": "Anime"},
+            "status": rng.choice(STATUSES),
+            "progress": rng.randint(0, 12),
+            "reconsumeCount": 0,
+            "rating": rng.choice([None, 2, 8, 14, 20]),
+        }
+        for index in range(rows)
+    ]
+
+
+USER = User(
+    {
+        "id": "1",
+        "name": "Vikhyat",
+        "slug": "vikhyat",
+        "about": "",
+        "location": None,
+        "waifuOrHusbando": None,
+        "gender": None,
+        "proTier": None,
+        **{
+            key: {"totalCount": 0}
+            for key in (
+                "posts",
+                "mediaReactions",
+                "comments",
+                "followers",
+                "following",
+                "favorites",
+            )
+        },
+    },
+    HTTP,
+    HTTP._cache,
+)
+
+QUERIES: List[Callable[[LibraryFrame], LibraryFrame]] = [
+    lambda frame: frame.filter(status=LibraryEntryStatus.COMPLETED),
+    lambda frame: frame.filter(status=["CURRENT", "DROPPED"], rating=[8, 20]),
+    lambda frame: frame.filter([rating > 8 for rating in frame["rating"]]),
+    lambda frame: frame.filter(progress > 3 for progress in frame["progress"]),
+    lambda frame: frame.sort("rating"),
+    lambda frame: frame.sort("rating", reverse=True),
+    lambda frame: frame.sort("status", "progress"),
+    lambda frame: frame.sort("status", "finished_at", reverse=True),
+    lambda frame: frame.top("rating", 15),
+    lambda frame: frame.top("finished_at", 10, smallest=True),
+    lambda frame: frame.top("progress", 0),
+    lambda frame: frame.top("progress", 1000),
+    # Views of views
+    lambda frame: frame.filter(status="COMPLETED").sort("progress").top("rating"),
+    lambda frame: frame[::3].sort("progressed_at", reverse=True)[:20],
+]
+
+
+def _ids(frame: frames.Frame) -> List[int]:
+    return list(frame.column("id"))
+
+
+@pytest.mark.parametrize("rows", [0, 1, 300])
+@pytest.mark.parametrize("query", range(len(QUERIES)))
+def test_numpy_matches_python(monkeypatch, rows, query):
+    numpy = pytest.importorskip("numpy")
+    frame = LibraryFrame.from_nodes(_library(rows), USER, HTTP)
+    monkeypatch.setattr(frames, "_VECTOR_ROWS", 1 << 62)
+    expected = _ids(QUERIES[query](frame))
+    monkeypatch.setattr(frames, "_VECTOR_ROWS", 1)
+    assert _ids(QUERIES[query](frame)) == expected
+    if rows:
+        mask = numpy.asarray(frame.to_numpy("progress")) > 3
+        assert _ids(frame.filter(mask)) == _ids(QUERIES[3](frame))
+
+
+def test_python_sort_and_top(monkeypatch):
+    monkeypatch.setattr(frames, "_VECTOR_ROWS", 1 << 62)
+    frame = LibraryFrame.from_nodes(_library(300), USER, HTTP)
+    ratings = list(frame.sort("rating", reverse=True)["rating"])
+    assert ratings == sorted(ratings, reverse=True)
+    top = frame.top("rating", 5, smallest=True)
+    assert list(top["rating"]) == sorted(r for r in frame["rating"] if r != -1)[:5]
+
+
+def _entries(rows: int) -> List[dict]:
+    rng = random.Random(rows)
+    return [
+        {
+            "id": str(index),
+            "status": rng.choice(["current", "finished", "upcoming"]),
+            "ageRating": rng.choice(["G", "PG", "R", None]),
+            "animesub": rng.choice(["TV", "ONA", "movie"]),
+            "averageRating": rng.choice([None, 71.5, 80.25, 64.0]),
+            "averageRatingRank": rng.choice([None, *range(1, 40)]),
+            "userCountRank": rng.randint(1, 60),
+            "episodeCount": rng.choice([None, 12, 24]),
+            "sfw": rng.choice([None, True, False]),
+            "startDate": rng.choice([None, _timestamp(rng)[:10]]),
+        }
+        for index in range(rows)
+    ]
+
+
+ENTRY_QUERIES: List[Callable[[EntryFrame], EntryFrame]] = [
+    lambda frame: frame.filter(status="current", subtype=["TV", "ONA"]),
+    lambda frame: frame.filter(age_rating=["G", "PG", "R", "R18", "PG13", "X"] * 2),
+    lambda frame: frame.filter(nsfw=1),
+    lambda frame: frame.filter(frame.to_numpy("rating") > 70),
+    lambda frame: frame.sort("rating", reverse=True),
+    lambda frame: frame.sort("subtype", "started_at"),
+    lambda frame: frame.top("rating", 20),
+    lambda frame: frame.top("popularity_rank", 10, smallest=True),
+    lambda frame: frame.filter(status="finished").top("rating_rank", smallest=True),
+]
+
+
+@pytest.mark.parametrize("rows", [1, 300])
+@pytest.mark.parametrize("query", range(len(ENTRY_QUERIES)))
+def test_entry_frame_numpy_matches_python(monkeypatch, rows, query):
+    pytest.importorskip("numpy")
+    frame = EntryFrame.from_nodes("anime", _entries(rows), HTTP)
+    monkeypatch.setattr(frames, "_VECTOR_ROWS", 1 << 62)
+    expected = _ids(ENTRY_QUERIES[query](frame))
+    monkeypatch.setattr(frames, "_VECTOR_ROWS", 1)
+    assert _ids(ENTRY_QUERIES[query](frame)) == expected
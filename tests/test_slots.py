@@ -0,0 +1,360 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present ShomyKohai
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# Every model keeps its attributes in __slots__, so no instance carries
+# a __dict__ and the per-object size stays fixed.
+
+import importlib
+import inspect
+import json
+import pickle
+import pkgutil
+import sys
+from enum import Enum
+from typing import Callable, Dict, List, Type
+
+import pytest
+
+import askitsu.models
+from askitsu.error import NotFetched
+from askitsu.http import HTTPClient
+from askitsu.models.anime import Anime, Episode, EpisodeList, StreamLink
+from askitsu.models.character import Character
+from askitsu.models.core import Category, Memoized, Object, Projectable, Review, Title
+from askitsu.models.images import CoverImage, Image, ImageView, PosterImage
+from askitsu.models.manga import Chapter, ChapterList, Manga
+from askitsu.models.numbered import NumberedList
+from askitsu.models.serializable import Serializable
+from askitsu.models.users import LibraryEntry, Post, User, UserProfile
+
+# Bytes allowed for a single instance, Anime (the biggest) takes 256
+# with the slots slim models keep their dates and images in
+MAX_SIZE = 320
+
+HTTP = HTTPClient(session=None, cache_expiration=300, entries={})  # type: ignore
+SLIM = HTTPClient(
+    session=None, cache_expiration=300, entries={}, slim=True  # type: ignore
+)
+
+IMAGE = {
+    "original": {"url": "https://media.kitsu.io/original.jpg"},
+    "views": [
+        {"name": "tiny", "url": "https://media.kitsu.io/tiny.jpg"},
+        {"name": "large", "url": "https://media.kitsu.io/large.jpg"},
+    ],
+}
+
+ENTRY = {
+    "id": "1",
+    "slug": "cowboy-bebop",
+    "createdAt": "2013-02-20T16:00:13Z",
+    "updatedAt": "2023-02-20T16:00:13Z",
+    "startDate": "1998-04-03",
+    "endDate": "1999-04-24",
+    "description": {"en": "In the year 2071..."},
+    "status": "finished",
+    "sfw": True,
+    "ageRating": "R",
+    "averageRating": 82.1,
+    "averageRatingRank": 27,
+    "userCountRank": 25,
+    "titles": {
+        "canonical": "Cowboy Bebop",
+        "localized": {"en_us": "Cowboy Bebop", "ja_jp": "カウボーイビバップ"},
+    },
+    "posterImage": IMAGE,
+    "bannerImage": IMAGE,
+}
+
+ANIME = {
+    **ENTRY,
+    "animesub": "TV",
+    "season": "SPRING",
+    "episodeCount": 26,
+    "episodeLength": 25,
+    "totalLength": 650,
+    "youtubeTrailerVideoId": "qig4KOK2R2g",
+}
+
+MANGA = {**ENTRY, "mangasub": "manga", "chapterCount": 43, "volumeCount": 3}
+
+USER = {
+    "id": "1",
+    "createdAt": "2013-02-20T16:00:13Z",
+    "name": "Vikhyat",
+    "slug": "vikhyat",
+    "birthday": None,
+    "about": "",
+    "location": None,
+    "waifuOrHusbando": None,
+    "gender": None,
+    "proTier": None,
+    "posts": {"totalCount": 1},
+    "mediaReactions": {"totalCount": 1},
+    "comments": {"totalCount": 1},
+    "followers": {"totalCount": 1},
+    "following": {"totalCount": 1},
+    "favorites": {"totalCount": 1},
+    "avatarImage": IMAGE,
+    "bannerImage": IMAGE,
+}
+
+EPISODE = {
+    "id": "1",
+    "description": "Session 1",
+    "titles": {"canonical": "Asteroid Blues"},
+    "number": 1,
+    "length": 25,
+    "thumbnail": IMAGE,
+}
+
+CHAPTER = {
+    "id": "1",
+    "description": {"en": "Chapter 1"},
+    "titles": {"romanized": "Chapter 1"},
+    "number": 1,
+    "thumbnail": None,
+}
+
+
+def _user() -> User:
+    return User(USER, HTTP, HTTP._cache)
+
+
+# One instance of every concrete model
+FACTORIES: Dict[type, Callable[[], object]] = {
+    Anime: lambda: Anime(ANIME, HTTP, HTTP._cache),
+    Manga: lambda: Manga(MANGA, HTTP, HTTP._cache),
+    Episode: lambda: Episode(EPISODE),
+    EpisodeList: lambda: EpisodeList([EPISODE]),
+    Chapter: lambda: Chapter(CHAPTER),
+    ChapterList: lambda: ChapterList([CHAPTER]),
+    StreamLink: lambda: StreamLink(
+        {
+            "id": "1",
+            "streamer": {"siteName": "Crunchyroll"},
+            "url": "https://crunchyroll.com",
+            "subs": ["en"],
+            "dubs": ["ja"],
+        }
+    ),
+    Character: lambda: Character(
+        {
+            "role": "MAIN",
+            "character": {
+                "id": "1",
+                "slug": "spike-spiegel",
+                "names": {"canonical": "Spike Spiegel"},
+                "description": "",
+                "image": IMAGE,
+            },
+        },
+        entry_id=1,
+    ),
+    Category: lambda: Category(
+        {
+            "id": "1",
+            "title": {"en": "Space"},
+            "description": "",
+            "slug": "space",
+            "isNsfw": False,
+        }
+    ),
+    Review: lambda: Review(1, "anime", {"id": "1", "reaction": "", "progress": ""}),
+    Title: lambda: Title(ENTRY["titles"]["localized"], 1, "anime"),
+    Object: lambda: Object(1, type="anime"),
+    ImageView: lambda: ImageView("tiny", "https://media.kitsu.io/tiny.jpg", 110, 165),
+    Image: lambda: Image(IMAGE),
+    PosterImage: lambda: PosterImage(IMAGE, 1, "anime"),
+    CoverImage: lambda: CoverImage(IMAGE, 1, "anime"),
+    User: _user,
+    UserProfile: lambda: UserProfile(
+        {"id": "1", "site": {"name": "Twitter"}, "url": "https://twitter.com"},
+        "vikhyat",
+    ),
+    Post: lambda: Post(
+        {
+            "id": "1",
+            "createdAt": "2013-02-20T16:00:13Z",
+            "content": "Hello",
+            "isNsfw": False,
+            "isSpoiler": False,
+            "likes": {"totalCount": 3},
+        },
+        _user(),
+    ),
+    LibraryEntry: lambda: LibraryEntry(
+        {
+            "id": "1",
+            "createdAt": "2013-02-20T16:00:13Z",
+            "progressedAt": "2013-02-20T16:00:13Z",
+            "finishedAt": None,
+            "media": {"id": "1", "type": "Anime"},
+            "nsfw": False,
+            "status": "CURRENT",
+            "reconsuming": False,
+            "reconsumeCount": 0,
+            "rating": None,
+            "notes": None,
+            "private": False,
+            "progress": 3,
+        },
+        _user(),
+        HTTP,
+    ),
+}
+
+
+# Mixins and generic bases, only used through their subclasses
+BASES = (Serializable, Memoized, Projectable, NumberedList)
+
+
+def _model_classes() -> List[Type]:
+    classes = []
+    for info in pkgutil.iter_modules(askitsu.models.__path__):
+        module = importlib.import_module(f"askitsu.models.{info.name}")
+        classes.extend(
+            cls
+            for _, cls in inspect.getmembers(module, inspect.isclass)
+            if cls.__module__ == module.__name__ and not issubclass(cls, Enum)
+        )
+    return classes
+
+
+MODELS = _model_classes()
+
+
+def _own_slots(cls: type) -> List[str]:
+    slots = cls.__dict__.get("__slots__", ())
+    return [slots] if isinstance(slots, str) else list(slots)
+
+
+@pytest.mark.parametrize("cls", MODELS, ids=lambda cls: cls.__qualname__)
+def test_every_class_is_slotted(cls):
+    for base in cls.__mro__[:-1]:
+        if base.__module__ not in ("typing", "abc", "builtins"):
+            assert "__slots__" in base.__dict__, f"{base.__qualname__} has no __slots__"
+
+
+@pytest.mark.parametrize("cls", MODELS, ids=lambda cls: cls.__qualname__)
+def test_no_slot_is_declared_twice(cls):
+    own = _own_slots(cls)
+    assert len(own) == len(set(own))
+    inherited = {slot for base in cls.__mro__[1:] for slot in _own_slots(base)}
+    assert not inherited.intersection(own)
+
+
+@pytest.mark.parametrize("cls", MODELS, ids=lambda cls: cls.__qualname__)
+def test_instances_have_no_dict(cls):
+    if inspect.isabstract(cls) or cls in BASES:
+        pytest.skip("not instantiated on its own")
+    # A new model needs a factory above
+    instance = FACTORIES[cls]()
+    assert not hasattr(instance, "__dict__")
+    assert sys.getsizeof(instance) < MAX_SIZE
+
+
+def test_character_slug_is_declared_once():
+    assert Character.__slots__.count("slug") == 1
+
+
+@pytest.mark.parametrize("cls", [Title, Image, Post, UserProfile])
+def test_slotted_models(cls):
+    instance = FACTORIES[cls]()
+    assert not hasattr(instance, "__dict__")
+    with pytest.raises(AttributeError):
+        instance.not_a_field = None
+
+
+SLIM_FACTORIES: Dict[type, Callable[[HTTPClient], object]] = {
+    Anime: lambda http: Anime(ANIME, http, http._cache),
+    Manga: lambda http: Manga(MANGA, http, http._cache),
+    User: lambda http: User(USER, http, http._cache),
+    Post: lambda http: Post(
+        {
+            "id": "1",
+            "createdAt": "2013-02-20T16:00:13Z",
+            "content": "Hello",
+            "isNsfw": False,
+            "isSpoiler": False,
+            "likes": {"totalCount": 3},
+        },
+        User(USER, http, http._cache),
+    ),
+    LibraryEntry: lambda http: LibraryEntry(
+        {
+            "id": "1",
+            "createdAt": "2013-02-20T16:00:13Z",
+            "progressedAt": "2013-02-20T16:00:13Z",
+            "finishedAt": None,
+            "media": {"id": "1", "type": "Anime"},
+            "nsfw": False,
+            "status": "CURRENT",
+            "reconsuming": False,
+            "reconsumeCount": 0,
+            "rating": None,
+            "notes": None,
+            "private": False,
+            "progress": 3,
+        },
+        User(USER, http, http._cache),
+        http,
+    ),
+}
+
+
+def _kept(instance: object) -> Dict[str, object]:
+    return {name: getattr(instance, name) for name in type(instance)._kept}
+
+
+@pytest.mark.parametrize("cls", list(SLIM_FACTORIES), ids=lambda cls: cls.__name__)
+def test_slim_models_release_the_fetched_tree(cls):
+    slim = SLIM_FACTORIES[cls](SLIM)
+    assert slim._attributes is None
+    assert slim._memo is None
+    assert cls._kept
+    # Same values as a default model, computed up front
+    default = SLIM_FACTORIES[cls](HTTP)
+    for name, value in _kept(slim).items():
+        expected = getattr(default, name)
+        if isinstance(value, Image):
+            assert value._values() == expected._values(), name
+        else:
+            assert value == expected, name
+    assert slim._memo is None
+    # The state holds the kept values, dates included
+    data = json.loads(json.dumps(slim.to_dict()))
+    for loaded in (cls.from_dict(data), pickle.loads(pickle.dumps(slim))):
+        assert loaded._attributes is None
+        assert loaded.created_at == slim.created_at
+
+
+def test_slim_projection_raises_not_fetched():
+    projected = {key: ANIME[key] for key in ("id", "slug", "titles", "createdAt")}
+    anime = Anime(projected, SLIM, SLIM._cache)
+    assert anime._attributes is None
+    assert anime.created_at == Anime(ANIME, HTTP, HTTP._cache).created_at
+    assert anime.title.ja_jp == "カウボーイビバップ"
+    with pytest.raises(NotFetched):
+        anime.poster_image
@@ -0,0 +1,75 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present ShomyKohai
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+# Generated constructors tell complete trees from `fields` projections,
+# and projected entries can always be hydrated.
+
+import asyncio
+
+import pytest
+
+from askitsu.error import NotFetched
+from askitsu.http import HTTPClient
+from askitsu.models.anime import Anime
+
+from test_slots import ANIME
+
+
+def _client() -> HTTPClient:
+    return HTTPClient(session=None, cache_expiration=300, entries={})  # type: ignore
+
+
+def test_complete_tree():
+    http = _client()
+    assert not Anime(ANIME, http, http._cache).partial
+
+
+@pytest.mark.parametrize("key", ["createdAt", "posterImage", "bannerImage"])
+def test_projection_missing_a_property_key_is_partial(key):
+    # Every stored field is there, only a key read by a property is missing
+    http = _client()
+    node = {name: value for name, value in ANIME.items() if name != key}
+    anime = Anime(node, http, http._cache)
+    assert anime.partial
+    assert anime.canonical_title == "Cowboy Bebop"
+
+    fetched = []
+
+    async def fetch(entry_type, id, method, fields=None):
+        fetched.append(id)
+        return Anime(ANIME, http, http._cache)
+
+    http._get_entry_fetch = fetch  # type: ignore
+    asyncio.run(anime.hydrate())
+    assert fetched == [1]
+    assert not anime.partial
+    assert anime.created_at is not None
+    assert anime.poster_image.original and anime.cover_image.original
+
+
+def test_missing_property_raises_not_fetched():
+    http = _client()
+    node = {name: value for name, value in ANIME.items() if name != "createdAt"}
+    with pytest.raises(NotFetched):
+        Anime(node, http, http._cache).created_at
@@ -0,0 +1,77 @@
+"""
+The MIT License (MIT)
+
+Copyright (c) 2022-present ShomyKohai
+
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from askitsu.crawler import parse_since
+from askitsu.error import InvalidArgument
+from askitsu.utils import _parse_iso_8601, parse_datetime
+
+PLUS_TWO = timezone(timedelta(hours=2))
+
+TIMESTAMPS = [
+    ("2023-02-20", datetime(2023, 2, 20)),
+    ("20230220", datetime(2023, 2, 20)),
+    ("2023-02-20T16:00:13", datetime(2023, 2, 20, 16, 0, 13)),
+    ("2023-02-20T16:00:13.5", datetime(2023, 2, 20, 16, 0, 13, 500000)),
+    ("2023-02-20T16:00:13,123", datetime(2023, 2, 20, 16, 0, 13, 123000)),
+    ("2023-02-20T16:00:13.1234567", datetime(2023, 2, 20, 16, 0, 13, 123456)),
+    ("20230220T160013", datetime(2023, 2, 20, 16, 0, 13)),
+    ("2023-02-20T16:00", datetime(2023, 2, 20, 16)),
+    ("2023-02-20T18:00+02:00", datetime(2023, 2, 20, 18, tzinfo=PLUS_TWO)),
+    ("2023-02-20T18:00:00+0200", datetime(2023, 2, 20, 18, tzinfo=PLUS_TWO)),
+    ("2023-02-20T18:00:00+02", datetime(2023, 2, 20, 18, tzinfo=PLUS_TWO)),
+]
+
+
+@pytest.mark.parametrize("value, expected", TIMESTAMPS)
+def test_parse_datetime(value, expected):
+    # Kitsu's trailing Z is stripped before parsing, giving a naive result
+    assert parse_datetime(value) == expected
+    assert parse_datetime(value + "Z" if not expected.tzinfo else value) == expected
+
+
+@pytest.mark.parametrize("value, expected", TIMESTAMPS)
+def test_fallback_without_fromisoformat(value, expected):
+    # What parse_datetime reads on Python < 3.11
+    assert _parse_iso_8601(value) == expected
+    if "T" in value and not expected.tzinfo:
+        assert _parse_iso_8601(value + "Z") == expected
+
+
+@pytest.mark.parametrize("value", [None, "", "yesterday", "2023-13-01", "2023-02-30"])
+def test_malformed(value):
+    assert parse_datetime(value) is None
+    if value is not None:
+        assert _parse_iso_8601(value) is None
+
+
+def test_parse_since():
+    assert parse_since("2023-02-20T18:00:00.5+0200") == datetime(
+        2023, 2, 20, 16, 0, 0, 500000
+    )
+    with pytest.raises(InvalidArgument):
+        parse_since("last week")